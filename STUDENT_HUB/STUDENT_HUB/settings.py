@@ -42,6 +42,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First so its timings cover the rest of the stack
+    'student.instrumentation.RequestInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -53,17 +55,26 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'STUDENT_HUB.urls'
 
+TEMPLATE_LOADERS = [
+    'student.instrumentation.InstrumentedFilesystemLoader',
+    'student.instrumentation.InstrumentedAppDirectoriesLoader',
+]
+
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates that reports render time to the instrumentation middleware
+        'BACKEND': 'student.instrumentation.InstrumentedDjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'student.context_processors.fragment_versions',
             ],
+            # Loaders that time each template; outside DEBUG the cached loader keeps
+            # compiled templates in memory instead of re-reading and re-parsing them
+            'loaders': TEMPLATE_LOADERS if DEBUG else [('student.instrumentation.InstrumentedCachedLoader', TEMPLATE_LOADERS)],
         },
     },
 ]
@@ -124,6 +135,60 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),
 ]
+# `manage.py collectstatic && manage.py compress_static` builds it for production
+STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    # Content-hashed file names outside DEBUG, so bundles can be cached for a year
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+        else 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage',
+    },
+}
+
+# Serve STATIC_ROOT (precompressed, far-future cache headers) from Django when
+# no web server sits in front of it (student/static_assets.py)
+SERVE_STATIC_FILES = not DEBUG
+STATIC_PRECOMPRESS_MIN_BYTES = 256
+
+# Uploaded documents (content-addressed under blobs/, see student/storage.py; older
+# uploads under certificates/ and results/) and generated reports (reports/)
+MEDIA_ROOT = BASE_DIR
+
+# Background PDF reports (student/jobs.py, `manage.py run_report_worker`)
+REPORT_WORKER_CONCURRENCY = 2
+REPORT_JOB_MAX_ACTIVE_PER_USER = 3
+REPORT_JOB_REUSE_SECONDS = 120
+# Finished/failed jobs and their PDFs are deleted this long after they finish
+REPORT_JOB_RETENTION_HOURS = 24
+
+# Content-addressed cache for CV/profile PDFs (student/pdf_cache.py)
+PDF_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'pdf')
+PDF_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Caches. 'default' is per-process local memory; point it (or SUMMARY_CACHE_ALIAS)
+# at a shared backend such as FileBasedCache, DatabaseCache or Redis when running
+# several worker processes, so invalidations reach every process.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'student-hub',
+    },
+}
+
+# Per-student dashboard summaries (student/summary_cache.py)
+SUMMARY_CACHE_ALIAS = 'default'
+SUMMARY_CACHE_TIMEOUT = 600
+
+# {% cache %} lifetime of navbar and stat-card fragments (student/context_processors.py).
+# Their keys carry the account's version, which every relevant save bumps and which
+# is re-seeded with a new value if evicted, so this bounds memory use, not staleness
+FRAGMENT_CACHE_TIMEOUT = 600
+
+# Per-view query/latency metrics (student/instrumentation.py), served at /metrics/requests/
+REQUEST_INSTRUMENTATION = True
+SLOW_REQUEST_MS = 500
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
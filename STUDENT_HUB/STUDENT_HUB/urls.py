@@ -14,10 +14,16 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path,include
+from django.urls import path,include,re_path
+
+from student.static_assets import serve_static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('student.urls')),
 ]
+
+if settings.SERVE_STATIC_FILES:
+    urlpatterns += [re_path(rf"^{settings.STATIC_URL.strip('/')}/(?P<path>.*)$", serve_static)]
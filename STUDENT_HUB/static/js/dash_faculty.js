@@ -0,0 +1,28 @@
+    // Get the generate report button and modal
+    const generateReportBtn = document.getElementById('generateReportBtn');
+    const modal = document.getElementById('successModal');
+
+    // Add click event listener to the Generate Report button
+    generateReportBtn.addEventListener('click', function() {
+      // Show the modal
+      modal.classList.add('show');
+    });
+
+    // Function to close the modal
+    function closeModal() {
+      modal.classList.remove('show');
+    }
+
+    // Close modal when clicking outside of it
+    modal.addEventListener('click', function(e) {
+      if (e.target === modal) {
+        closeModal();
+      }
+    });
+
+    // Close modal with Escape key
+    document.addEventListener('keydown', function(e) {
+      if (e.key === 'Escape' && modal.classList.contains('show')) {
+        closeModal();
+      }
+    });
@@ -0,0 +1,24 @@
+    // --- SCRIPT FOR APPROVE MODAL ---
+    function openApproveModal(activityPk, modelType, proposedCredits) {
+      document.getElementById('approve_activity_pk').value = activityPk;
+      document.getElementById('approve_model_type').value = modelType;
+      // Pre-fill with proposed credits, or a default like 10 if none proposed
+      document.getElementById('approve_credit_points').value = proposedCredits > 0 ? proposedCredits : 10;
+      document.getElementById("approveModal").classList.add("show");
+    }
+    function closeApproveModal() {
+      document.getElementById("approveModal").classList.remove("show");
+    }
+
+    // --- SCRIPT FOR REJECT MODAL ---
+    function openRejectModal(activityPk, modelType) {
+      document.getElementById('reject_activity_pk').value = activityPk;
+      document.getElementById('reject_model_type').value = modelType;
+      document.getElementById("rejectModal").classList.add("show");
+    }
+    function closeRejectModal() {
+      document.getElementById("rejectModal").classList.remove("show");
+    }
+    document.getElementById("selectAll").addEventListener("change", function () {
+      document.querySelectorAll(".bulk-select").forEach(box => { box.checked = this.checked; });
+    });
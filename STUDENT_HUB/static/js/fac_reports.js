@@ -0,0 +1,12 @@
+    function showSuccess(message) {
+      document.getElementById("successMessage").innerText = message;
+      document.getElementById("popupOverlay").style.display = "block";
+      document.getElementById("successPopup").style.display = "block";
+    }
+    function closeSuccess() {
+      document.getElementById("popupOverlay").style.display = "none";
+      document.getElementById("successPopup").style.display = "none";
+    }
+    
+    // Close popup when clicking overlay
+    document.getElementById("popupOverlay").addEventListener('click', closeSuccess);
@@ -0,0 +1,83 @@
+    // Keep your original JS intact
+    function createGlitter() {
+      const glitterContainer = document.getElementById('glitterContainer');
+      function addGlitter() {
+        const glitter = document.createElement('div');
+        glitter.className = 'glitter';
+        const size = Math.random() * 4 + 2;
+        glitter.style.width = size + 'px';
+        glitter.style.height = size + 'px';
+        glitter.style.left = Math.random() * 100 + '%';
+        const duration = Math.random() * 4 + 3;
+        glitter.style.animationDuration = duration + 's';
+        glitter.style.animationDelay = Math.random() * 2 + 's';
+        glitterContainer.appendChild(glitter);
+        setTimeout(() => { if (glitter.parentNode) glitter.remove(); }, (duration + 2) * 1000);
+      }
+      setInterval(addGlitter, 150);
+      for (let i = 0; i < 15; i++) setTimeout(addGlitter, i * 100);
+    }
+
+    function createParticles() {
+      const particlesContainer = document.getElementById('particles');
+      const particleCount = 20;
+      for (let i = 0; i < particleCount; i++) {
+        const particle = document.createElement('div');
+        particle.className = 'particle';
+        particle.style.left = Math.random() * 100 + '%';
+        particle.style.top = Math.random() * 100 + '%';
+        particle.style.animationDelay = Math.random() * 6 + 's';
+        particle.style.animationDuration = (Math.random() * 3 + 3) + 's';
+        particlesContainer.appendChild(particle);
+      }
+    }
+
+    function addRippleEffect(event) {
+      const formGroup = event.target.closest('.form-group');
+      const rect = formGroup.getBoundingClientRect();
+      const ripple = document.createElement('span');
+      const size = 60;
+      const x = event.clientX - rect.left - size / 2;
+      const y = event.clientY - rect.top - size / 2;
+      ripple.style.width = ripple.style.height = size + 'px';
+      ripple.style.left = x + 'px';
+      ripple.style.top = y + 'px';
+      ripple.classList.add('ripple');
+      formGroup.appendChild(ripple);
+      setTimeout(() => { ripple.remove(); }, 600);
+    }
+
+    document.addEventListener('DOMContentLoaded', function() {
+      createParticles();
+      createGlitter();
+      const inputs = document.querySelectorAll('input');
+      inputs.forEach(input => {
+        input.addEventListener('mousedown', addRippleEffect);
+      });
+      document.getElementById('loginForm').addEventListener('submit', function(e) {
+        e.preventDefault();
+        const btn = document.getElementById('loginBtn');
+        btn.classList.add('loading');
+        btn.textContent = '';
+        setTimeout(() => {
+          this.submit(); // Submit the form to the server
+        }, 500);
+      });
+      // Add this inside your DOMContentLoaded event listener
+const passwordInput = document.getElementById('password');
+const passwordToggle = document.getElementById('passwordToggle');
+const eyeIcon = passwordToggle.querySelector('.eye-icon');
+
+passwordToggle.addEventListener('click', function() {
+  if (passwordInput.type === 'password') {
+    passwordInput.type = 'text';
+    eyeIcon.textContent = '🙈';
+    passwordToggle.classList.add('active');
+  } else {
+    passwordInput.type = 'password';
+    eyeIcon.textContent = '👁';
+    passwordToggle.classList.remove('active');
+  }
+});
+
+    });
@@ -0,0 +1,229 @@
+        // Create continuous blue glitter effect
+        function createGlitter() {
+            const glitterContainer = document.getElementById('glitterContainer');
+            
+            function addGlitter() {
+                const glitter = document.createElement('div');
+                glitter.className = 'glitter';
+                
+                // Random size between 2px and 6px
+                const size = Math.random() * 4 + 2;
+                glitter.style.width = size + 'px';
+                glitter.style.height = size + 'px';
+                
+                // Random horizontal position
+                glitter.style.left = Math.random() * 100 + '%';
+                
+                // Random animation duration between 3s and 7s
+                const duration = Math.random() * 4 + 3;
+                glitter.style.animationDuration = duration + 's';
+                
+                // Random delay
+                glitter.style.animationDelay = Math.random() * 2 + 's';
+                
+                glitterContainer.appendChild(glitter);
+                
+                // Remove glitter after animation
+                setTimeout(() => {
+                    if (glitter.parentNode) {
+                        glitter.remove();
+                    }
+                }, (duration + 2) * 1000);
+            }
+            
+            // Add glitter continuously
+            setInterval(addGlitter, 150);
+            
+            // Initial burst
+            for (let i = 0; i < 15; i++) {
+                setTimeout(addGlitter, i * 100);
+            }
+        }
+
+        // Enhanced animations and interactions
+        function selectRole(role) {
+            // Show loading animation
+            const transition = document.getElementById('pageTransition');
+            const successMessage = document.getElementById('successMessage');
+            const successTitle = document.getElementById('successTitle');
+            const successText = document.getElementById('successText');
+            
+            transition.classList.add('active');
+
+            // Add ripple effect
+            const cards = document.querySelectorAll('.selection-card');
+            cards.forEach(card => {
+                card.style.transform = 'scale(0.95)';
+                card.style.opacity = '0.7';
+            });
+
+            // Customize success message based on role
+            /* if (role === 'student') {
+                successTitle.textContent = '🎓 Welcome Student!';
+                successText.innerHTML = `
+                    Redirecting to your personalized dashboard...<br><br>
+                    <strong>✨ Features waiting for you:</strong><br>
+                    • Course Materials & Resources<br>
+                    • Assignment Tracker<br>
+                    • Study Groups & Collaboration<br>
+                    • Progress Analytics & Insights
+                `;
+            } else {
+                successTitle.textContent = '👨‍🏫 Welcome Faculty!';
+                successText.innerHTML = `
+                    Redirecting to your teaching portal...<br><br>
+                    <strong>✨ Tools at your disposal:</strong><br>
+                    • Course Management System<br>
+                    • Student Analytics & Reports<br>
+                    • Assignment Creation Tools<br>
+                    • Communication Hub
+                `;
+            } */
+
+            // Show success message after loading
+            setTimeout(() => {
+                transition.classList.remove('active');
+                successMessage.classList.add('show');
+                
+                // Hide success message and reset after delay
+                setTimeout(() => {
+                    successMessage.classList.remove('show');
+                    
+                    // Reset cards
+                    cards.forEach(card => {
+                        card.style.transform = '';
+                        card.style.opacity = '';
+                    });
+                }, 4000);
+            }, 2000);
+        }
+
+        // Add particle effects on mouse move
+        document.addEventListener('mousemove', (e) => {
+            const shapes = document.querySelectorAll('.floating-shape');
+            const mouseX = e.clientX / window.innerWidth;
+            const mouseY = e.clientY / window.innerHeight;
+
+            shapes.forEach((shape, index) => {
+                const speed = (index + 1) * 0.5;
+                const x = mouseX * speed * 20;
+                const y = mouseY * speed * 20;
+                shape.style.transform = `translate(${x}px, ${y}px) rotate(${x}deg)`;
+            });
+        });
+
+        // Enhanced card interactions
+        const cards = document.querySelectorAll('.selection-card');
+        
+        cards.forEach(card => {
+            card.addEventListener('mouseenter', () => {
+                // Create floating particles on hover
+                createFloatingParticles(card);
+            });
+
+            card.addEventListener('mouseleave', () => {
+                // Remove particles
+                const particles = card.querySelectorAll('.hover-particle');
+                particles.forEach(particle => {
+                    particle.remove();
+                });
+            });
+        });
+
+        function createFloatingParticles(card) {
+            for (let i = 0; i < 5; i++) {
+                setTimeout(() => {
+                    const particle = document.createElement('div');
+                    particle.classList.add('hover-particle');
+                    particle.style.cssText = `
+                        position: absolute;
+                        width: 6px;
+                        height: 6px;
+                        background: rgba(255, 255, 255, 0.8);
+                        border-radius: 50%;
+                        pointer-events: none;
+                        animation: particleFloat 2s ease-out forwards;
+                        left: ${Math.random() * 100}%;
+                        top: ${Math.random() * 100}%;
+                        box-shadow: 0 0 8px rgba(66, 165, 245, 0.6);
+                    `;
+                    
+                    card.appendChild(particle);
+                    
+                    setTimeout(() => {
+                        if (particle.parentNode) {
+                            particle.remove();
+                        }
+                    }, 2000);
+                }, i * 100);
+            }
+        }
+
+        // Keyboard navigation
+        document.addEventListener('keydown', (e) => {
+            if (e.key === 'ArrowLeft' || e.key === 'ArrowRight') {
+                const cards = document.querySelectorAll('.selection-card');
+                const focused = document.activeElement;
+                const currentIndex = Array.from(cards).indexOf(focused);
+                
+                let nextIndex;
+                if (e.key === 'ArrowLeft') {
+                    nextIndex = currentIndex > 0 ? currentIndex - 1 : cards.length - 1;
+                } else {
+                    nextIndex = currentIndex < cards.length - 1 ? currentIndex + 1 : 0;
+                }
+                
+                cards[nextIndex].focus();
+            }
+            
+            if (e.key === 'Enter' && document.activeElement.classList.contains('selection-card')) {
+                const button = document.activeElement.querySelector('.card-button');
+                button.click();
+            }
+        });
+
+        // Make cards focusable and add focus styles
+        cards.forEach(card => {
+            card.style.outline = 'none';
+            
+            card.addEventListener('focus', () => {
+                card.style.transform = 'translateY(-5px) scale(1.02)';
+                card.style.boxShadow = '0 15px 45px rgba(25, 118, 210, 0.4), 0 0 0 3px rgba(66, 165, 245, 0.5)';
+            });
+            
+            card.addEventListener('blur', () => {
+                card.style.transform = '';
+                card.style.boxShadow = '';
+            });
+        });
+
+        // Initialize page
+        window.addEventListener('load', () => {
+            console.log('🎓 Smart Student Hub loaded successfully!');
+            
+            // Start glitter animation
+            createGlitter();
+            
+            // Add entrance animations with staggered delays
+            const header = document.querySelector('.header');
+            const cards = document.querySelectorAll('.selection-card');
+            
+            header.style.animationDelay = '0.2s';
+            cards.forEach((card, index) => {
+                card.style.animationDelay = `${0.4 + index * 0.1}s`;
+            });
+
+            // Add welcome pulse effect to logo
+            const logo = document.querySelector('.logo');
+            setTimeout(() => {
+                logo.style.animation = 'pulse 2s infinite, slideInDown 1s ease-out';
+            }, 1000);
+        });
+
+        // Performance optimization - reduce animations on low-end devices
+        if (navigator.hardwareConcurrency <= 2) {
+            document.querySelector('.glitter-container').style.display = 'none';
+            document.querySelectorAll('.floating-shape').forEach(shape => {
+                shape.style.animation = 'none';
+            });
+        }
@@ -0,0 +1,6 @@
+    const markAll = document.getElementById("markAll");
+    if (markAll) {
+      markAll.addEventListener("change", function () {
+        document.querySelectorAll(".present-box").forEach(box => { box.checked = markAll.checked; });
+      });
+    }
@@ -0,0 +1,69 @@
+  function toggleSidebar() {
+    const sidebar = document.getElementById("sidebar");
+    const overlay = document.getElementById("sidebarOverlay");
+    
+    sidebar.classList.toggle("active");
+    overlay.classList.toggle("active");
+  }
+
+  function closeSidebar() {
+    const sidebar = document.getElementById("sidebar");
+    const overlay = document.getElementById("sidebarOverlay");
+    
+    sidebar.classList.remove("active");
+    overlay.classList.remove("active");
+  }
+
+  function setActive(element) {
+    // Remove active class from all menu items
+    const menuItems = document.querySelectorAll('.sidebar ul li a');
+    menuItems.forEach(item => item.classList.remove('active'));
+    
+    // Add active class to clicked item
+    element.classList.add('active');
+    
+    // Close sidebar on mobile after selection
+    if (window.innerWidth <= 768) {
+      closeSidebar();
+    }
+  }
+
+  // ✅ FIX: Detect active page by href instead of text
+  function setActivePageOnLoad() {
+    const currentPage = window.location.pathname.split('/').pop();
+    const menuItems = document.querySelectorAll('.sidebar ul li a');
+
+    // Remove active class first
+    menuItems.forEach(item => item.classList.remove('active'));
+
+    // Match current page with href
+    menuItems.forEach(item => {
+      if (item.getAttribute('href') === currentPage) {
+        item.classList.add('active');
+      }
+    });
+  }
+
+  // Initialize active page on load
+  document.addEventListener('DOMContentLoaded', setActivePageOnLoad);
+
+  // Settings function
+  function openSettings() {
+    alert('Opening Settings...');
+    closeSidebar();
+  }
+
+  // Close sidebar when clicking outside
+  document.addEventListener('click', function(event) {
+    const sidebar = document.getElementById("sidebar");
+    const hamburger = document.querySelector(".hamburger");
+    
+    if (sidebar.classList.contains('active') && 
+        !sidebar.contains(event.target) && 
+        !hamburger.contains(event.target)) {
+      closeSidebar();
+    }
+  });
+
+  // Example of dynamic name update
+  document.getElementById("username").innerText = "Alexa steve Smith";
@@ -0,0 +1,91 @@
+    function toggleSidebar() {
+      const sidebar = document.getElementById("sidebar");
+      const overlay = document.getElementById("sidebarOverlay");
+      
+      sidebar.classList.toggle("active");
+      overlay.classList.toggle("active");
+    }
+
+    function closeSidebar() {
+      const sidebar = document.getElementById("sidebar");
+      const overlay = document.getElementById("sidebarOverlay");
+      
+      sidebar.classList.remove("active");
+      overlay.classList.remove("active");
+    }
+
+    function setActive(element) {
+      // Remove active class from all menu items
+      const menuItems = document.querySelectorAll('.sidebar ul li a');
+      menuItems.forEach(item => item.classList.remove('active'));
+      
+      // Add active class to clicked item
+      element.classList.add('active');
+      
+      // Store the active page in localStorage for persistence
+      localStorage.setItem('activePage', element.textContent);
+      
+      // Close sidebar on mobile after selection
+      if (window.innerWidth <= 768) {
+        closeSidebar();
+      }
+    }
+
+    // Settings function
+    function openSettings() {
+      alert('Opening Settings...');
+      closeSidebar();
+    }
+
+    /* function setActivePageOnLoad() {
+      const currentPage = window.location.pathname.split('/').pop();
+      const menuItems = document.querySelectorAll('.sidebar ul li a');
+      
+      menuItems.forEach(item => item.classList.remove('active'));
+      
+      const pageMap = {
+        'dashboard.html': 'Dashboard',
+        'scorecards.html': 'Scorecards', 
+        'activities.html': 'My Activities',
+        'results.html': 'Results'
+      };
+    
+      const activePage = pageMap[currentPage] || 'Dashboard';
+      
+      menuItems.forEach(item => {
+        if (item.textContent.trim() === activePage) {
+          item.classList.add('active');
+        }
+      });
+    } */
+      function setActivePageOnLoad() {
+    const currentPage = window.location.pathname.split('/').pop();
+    const menuItems = document.querySelectorAll('.sidebar ul li a');
+
+    // Remove active class first
+    menuItems.forEach(item => item.classList.remove('active'));
+
+    // Match current page with href
+    menuItems.forEach(item => {
+      if (item.getAttribute('href') === currentPage) {
+        item.classList.add('active');
+      }
+    });
+  }
+
+
+    // Initialize active page on load
+    document.addEventListener('DOMContentLoaded', setActivePageOnLoad);
+
+    // Close sidebar when clicking outside
+    document.addEventListener('click', function(event) {
+      const sidebar = document.getElementById("sidebar");
+      const hamburger = document.querySelector(".hamburger");
+      
+      // Only close if sidebar is open and click is not on hamburger or inside sidebar
+      if (sidebar.classList.contains('active') && 
+          !sidebar.contains(event.target) && 
+          !hamburger.contains(event.target)) {
+        closeSidebar();
+      }
+    });
@@ -0,0 +1,105 @@
+    // Form validation
+    function validateForm() {
+      const fields = [
+        { id: "firstName", name: "First Name" },
+        { id: "lastName", name: "Last Name" },
+        { id: "email", name: "Email" },
+        { id: "password", name: "Password" },
+        { id: "dateOfBirth", name: "Date of Birth" },
+        { id: "gender", name: "Gender" },
+        { id: "rollNo", name: "Roll No" },
+        { id: "contact", name: "Contact" },
+        { id: "branch", name: "Branch" },
+        { id: "session", name: "Session" },
+        { id: "collegeName", name: "College Name" },
+        { id: "city", name: "City" },
+        { id: "state", name: "State" }
+      ];
+
+      let isValid = true;
+      let firstInvalidField = null;
+
+      // Reset all field states
+      fields.forEach(field => {
+        const input = document.getElementById(field.id);
+        const formGroup = input.parentElement.closest('.form-group');
+        formGroup.classList.remove('error', 'success');
+      });
+
+      // Validate fields
+      // Real-time validation
+      document.addEventListener('DOMContentLoaded', function() {
+        document.querySelectorAll('input, select').forEach(element => {
+          element.addEventListener('blur', function() {
+            const formGroup = this.parentElement.closest('.form-group');
+            if (this.value.trim()) {
+              formGroup.classList.remove('error');
+              formGroup.classList.add('success');
+            }
+          });
+        });
+        // Session input formatting
+        document.getElementById('session').addEventListener('input', function() {
+          let value = this.value.replace(/[^0-9-]/g, '');
+          if (value.length === 4 && !value.includes('-')) {
+            value += '-';
+          }
+          this.value = value;
+        });
+      });
+        const checkmark = document.getElementById('successCheckmark');
+        checkmark.classList.add('show');
+        
+        button.textContent = 'Registration Successful!';
+        button.style.background = 'linear-gradient(135deg, #10b981, #059669)';
+        
+        alert('Student registered successfully!');
+        
+        // Reset form after success
+        setTimeout(() => {
+          checkmark.classList.remove('show');
+          document.getElementById('studentRegistrationForm').reset();
+          
+          // Remove success states
+          document.querySelectorAll('.form-group').forEach(group => {
+            group.classList.remove('success', 'error');
+          });
+          
+          button.textContent = originalText;
+          button.style.background = '';
+        }, 3000);
+      }, 2000);
+    }
+
+    // Handle login link click
+    function handleLogin() {
+      alert('Redirecting to login page...');
+      // Here you would typically redirect to your login page
+      // window.location.href = '/login';
+    }
+
+    // Event listeners
+    document.addEventListener('DOMContentLoaded', function() {
+      // Form submission
+      document.getElementById('studentRegistrationForm').addEventListener('submit', handleRegistration);
+
+      // Real-time validation
+      document.querySelectorAll('input, select').forEach(element => {
+        element.addEventListener('blur', function() {
+          const formGroup = this.parentElement.closest('.form-group');
+          if (this.value.trim()) {
+            formGroup.classList.remove('error');
+            formGroup.classList.add('success');
+          }
+        });
+      });
+
+      // Session input formatting
+      document.getElementById('session').addEventListener('input', function() {
+        let value = this.value.replace(/[^0-9-]/g, '');
+        if (value.length === 4 && !value.includes('-')) {
+          value += '-';
+        }
+        this.value = value;
+      });
+    });
@@ -0,0 +1,13 @@
+  function showPopup() {
+    document.getElementById("popup").style.display = "flex";
+  }
+  function closePopup() {
+    document.getElementById("popup").style.display = "none";
+  }
+  
+  // Close popup when clicking overlay
+  document.getElementById("popup").addEventListener('click', function(e) {
+    if (e.target === this) {
+      closePopup();
+    }
+  });
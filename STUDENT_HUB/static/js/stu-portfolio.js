@@ -0,0 +1,67 @@
+        function showPortfolioPopup(action) {
+            const popupMessage = document.getElementById('popupMessage');
+            
+            switch(action) {
+                case 'download':
+                    popupMessage.textContent = 'Portfolio PDF is being generated and will download shortly.';
+                    break;
+                case 'share':
+                    popupMessage.textContent = 'Portfolio sharing link has been copied to clipboard!';
+                    break;
+                case 'preview':
+                    popupMessage.textContent = 'Opening portfolio preview in a new window...';
+                    break;
+                default:
+                    popupMessage.textContent = 'Action completed successfully!';
+            }
+            
+            document.getElementById("portfolioSuccessPopup").style.display = "flex";
+        }
+
+        function openCVModal() {
+            document.getElementById("cvModal").style.display = "block";
+            document.body.style.overflow = "hidden"; // Prevent background scrolling
+        }
+
+        function closeCVModal() {
+            document.getElementById("cvModal").style.display = "none";
+            document.body.style.overflow = "auto"; // Restore scrolling
+        }
+
+        function editCV() {
+            alert("CV Edit functionality will be implemented with backend integration. This will allow you to modify CV content, add/remove sections, and update personal information.");
+        }
+
+        function saveCV() {
+            alert("CV saved successfully! The CV data will be sent to the backend for processing and storage.");
+        }
+
+        document.addEventListener("DOMContentLoaded", function () {
+            const portfolioOkBtn = document.getElementById("portfolioOkBtn");
+            if (portfolioOkBtn) {
+                portfolioOkBtn.addEventListener("click", function () {
+                    document.getElementById("portfolioSuccessPopup").style.display = "none";
+                });
+            }
+        });
+
+        // Close popup when clicking outside
+        document.getElementById("portfolioSuccessPopup").addEventListener("click", function(e) {
+            if (e.target === this) {
+                this.style.display = "none";
+            }
+        });
+
+        // Close CV modal when clicking outside
+        document.getElementById("cvModal").addEventListener("click", function(e) {
+            if (e.target === this) {
+                closeCVModal();
+            }
+        });
+
+        // Close CV modal with Escape key
+        document.addEventListener("keydown", function(e) {
+            if (e.key === "Escape" && document.getElementById("cvModal").style.display === "block") {
+                closeCVModal();
+            }
+        });
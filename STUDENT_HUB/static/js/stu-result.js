@@ -0,0 +1,40 @@
+  function openModal() {
+    document.getElementById('modalOverlay').classList.add('active');
+  }
+
+  function closeModal() {
+    document.getElementById('modalOverlay').classList.remove('active');
+  }
+
+  // Close modal when clicking outside
+  document.getElementById('modalOverlay').addEventListener('click', function(e) {
+    if (e.target === this) {
+      closeModal();
+    }
+  });
+
+  // Close modal with Escape key
+  document.addEventListener('keydown', function(e) {
+    if (e.key === 'Escape') {
+      closeModal();
+    }
+  });
+  // Add these functions inside your <script> tag
+
+  function handleFileSelect(event) {
+    const file = event.target.files[0];
+    if (file) {
+      document.getElementById('fileUploadWrapper').classList.add('has-file');
+      document.getElementById('fileUploadText').textContent = file.name;
+      document.getElementById('removeFileBtn').classList.add('show');
+    }
+  }
+
+  function removeFile() {
+    const fileInput = document.getElementById('resultDocument');
+    fileInput.value = ''; // Clear the selected file
+
+    document.getElementById('fileUploadWrapper').classList.remove('has-file');
+    document.getElementById('fileUploadText').textContent = 'No file chosen';
+    document.getElementById('removeFileBtn').classList.remove('show');
+  }
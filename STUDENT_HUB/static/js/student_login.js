@@ -0,0 +1,127 @@
+    // Create continuous blue glitter effect - same as first.html
+    function createGlitter() {
+      const glitterContainer = document.getElementById('glitterContainer');
+      
+      function addGlitter() {
+        const glitter = document.createElement('div');
+        glitter.className = 'glitter';
+        
+        // Random size between 2px and 6px
+        const size = Math.random() * 4 + 2;
+        glitter.style.width = size + 'px';
+        glitter.style.height = size + 'px';
+        
+        // Random horizontal position
+        glitter.style.left = Math.random() * 100 + '%';
+        
+        // Random animation duration between 3s and 7s
+        const duration = Math.random() * 4 + 3;
+        glitter.style.animationDuration = duration + 's';
+        
+        // Random delay
+        glitter.style.animationDelay = Math.random() * 2 + 's';
+        
+        glitterContainer.appendChild(glitter);
+        
+        // Remove glitter after animation
+        setTimeout(() => {
+          if (glitter.parentNode) {
+            glitter.remove();
+          }
+        }, (duration + 2) * 1000);
+      }
+      
+      // Add glitter continuously
+      setInterval(addGlitter, 150);
+      
+      // Initial burst
+      for (let i = 0; i < 15; i++) {
+        setTimeout(addGlitter, i * 100);
+      }
+    }
+
+    // Create animated particles
+    function createParticles() {
+      const particlesContainer = document.getElementById('particles');
+      const particleCount = 20;
+
+      for (let i = 0; i < particleCount; i++) {
+        const particle = document.createElement('div');
+        particle.className = 'particle';
+        particle.style.left = Math.random() * 100 + '%';
+        particle.style.top = Math.random() * 100 + '%';
+        particle.style.animationDelay = Math.random() * 6 + 's';
+        particle.style.animationDuration = (Math.random() * 3 + 3) + 's';
+        particlesContainer.appendChild(particle);
+      }
+    }
+
+    // Add ripple effect to form inputs
+    function addRippleEffect(event) {
+      const formGroup = event.target.closest('.form-group');
+      const rect = formGroup.getBoundingClientRect();
+      const ripple = document.createElement('span');
+      const size = 60;
+      const x = event.clientX - rect.left - size / 2;
+      const y = event.clientY - rect.top - size / 2;
+
+      ripple.style.width = ripple.style.height = size + 'px';
+      ripple.style.left = x + 'px';
+      ripple.style.top = y + 'px';
+      ripple.classList.add('ripple');
+
+      formGroup.appendChild(ripple);
+
+      setTimeout(() => {
+        ripple.remove();
+      }, 600);
+    }
+
+    // Initialize effects
+    document.addEventListener('DOMContentLoaded', function() {
+      createParticles();
+      createGlitter(); // Initialize the blue glitter effect
+      
+      // Add ripple effect to inputs
+      const inputs = document.querySelectorAll('input');
+      inputs.forEach(input => {
+        input.addEventListener('mousedown', addRippleEffect);
+      });
+
+      // Form submission with loading effect
+      document.getElementById('loginForm').addEventListener('submit', function(e) {
+        e.preventDefault(); // Keep this to allow the animation to start
+        const btn = document.getElementById('loginBtn');
+        btn.classList.add('loading');
+        btn.textContent = '';
+
+        // Submit the form after a short delay so the animation is visible
+        setTimeout(() => {
+          this.submit(); // This line sends the form to your Django view
+        }, 500);
+      });
+      const passwordInput = document.getElementById('password');
+const passwordToggle = document.getElementById('passwordToggle');
+const eyeIcon = passwordToggle.querySelector('.eye-icon');
+
+passwordToggle.addEventListener('click', function() {
+  if (passwordInput.type === 'password') {
+    passwordInput.type = 'text';
+    eyeIcon.textContent = '🙈';
+    passwordToggle.classList.add('active');
+  } else {
+    passwordInput.type = 'password';
+    eyeIcon.textContent = '👁';
+    passwordToggle.classList.remove('active');
+  }
+});
+
+    });
+
+    // Performance optimization - reduce animations on low-end devices
+    if (navigator.hardwareConcurrency <= 2) {
+      document.querySelector('.glitter-container').style.display = 'none';
+      document.querySelectorAll('.particle').forEach(particle => {
+        particle.style.animation = 'none';
+      });
+    }
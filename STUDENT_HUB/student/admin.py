@@ -1,9 +1,26 @@
 from django.contrib import admin
-from .models import Student , Faculty , Certificate , Projects , Activities , Results
+from .models import Student , Faculty , Certificate , Projects , Activities , Results , CreditLedger , Submission
 # Register your models here.
 admin.site.register(Student)
 admin.site.register(Faculty)
 admin.site.register(Projects)
 admin.site.register(Certificate)
 admin.site.register(Activities)
-admin.site.register(Results)
\ No newline at end of file
+admin.site.register(Results)
+admin.site.register(Submission)
+
+
+@admin.register(CreditLedger)
+class CreditLedgerAdmin(admin.ModelAdmin):
+    # Derived from the item tables (student/ledger.py); fix drift with `manage.py rebuild_credit_ledger`
+    list_display = ('student', 'category', 'approved_count', 'pending_count', 'credit_total', 'updated_at')
+    list_filter = ('category',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
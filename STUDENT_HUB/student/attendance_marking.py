@@ -0,0 +1,141 @@
+# student/attendance_marking.py
+"""
+Bulk attendance writes.
+
+A lecture's roster (or a whole semester from CSV) is written with
+bulk_create(update_conflicts=True) on the (student, subject, date) unique key,
+so re-marking a session overwrites the earlier status instead of failing.
+Lookups are done once per chunk, never per row, and the monthly rollups are
+refreshed for the keys that were written.
+"""
+import csv
+
+from django.db import transaction
+from django.utils.dateparse import parse_date
+
+from . import summary_cache
+from .attendance_rollups import month_start, refresh_monthly
+from .models import Attendance, Student, Subject
+
+CSV_CHUNK_SIZE = 5000
+WRITE_BATCH_SIZE = 1000
+
+STATUS_ALIASES = {
+    'present': 'Present', 'p': 'Present', '1': 'Present', 'true': 'Present', 'yes': 'Present',
+    'absent': 'Absent', 'a': 'Absent', '0': 'Absent', 'false': 'Absent', 'no': 'Absent',
+}
+
+
+class AttendanceImportError(Exception):
+    """Raised with a list of row-level problems; nothing is written."""
+
+    def __init__(self, errors):
+        super().__init__(f"{len(errors)} invalid row(s)")
+        self.errors = errors
+
+
+def normalize_status(value):
+    return STATUS_ALIASES.get(str(value or '').strip().lower())
+
+
+def _write(records):
+    """Upsert Attendance objects and refresh the rollups they touch. Returns the row count."""
+    # A key may only appear once per INSERT ... ON CONFLICT statement; the last row wins
+    records = list({(r.student_id, r.subject_id, r.date): r for r in records}.values())
+    Attendance.objects.bulk_create(
+        records,
+        batch_size=WRITE_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['student', 'subject', 'date'],
+        update_fields=['status'],
+    )
+    refresh_monthly({(r.student_id, r.subject_id, month_start(r.date)) for r in records})
+    students = {r.student_id for r in records}
+    transaction.on_commit(lambda: summary_cache.invalidate_students(students))
+    return len(records)
+
+
+def mark_session(faculty, subject, day, statuses):
+    """
+    Record one class session. `statuses` maps student email -> 'Present'/'Absent';
+    only students in the faculty's department are accepted.
+    Returns the number of rows written.
+    """
+    allowed = set(
+        Student.objects.filter(branch=faculty.department, email__in=list(statuses)).values_list('email', flat=True)
+    )
+    unknown = sorted(set(statuses) - allowed)
+    if unknown:
+        raise AttendanceImportError([f"Student not in your department: {email}" for email in unknown])
+
+    records = []
+    errors = []
+    for email, status in statuses.items():
+        normalized = normalize_status(status)
+        if normalized is None:
+            errors.append(f"Invalid status for {email}: {status!r}")
+            continue
+        records.append(Attendance(student_id=email, subject=subject, date=day, status=normalized))
+    if errors:
+        raise AttendanceImportError(errors)
+
+    with transaction.atomic():
+        return _write(records)
+
+
+def import_csv(faculty, fileobj):
+    """
+    Back-fill attendance from a text-mode CSV file with the columns email, subject_code, date
+    (YYYY-MM-DD) and status. Subjects must belong to `faculty` and students to
+    the faculty's department. All rows are written in a single transaction, or
+    none if any row is invalid. Returns the number of rows written.
+    """
+    reader = csv.DictReader(fileobj)
+    missing = {'email', 'subject_code', 'date', 'status'} - set(reader.fieldnames or [])
+    if missing:
+        raise AttendanceImportError([f"Missing column(s): {', '.join(sorted(missing))}"])
+
+    subjects = {subject.subject_code: subject.pk for subject in Subject.objects.filter(faculty=faculty)}
+    errors = []
+    written = 0
+
+    def flush(chunk):
+        emails = {row['email'] for _, row in chunk}
+        allowed = set(
+            Student.objects.filter(branch=faculty.department, email__in=emails).values_list('email', flat=True)
+        )
+        records = []
+        for line, row in chunk:
+            if row['email'] not in allowed:
+                errors.append(f"Line {line}: student not in your department: {row['email']}")
+                continue
+            records.append(Attendance(
+                student_id=row['email'], subject_id=row['subject'], date=row['date'], status=row['status'],
+            ))
+        if errors:
+            return 0
+        return _write(records)
+
+    with transaction.atomic():
+        chunk = []
+        for line, raw in enumerate(reader, start=2):
+            email = (raw.get('email') or '').strip()
+            subject_id = subjects.get((raw.get('subject_code') or '').strip())
+            try:
+                day = parse_date((raw.get('date') or '').strip())
+            except ValueError:
+                day = None
+            status = normalize_status(raw.get('status'))
+            if not email or subject_id is None or day is None or status is None:
+                errors.append(f"Line {line}: invalid row {dict(raw)}")
+                continue
+            chunk.append((line, {'email': email, 'subject': subject_id, 'date': day, 'status': status}))
+            if len(chunk) >= CSV_CHUNK_SIZE:
+                written += flush(chunk)
+                chunk = []
+        if chunk:
+            written += flush(chunk)
+        if errors:
+            # Raising inside atomic() rolls back the chunks already written
+            raise AttendanceImportError(errors)
+    return written
@@ -0,0 +1,185 @@
+# student/attendance_rollups.py
+"""
+Monthly attendance rollups.
+
+Attendance percentages are read from AttendanceMonthly (one row per student,
+subject and month) instead of counting raw Attendance rows. Single writes keep
+the rollup current through the signal handlers in student/signals.py; bulk
+writes call refresh_monthly() with the keys they touched, and
+`manage.py rebuild_attendance_rollups` recomputes everything from scratch.
+"""
+import calendar
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, FloatField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Cast, Coalesce, TruncMonth
+
+from .models import Attendance, AttendanceMonthly
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def month_end(day):
+    return day.replace(day=calendar.monthrange(day.year, day.month)[1])
+
+
+def rollup_key(attendance):
+    """(student_id, subject_id, month) for one Attendance row."""
+    return (attendance.student_id, attendance.subject_id, month_start(attendance.date))
+
+
+def _upsert(rows, batch_size=1000):
+    AttendanceMonthly.objects.bulk_create(
+        rows,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=['student', 'subject', 'month'],
+        update_fields=['total', 'attended', 'updated_at'],
+    )
+
+
+def refresh_monthly(keys):
+    """
+    Recompute the rollup rows for the given (student_id, subject_id, month) keys
+    from the raw table, with one grouped query per month touched.
+    """
+    by_month = defaultdict(set)
+    for student_id, subject_id, month in keys:
+        by_month[month_start(month)].add((student_id, subject_id))
+
+    with transaction.atomic():
+        for month, pairs in by_month.items():
+            students = {student_id for student_id, _ in pairs}
+            subjects = {subject_id for _, subject_id in pairs}
+            counts = {
+                (row['student'], row['subject']): row
+                for row in Attendance.objects.filter(
+                    student__in=students, subject__in=subjects, date__range=(month, month_end(month)),
+                ).values('student', 'subject').annotate(
+                    total=Count('id'),
+                    attended=Count('id', filter=Q(status='Present')),
+                ).order_by()
+            }
+            rows = []
+            empty = []
+            for pair in pairs:
+                row = counts.get(pair)
+                if row:
+                    rows.append(AttendanceMonthly(
+                        student_id=pair[0], subject_id=pair[1], month=month,
+                        total=row['total'], attended=row['attended'],
+                    ))
+                else:
+                    empty.append(pair)
+            if rows:
+                _upsert(rows)
+            for student_id, subject_id in empty:
+                AttendanceMonthly.objects.filter(student_id=student_id, subject_id=subject_id, month=month).delete()
+
+
+def rebuild_monthly(students=None, batch_size=1000):
+    """Recompute the whole rollup table (or one set of students). Returns the number of rows written."""
+    source = Attendance.objects.all()
+    target = AttendanceMonthly.objects.all()
+    if students is not None:
+        source = source.filter(student__in=students)
+        target = target.filter(student__in=students)
+
+    grouped = source.annotate(month=TruncMonth('date')).values('student', 'subject', 'month').annotate(
+        total=Count('id'),
+        attended=Count('id', filter=Q(status='Present')),
+    ).order_by()
+
+    written = 0
+    with transaction.atomic():
+        target.delete()
+        batch = []
+        for row in grouped.iterator():
+            batch.append(AttendanceMonthly(
+                student_id=row['student'], subject_id=row['subject'], month=row['month'],
+                total=row['total'], attended=row['attended'],
+            ))
+            if len(batch) >= batch_size:
+                AttendanceMonthly.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            AttendanceMonthly.objects.bulk_create(batch)
+            written += len(batch)
+    return written
+
+
+def _percent(attended, total):
+    return round((attended / total) * 100, 1) if total else 0
+
+
+def attendance_totals(student):
+    """{'total', 'attended', 'absent', 'percent'} for one student."""
+    totals = AttendanceMonthly.objects.filter(student=student).aggregate(
+        total=Coalesce(Sum('total'), 0),
+        attended=Coalesce(Sum('attended'), 0),
+    )
+    totals['absent'] = totals['total'] - totals['attended']
+    totals['percent'] = _percent(totals['attended'], totals['total'])
+    return totals
+
+
+def attendance_by_subject(student):
+    """Per-subject totals for one student, ordered by subject name."""
+    rows = AttendanceMonthly.objects.filter(student=student).values('subject', 'subject__subject_name').annotate(
+        total_classes=Sum('total'),
+        attended_classes=Sum('attended'),
+    ).order_by('subject__subject_name')
+    return [
+        {
+            'name': row['subject__subject_name'],
+            'total': row['total_classes'],
+            'attended': row['attended_classes'],
+            'percent': _percent(row['attended_classes'], row['total_classes']),
+        }
+        for row in rows
+    ]
+
+
+def attendance_by_month(student):
+    """Per-month totals for one student, oldest first."""
+    rows = AttendanceMonthly.objects.filter(student=student).values('month').annotate(
+        total_classes=Sum('total'),
+        attended_classes=Sum('attended'),
+    ).order_by('month')
+    return [
+        {
+            'month': row['month'].strftime('%b %Y'),
+            'total': row['total_classes'],
+            'attended': row['attended_classes'],
+            'percent': _percent(row['attended_classes'], row['total_classes']),
+        }
+        for row in rows
+    ]
+
+
+def attendance_totals_for(students):
+    """{student_email: {'total', 'attended', 'percent'}} for many students in one grouped query."""
+    result = {}
+    rows = AttendanceMonthly.objects.filter(student__in=students).values('student').annotate(
+        total_classes=Sum('total'),
+        attended_classes=Sum('attended'),
+    ).order_by()
+    for row in rows:
+        result[row['student']] = {
+            'total': row['total_classes'],
+            'attended': row['attended_classes'],
+            'percent': _percent(row['attended_classes'], row['total_classes']),
+        }
+    return result
+
+
+def attendance_rate_subquery():
+    """Present / total attendance ratio for the student in the outer query (0 without records)."""
+    per_student = AttendanceMonthly.objects.filter(student=OuterRef('pk')).values('student').annotate(
+        rate=Cast(Sum('attended'), FloatField()) / Cast(Sum('total'), FloatField())
+    ).values('rate')
+    return Coalesce(Subquery(per_student, output_field=FloatField()), Value(0.0))
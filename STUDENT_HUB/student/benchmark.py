@@ -0,0 +1,196 @@
+# student/benchmark.py
+"""
+View benchmark.
+
+Drives every URL in student/urls.py through the Django test client, logged in
+as a student or a faculty member, and records the status code, query count,
+wall time, peak Python memory and response size of each view, plus the
+compressed weight of HTML pages and of the static files they link. The report is
+a plain dict (written as JSON by `manage.py benchmark_views`) so two runs can
+be compared release to release.
+"""
+import os
+import re
+import statistics
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from . import urls as student_urls
+from .models import (
+    Activities, Attendance, Certificate, Faculty, Projects, ReportJob, Results, Student, Subject, Submission,
+)
+from .static_assets import gzip_size
+
+# Views that need a faculty session; everything else runs as the student
+FACULTY_VIEWS = {
+    'faculty_dashboard', 'faculty_approvals', 'faculty_bulk_moderation', 'faculty_students', 'fac_reports',
+    'download_naac_report', 'get_student_profile', 'student_profiles', 'download_student_profile_pdf',
+    'pdf_cache_stats', 'mark_attendance', 'bulk_mark_attendance', 'logout_faculty', 'request_metrics',
+}
+# Logging out would end the session the other views run in
+SKIPPED_VIEWS = {'logout_student', 'logout_faculty'}
+
+STATIC_REFERENCE = re.compile(r'(?:href|src)="(/%s[^"]+)"' % re.escape(settings.STATIC_URL.strip('/') + '/'))
+
+DATASET_MODELS = (Student, Faculty, Subject, Certificate, Projects, Activities, Results, Attendance, Submission)
+
+
+def url_names():
+    return [pattern.name for pattern in student_urls.urlpatterns if isinstance(pattern, URLPattern) and pattern.name]
+
+
+def _request_for(name, student, report_job_id):
+    """(path, query params) for one named URL."""
+    if name in ('report_job_status', 'download_report_job'):
+        return reverse(name, kwargs={'job_id': report_job_id}), {}
+    if name in ('get_student_profile', 'student_profiles', 'download_student_profile_pdf'):
+        return reverse(name), {'email': student.email}
+    return reverse(name), {}
+
+
+def _response_size(response):
+    if response.streaming:
+        size = sum(len(chunk) for chunk in response.streaming_content)
+        response.close()
+        return size
+    return len(response.content)
+
+
+def _measure(client, path, params):
+    start = time.perf_counter()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(path, params)
+        size = _response_size(response)
+    return response.status_code, len(queries), (time.perf_counter() - start) * 1000, size
+
+
+def _page_weight(client, path, params):
+    """
+    Compressed size of an HTML response and the static files it references
+    ({} for other responses). Static bundles are downloaded once per browser,
+    so `static_bytes` is the first-visit cost on top of the page itself.
+    """
+    response = client.get(path, params)
+    if response.streaming or not response.get('Content-Type', '').startswith('text/html'):
+        return {}
+    html = response.content
+    assets = sorted(set(STATIC_REFERENCE.findall(html.decode(response.charset or 'utf-8', 'replace'))))
+    static_bytes = static_gzip_bytes = 0
+    for url in assets:
+        name = url[len(settings.STATIC_URL.rstrip('/')) + 1:].split('?')[0]
+        found = finders.find(name) or os.path.join(settings.STATIC_ROOT, name)
+        if os.path.isfile(found):
+            with open(found, 'rb') as f:
+                data = f.read()
+            static_bytes += len(data)
+            static_gzip_bytes += gzip_size(data)
+    return {
+        'response_gzip_bytes': gzip_size(html),
+        'static_files': len(assets),
+        'static_bytes': static_bytes,
+        'static_gzip_bytes': static_gzip_bytes,
+    }
+
+
+def _peak_memory(client, path, params):
+    tracemalloc.start()
+    try:
+        _response_size(client.get(path, params))
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def dataset_summary():
+    return {Model._meta.db_table: Model.objects.count() for Model in DATASET_MODELS}
+
+
+def default_accounts():
+    """A faculty member and a student of the same department, or (None, None)."""
+    for faculty in Faculty.objects.order_by('email'):
+        student = Student.objects.filter(branch=faculty.department).order_by('email').first()
+        if student:
+            return student, faculty
+    return None, None
+
+
+def run_benchmark(student, faculty, repeat=5, warmup=1, names=None):
+    """Benchmark every (or the named) student URL and return the report dict."""
+    clients = {}
+    for role, key, account in (('student', 'student_email', student), ('faculty', 'faculty_email', faculty)):
+        client = Client()
+        session = client.session
+        session[key] = account.email
+        session.save()
+        clients[role] = client
+
+    # A finished job owned by the student for the job status/download URLs
+    report_job = ReportJob.objects.create(
+        kind='cv', student=student, requested_by=student.email, dedup_key='benchmark', status='done',
+        finished_at=timezone.now(),
+    )
+    views = {}
+    try:
+        for name in names or url_names():
+            if name in SKIPPED_VIEWS:
+                continue
+            role = 'faculty' if name in FACULTY_VIEWS else 'student'
+            client = clients[role]
+            path, params = _request_for(name, student, report_job.pk)
+
+            for _ in range(warmup):
+                status, *_ = _measure(client, path, params)
+            runs = [_measure(client, path, params) for _ in range(repeat)]
+            status, query_count, _, size = runs[-1]
+            if status == 405:
+                views[name] = {'path': path, 'role': role, 'status': status, 'skipped': "GET not allowed"}
+                continue
+            timings = [run[2] for run in runs]
+            views[name] = {
+                'path': path,
+                'role': role,
+                'status': status,
+                'queries': query_count,
+                'time_ms_median': round(statistics.median(timings), 2),
+                'time_ms_min': round(min(timings), 2),
+                'peak_memory_kb': round(_peak_memory(client, path, params) / 1024, 1),
+                'response_bytes': size,
+                **_page_weight(client, path, params),
+            }
+    finally:
+        report_job.delete()
+
+    return {
+        'generated_at': timezone.now().isoformat(),
+        'database': connection.vendor,
+        'repeat': repeat,
+        'student': student.email,
+        'faculty': faculty.email,
+        'dataset': dataset_summary(),
+        'views': views,
+    }
+
+
+def compare_reports(old, new):
+    """
+    Rows of (view, old queries, new queries, old median ms, new median ms,
+    old response bytes, new response bytes) for views in both reports.
+    """
+    rows = []
+    for name, current in new['views'].items():
+        previous = old.get('views', {}).get(name)
+        if not previous or 'queries' not in previous or 'queries' not in current:
+            continue
+        rows.append((
+            name, previous['queries'], current['queries'], previous['time_ms_median'], current['time_ms_median'],
+            previous['response_bytes'], current['response_bytes'],
+        ))
+    return rows
@@ -0,0 +1,171 @@
+# student/blobs.py
+"""
+Reference counts and garbage collection for content-addressed documents.
+
+Every blob written by student/storage.py has a StoredBlob row whose ref_count
+is the number of Certificate/Results rows pointing at it. Single saves and
+deletes keep the count current through the signal handlers in
+student/signals.py; recount() recomputes it from the document columns after
+bulk writes. collect_garbage() deletes blobs that have had no references for
+longer than a grace period (so an upload that is still being saved is never
+collected), and import_legacy() moves documents stored under the old flat
+certificates/ and results/ folders into the blob store.
+"""
+import hashlib
+import os
+from collections import Counter
+from datetime import timedelta
+
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from .models import Certificate, Results, StoredBlob
+from .previews import remove_previews
+from .storage import BLOB_DIR, blob_digest, is_blob_name
+from .submissions import sync_submissions
+
+# (model, file field) pairs that reference blobs
+BLOB_REFERENCES = ((Certificate, 'document'), (Results, 'document'))
+DEFAULT_GRACE = timedelta(hours=24)
+
+
+def register_blob(digest, name, size):
+    """Record a stored blob (or touch an existing one) and return the name it is stored under."""
+    blob, created = StoredBlob.objects.get_or_create(sha256=digest, defaults={'name': name, 'size': size})
+    if not created:
+        StoredBlob.objects.filter(pk=digest).update(last_used=timezone.now())
+    return blob.name
+
+
+def adjust_references(name, delta):
+    if is_blob_name(name):
+        StoredBlob.objects.filter(name=name).update(ref_count=F('ref_count') + delta, last_used=timezone.now())
+
+
+def recount(batch_size=1000):
+    """Recompute every ref_count from the document columns. Returns the number of blobs corrected."""
+    counts = Counter()
+    for Model, field in BLOB_REFERENCES:
+        rows = Model.objects.filter(**{f"{field}__startswith": f"{BLOB_DIR}/"}).values(field).annotate(
+            references=Count('pk')
+        ).order_by()
+        for row in rows:
+            counts[row[field]] += row['references']
+
+    changed = []
+    for blob in StoredBlob.objects.only('sha256', 'name', 'ref_count').iterator():
+        if blob.ref_count != counts.get(blob.name, 0):
+            blob.ref_count = counts.get(blob.name, 0)
+            changed.append(blob)
+    StoredBlob.objects.bulk_update(changed, ['ref_count'], batch_size=batch_size)
+    return len(changed)
+
+
+def _remove_file(storage, name):
+    # The row may have been recreated by an upload since the collector deleted it
+    if not StoredBlob.objects.filter(name=name).exists():
+        remove_path(storage.path(name))
+        remove_previews(blob_digest(name))
+
+
+def collect_garbage(grace=DEFAULT_GRACE, dry_run=False):
+    """Delete unreferenced blobs older than `grace`. Returns (blobs removed, bytes freed)."""
+    storage = Certificate._meta.get_field('document').storage
+    cutoff = timezone.now() - grace
+    removed = freed = 0
+    for blob in StoredBlob.objects.filter(ref_count__lte=0, last_used__lt=cutoff).iterator():
+        if not dry_run:
+            with transaction.atomic():
+                # Re-check under a row lock: an upload may have just reused the blob
+                locked = StoredBlob.objects.select_for_update().filter(
+                    pk=blob.pk, ref_count__lte=0, last_used__lt=cutoff
+                ).first()
+                if locked is None:
+                    continue
+                locked.delete()
+                transaction.on_commit(lambda name=blob.name: _remove_file(storage, name))
+        removed += 1
+        freed += blob.size
+    return removed, freed
+
+
+def stray_files(grace=DEFAULT_GRACE):
+    """Paths under blobs/ with no StoredBlob row (interrupted uploads), older than `grace`."""
+    storage = Certificate._meta.get_field('document').storage
+    root = storage.path(BLOB_DIR)
+    cutoff = (timezone.now() - grace).timestamp()
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            if os.stat(path).st_mtime >= cutoff:
+                continue
+            digest = filename.split('.', 1)[0]
+            if filename.endswith('.upload') or not StoredBlob.objects.filter(pk=digest).exists():
+                yield path
+
+
+def remove_path(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _file_sha256(path, chunk_size=64 * 1024):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for chunk in iter(lambda: source.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def import_legacy(dry_run=False, keep_originals=False):
+    """
+    Move documents outside the blob store into it and repoint their rows.
+    Returns (rows moved, distinct blobs, bytes of duplicate copies removed).
+    """
+    moved = 0
+    digests = set()
+    duplicate_bytes = 0
+    originals = {}
+    moved_certificates = []
+    for Model, field in BLOB_REFERENCES:
+        storage = Model._meta.get_field(field).storage
+        rows = Model.objects.exclude(**{f"{field}__startswith": f"{BLOB_DIR}/"}).exclude(**{field: ''}).exclude(
+            **{f"{field}__isnull": True}
+        ).values_list('pk', field)
+        for pk, name in list(rows):
+            path = storage.path(name)
+            if not os.path.exists(path):
+                continue
+            if dry_run:
+                digest = _file_sha256(path)
+            else:
+                with open(path, 'rb') as source:
+                    with transaction.atomic():
+                        new_name = storage.save(name, File(source))
+                        Model.objects.filter(pk=pk).update(**{field: new_name})
+                        adjust_references(new_name, 1)
+                digest = os.path.basename(new_name).split('.', 1)[0]
+            if digest in digests:
+                duplicate_bytes += os.path.getsize(path)
+            digests.add(digest)
+            originals[path] = name
+            moved += 1
+            if Model is Certificate:
+                moved_certificates.append(pk)
+
+    if moved_certificates and not dry_run:
+        # The submission index copies the document URL
+        sync_submissions('certificate', moved_certificates)
+
+    if not dry_run and not keep_originals:
+        for path, name in originals.items():
+            still_used = any(
+                Model.objects.filter(**{field: name}).exists() for Model, field in BLOB_REFERENCES
+            )
+            if not still_used:
+                remove_path(path)
+    return moved, len(digests), duplicate_bytes
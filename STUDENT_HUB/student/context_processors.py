@@ -0,0 +1,34 @@
+# student/context_processors.py
+"""
+Template context shared by every page.
+
+The navbars and stat cards are wrapped in {% cache %} blocks keyed by the
+signed-in account and `fragment_version`: a student's summary version, or a
+faculty member's fragment version (both in student/summary_cache.py). Saving
+the student, any of the student's items or the faculty row bumps it, and an
+evicted version comes back as a new value, so a cached fragment is never
+served after the data it shows has changed. The token is computed lazily:
+pages without cached fragments pay nothing, the others one cache round-trip.
+"""
+from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+
+from . import summary_cache
+
+
+def _fragment_version(request):
+    session = getattr(request, 'session', None)
+    if session is None:
+        return 'anonymous'
+    if session.get('student_email'):
+        return summary_cache.version_token([session['student_email']])
+    if session.get('faculty_email'):
+        return summary_cache.faculty_version_token(session['faculty_email'])
+    return 'anonymous'
+
+
+def fragment_versions(request):
+    return {
+        'fragment_cache_timeout': getattr(settings, 'FRAGMENT_CACHE_TIMEOUT', 600),
+        'fragment_version': SimpleLazyObject(lambda: _fragment_version(request)),
+    }
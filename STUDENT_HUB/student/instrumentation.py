@@ -0,0 +1,320 @@
+# student/instrumentation.py
+"""
+Per-request instrumentation.
+
+RequestInstrumentationMiddleware wraps every request in a database execute
+wrapper and records, per URL name: the number of SQL queries, the time spent
+in the database, queries that ran more than once with the same SQL (the usual
+sign of an N+1 loop), template render time and response size. Template time
+comes from InstrumentedDjangoTemplates, the template backend configured in
+settings.TEMPLATES. Its loaders (InstrumentedFilesystemLoader and
+InstrumentedAppDirectoriesLoader, wrapped in InstrumentedCachedLoader outside
+DEBUG) build TimedTemplates, which also time every template rendered during
+the request, including {% extends %} parents and {% include %}d templates.
+Those per-template times are inclusive: a template's time contains the
+templates it renders.
+
+Aggregates are kept in memory per process and served as JSON by the
+`request_metrics` view. Requests slower than SLOW_REQUEST_MS are logged to
+the 'student.instrumentation' logger.
+"""
+import bisect
+import contextvars
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+from django.template import TemplateDoesNotExist
+from django.template import base as template_base
+from django.template.backends.django import DjangoTemplates, Template, reraise
+from django.template.loaders import app_directories, base as loader_base, cached, filesystem
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+TOP_DUPLICATES = 10
+# Distinct duplicated statements kept per view before pruning back to the top
+# TOP_DUPLICATES; SQL with literals or IN-lists of varying length would otherwise
+# add a new key on every request
+MAX_TRACKED_DUPLICATES = 5 * TOP_DUPLICATES
+
+_current = contextvars.ContextVar('request_metrics', default=None)
+
+
+def instrumentation_enabled():
+    return getattr(settings, 'REQUEST_INSTRUMENTATION', True)
+
+
+def slow_request_ms():
+    return getattr(settings, 'SLOW_REQUEST_MS', 500)
+
+
+class RequestMetrics:
+    """Numbers collected while one request is being handled."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_ms = 0.0
+        self.template_ms = 0.0
+        self.statements = Counter()
+        # template name -> [renders, inclusive ms]
+        self.templates = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper() hook
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_ms += (time.perf_counter() - start) * 1000
+            self.queries += 1
+            self.statements[sql] += 1
+
+    def add_template(self, name, elapsed_ms):
+        entry = self.templates.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed_ms
+
+    def duplicates(self):
+        """{sql: times executed} for statements that ran more than once."""
+        return {sql: count for sql, count in self.statements.items() if count > 1}
+
+
+class _Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+
+    def as_dict(self):
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return dict(zip(labels, self.counts))
+
+
+class _ViewStats:
+    def __init__(self):
+        self.requests = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.db_ms = 0.0
+        self.queries = 0
+        self.max_queries = 0
+        self.template_ms = 0.0
+        self.response_bytes = 0
+        self.latency = _Histogram(LATENCY_BUCKETS_MS)
+        self.query_counts = _Histogram(QUERY_BUCKETS)
+        # sql -> [requests in which it repeated, highest repeat count in one request]
+        self.duplicates = {}
+
+    def add(self, elapsed_ms, metrics, size):
+        self.requests += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.db_ms += metrics.db_ms
+        self.queries += metrics.queries
+        self.max_queries = max(self.max_queries, metrics.queries)
+        self.template_ms += metrics.template_ms
+        self.response_bytes += size or 0
+        self.latency.add(elapsed_ms)
+        self.query_counts.add(metrics.queries)
+        for sql, count in metrics.duplicates().items():
+            entry = self.duplicates.setdefault(sql, [0, 0])
+            entry[0] += 1
+            entry[1] = max(entry[1], count)
+        if len(self.duplicates) > MAX_TRACKED_DUPLICATES:
+            self.duplicates = dict(self._top_duplicates())
+
+    def _top_duplicates(self):
+        return sorted(self.duplicates.items(), key=lambda item: (-item[1][1], -item[1][0]))[:TOP_DUPLICATES]
+
+    def as_dict(self):
+        n = self.requests or 1
+        top = self._top_duplicates()
+        return {
+            'requests': self.requests,
+            'avg_ms': round(self.total_ms / n, 2),
+            'max_ms': round(self.max_ms, 2),
+            'avg_db_ms': round(self.db_ms / n, 2),
+            'avg_queries': round(self.queries / n, 2),
+            'max_queries': self.max_queries,
+            'avg_template_ms': round(self.template_ms / n, 2),
+            'avg_response_bytes': round(self.response_bytes / n),
+            'latency_ms': self.latency.as_dict(),
+            'queries': self.query_counts.as_dict(),
+            'duplicated_queries': [
+                {'sql': sql, 'requests': requests, 'max_repeats': repeats}
+                for sql, (requests, repeats) in top
+            ],
+        }
+
+
+class _TemplateStats:
+    def __init__(self):
+        self.renders = 0
+        self.requests = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0  # slowest single request
+
+    def add(self, renders, elapsed_ms):
+        self.renders += renders
+        self.requests += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def as_dict(self):
+        return {
+            'requests': self.requests,
+            'renders': self.renders,
+            'avg_ms_per_request': round(self.total_ms / (self.requests or 1), 2),
+            'max_ms_per_request': round(self.max_ms, 2),
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe per-process aggregates keyed by URL name (and by template name)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+        self._templates = {}
+
+    def record(self, view_name, elapsed_ms, metrics, size):
+        with self._lock:
+            self._views.setdefault(view_name, _ViewStats()).add(elapsed_ms, metrics, size)
+            for name, (renders, template_ms) in metrics.templates.items():
+                self._templates.setdefault(name, _TemplateStats()).add(renders, template_ms)
+
+    def snapshot(self):
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in sorted(self._views.items())}
+
+    def template_snapshot(self):
+        """Per-template inclusive render time, slowest first."""
+        with self._lock:
+            ordered = sorted(self._templates.items(), key=lambda item: -item[1].total_ms)
+            return {name: stats.as_dict() for name, stats in ordered}
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+            self._templates.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _response_size(response):
+    if response.streaming:
+        length = response.get('Content-Length')
+        return int(length) if length else None
+    return len(response.content)
+
+
+class RequestInstrumentationMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not instrumentation_enabled():
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(metrics):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        match = getattr(request, 'resolver_match', None)
+        view_name = (match.url_name or match.view_name) if match else 'unresolved'
+        size = _response_size(response)
+        registry.record(view_name, elapsed_ms, metrics, size)
+
+        if elapsed_ms >= slow_request_ms():
+            duplicates = sorted(metrics.duplicates().items(), key=lambda item: -item[1])[:3]
+            logger.warning(
+                "Slow request %s %s (%s): %.0f ms, %d queries in %.0f ms, templates %.0f ms, %s bytes%s",
+                request.method, request.path, view_name, elapsed_ms, metrics.queries, metrics.db_ms,
+                metrics.template_ms, size,
+                "".join(f"\n  repeated x{count}: {sql[:200]}" for sql, count in duplicates),
+            )
+        return response
+
+
+class InstrumentedTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(context, request)
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_ms += (time.perf_counter() - start) * 1000
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates backend whose templates report their render time to the current request."""
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return InstrumentedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+class TimedTemplate(template_base.Template):
+    """Engine-level template that reports its (inclusive) render time to the current request."""
+
+    def _render(self, context):
+        metrics = _current.get()
+        if metrics is None:
+            return super()._render(context)
+        start = time.perf_counter()
+        try:
+            return super()._render(context)
+        finally:
+            metrics.add_template(self.name or '<string>', (time.perf_counter() - start) * 1000)
+
+
+class TimedLoader(loader_base.Loader):
+    # Same lookup as django.template.loaders.base.Loader.get_template, building TimedTemplates
+    def get_template(self, template_name, skip=None):
+        tried = []
+        for origin in self.get_template_sources(template_name):
+            if skip is not None and origin in skip:
+                tried.append((origin, "Skipped to avoid recursion"))
+                continue
+            try:
+                contents = self.get_contents(origin)
+            except TemplateDoesNotExist:
+                tried.append((origin, "Source does not exist"))
+                continue
+            return TimedTemplate(contents, origin, origin.template_name, self.engine)
+        raise TemplateDoesNotExist(template_name, tried=tried)
+
+
+class InstrumentedFilesystemLoader(TimedLoader, filesystem.Loader):
+    pass
+
+
+class InstrumentedAppDirectoriesLoader(TimedLoader, app_directories.Loader):
+    pass
+
+
+class InstrumentedCachedLoader(cached.Loader, TimedLoader):
+    # cached.Loader compiles through super().get_template(), which the MRO resolves to TimedLoader
+    pass
@@ -0,0 +1,165 @@
+# student/jobs.py
+"""
+Database-backed queue for PDF reports.
+
+Views call enqueue_report() and return the job id immediately; the
+run_report_worker management command claims queued jobs and renders them in a
+process pool, saving the PDF under MEDIA_ROOT/reports/. Repeated requests
+from the same user for a report that is already queued, running or freshly
+rendered reuse the existing job; jobs are only visible to their requester, so
+other users get their own (CV and profile PDFs still render once, through
+student/pdf_cache.py). Finished and failed jobs are deleted, with their
+files, REPORT_JOB_RETENTION_HOURS after they finish; the worker runs
+purge_finished_jobs() on start-up and then periodically.
+"""
+import hashlib
+import json
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from . import pdf_cache
+from .models import ReportJob, Student
+from .portfolio import portfolio_stats
+from .reports import (
+    naac_students, render_cv_pdf, render_naac_report, render_student_profile_pdf, render_to_tempfile,
+)
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+class ReportJobLimitExceeded(Exception):
+    """The requester already has the maximum number of reports in the queue."""
+
+
+def max_active_jobs_per_user():
+    return getattr(settings, 'REPORT_JOB_MAX_ACTIVE_PER_USER', 3)
+
+
+def reuse_window():
+    return timedelta(seconds=getattr(settings, 'REPORT_JOB_REUSE_SECONDS', 120))
+
+
+def retention():
+    return timedelta(hours=getattr(settings, 'REPORT_JOB_RETENTION_HOURS', 24))
+
+
+def make_dedup_key(kind, requested_by, student_id=None, params=None):
+    payload = json.dumps([kind, requested_by, student_id, params or {}], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def enqueue_report(kind, requested_by, student=None, params=None):
+    """
+    Queue a report and return (job, created). An identical job of the same
+    requester that is still queued/running, or finished within the reuse
+    window, is returned instead.
+    Raises ReportJobLimitExceeded when the requester has too many active jobs.
+    """
+    student_id = getattr(student, 'pk', student)
+    params = params or {}
+    dedup_key = make_dedup_key(kind, requested_by, student_id, params)
+
+    with transaction.atomic():
+        existing = ReportJob.objects.select_for_update().filter(dedup_key=dedup_key).filter(
+            status__in=ACTIVE_STATUSES
+        ).first() or ReportJob.objects.filter(
+            dedup_key=dedup_key, status='done', finished_at__gte=timezone.now() - reuse_window()
+        ).order_by('-finished_at').first()
+        if existing:
+            return existing, False
+
+        active = ReportJob.objects.filter(requested_by=requested_by, status__in=ACTIVE_STATUSES).count()
+        if active >= max_active_jobs_per_user():
+            raise ReportJobLimitExceeded(
+                f"You already have {active} reports being generated. Please wait for them to finish."
+            )
+
+        job = ReportJob.objects.create(
+            kind=kind, student_id=student_id, params=params, dedup_key=dedup_key, requested_by=requested_by,
+        )
+    return job, True
+
+
+def claim_next_job():
+    """Mark the oldest queued job as running and return it (None if the queue is empty)."""
+    with transaction.atomic():
+        # skip_locked lets several workers poll the same table without blocking each other
+        job = ReportJob.objects.select_for_update(skip_locked=True).filter(
+            status='queued'
+        ).order_by('created_at', 'pk').first()
+        if job is None:
+            return None
+        job.status = 'running'
+        job.started_at = timezone.now()
+        job.save(update_fields=['status', 'started_at'])
+    return job
+
+
+def requeue_stale_jobs(older_than):
+    """Put jobs left 'running' by a worker that died back on the queue."""
+    return ReportJob.objects.filter(
+        status='running', started_at__lt=timezone.now() - older_than
+    ).update(status='queued', started_at=None)
+
+
+def mark_job_failed(job_id, error):
+    ReportJob.objects.filter(pk=job_id).update(status='failed', error=error, finished_at=timezone.now())
+
+
+def purge_finished_jobs(older_than=None, batch_size=500):
+    """Delete done/failed jobs that finished more than `older_than` ago, and their PDFs. Returns the count."""
+    cutoff = timezone.now() - (older_than if older_than is not None else retention())
+    expired = ReportJob.objects.filter(status__in=('done', 'failed'), finished_at__lt=cutoff)
+    storage = ReportJob._meta.get_field('file').storage
+    deleted = 0
+    while True:
+        batch = list(expired.values_list('pk', 'file')[:batch_size])
+        if not batch:
+            return deleted
+        ReportJob.objects.filter(pk__in=[pk for pk, _ in batch]).delete()
+        for _, name in batch:
+            if name:
+                storage.delete(name)
+        deleted += len(batch)
+
+
+def render_job(job):
+    """Render the PDF for `job` (CV/profile through the PDF cache) and return it as an open file."""
+    if job.kind == 'cv':
+        student = Student.objects.get(pk=job.student_id)
+        stats = portfolio_stats(student)
+        return pdf_cache.get_or_render(
+            'cv', student, partial(render_cv_pdf, stats=stats), inputs=pdf_cache.cv_inputs(student, stats)
+        )
+    if job.kind == 'profile':
+        return pdf_cache.get_or_render('profile', Student.objects.get(pk=job.student_id), render_student_profile_pdf)
+    if job.kind == 'naac':
+        return render_to_tempfile(render_naac_report, naac_students(**job.params))
+    raise ValueError(f"Unknown report kind: {job.kind}")
+
+
+def report_filename(job):
+    if job.kind == 'naac':
+        return f"naac_report_{job.pk}.pdf"
+    return f"{job.kind}_{job.pk}.pdf"
+
+
+def run_job(job_id):
+    """Entry point executed inside a worker process."""
+    job = ReportJob.objects.get(pk=job_id)
+    try:
+        with render_job(job) as pdf:
+            job.file.save(report_filename(job), File(pdf), save=False)
+        job.status = 'done'
+        job.error = ""
+    except Exception as e:
+        job.status = 'failed'
+        job.error = str(e)
+    job.finished_at = timezone.now()
+    job.save(update_fields=['file', 'status', 'error', 'finished_at'])
+    return job.status
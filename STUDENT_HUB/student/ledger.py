@@ -0,0 +1,140 @@
+# student/ledger.py
+"""
+Credit ledger helpers.
+
+Every page that shows a student's credits used to run one SUM/COUNT query per
+category. The CreditLedger table keeps those numbers per (student, category)
+so a page can read them back with a single query. Rows are recomputed from the
+source table by the signal handlers in student/signals.py whenever an item is
+saved or deleted; set-wise writes (queryset.update(), bulk_create) call
+rebuild_ledger() for the students they touched.
+"""
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from .models import Activities, Certificate, CreditLedger, Projects
+
+# Same keys the approval form posts as `model_type`
+LEDGER_MODELS = {
+    'certificate': Certificate,
+    'project': Projects,
+    'activity': Activities,
+}
+
+LEDGER_FIELDS = ['approved_count', 'pending_count', 'credit_total']
+
+
+def _ledger_totals():
+    return {
+        'approved_count': Count('pk', filter=Q(status='approved')),
+        'pending_count': Count('pk', filter=Q(status='pending')),
+        'credit_total': Coalesce(Sum('credit', filter=Q(status='approved')), 0),
+    }
+
+
+def refresh_ledger(student, category, create=True):
+    """
+    Recompute the ledger row for one student and category from its source table.
+    Call it in the same transaction as the write that changed the source rows.
+    With create=False a missing row is left missing (used after deletes, which
+    can run while the student itself is being deleted).
+    """
+    student_id = getattr(student, 'pk', student)
+    Model = LEDGER_MODELS[category]
+    with transaction.atomic():
+        if create:
+            CreditLedger.objects.get_or_create(student_id=student_id, category=category)
+        # Lock the row so concurrent approvals for the same student are serialized
+        entry = CreditLedger.objects.select_for_update().filter(student_id=student_id, category=category).first()
+        if entry is None:
+            return None
+        totals = Model.objects.filter(student_email_id=student_id).aggregate(**_ledger_totals())
+        for field in LEDGER_FIELDS:
+            setattr(entry, field, totals[field])
+        entry.save(update_fields=LEDGER_FIELDS + ['updated_at'])
+    return entry
+
+
+def empty_summary():
+    summary = {category: {'approved': 0, 'pending': 0, 'credits': 0} for category in LEDGER_MODELS}
+    summary['total'] = {'approved': 0, 'pending': 0, 'credits': 0}
+    return summary
+
+
+def credit_summary(student):
+    """
+    Return approved/pending counts and credits per category plus a 'total' entry,
+    read from the ledger in one query.
+    """
+    summary = empty_summary()
+    for entry in CreditLedger.objects.filter(student=student):
+        row = {
+            'approved': entry.approved_count,
+            'pending': entry.pending_count,
+            'credits': entry.credit_total,
+        }
+        summary[entry.category] = row
+        for key, value in row.items():
+            summary['total'][key] += value
+    return summary
+
+
+def compute_ledger_rows(students=None):
+    """
+    Aggregate every source table grouped by student and return
+    {(student_id, category): {field: value}}.
+    """
+    rows = {}
+    for category, Model in LEDGER_MODELS.items():
+        queryset = Model.objects.all()
+        if students is not None:
+            queryset = queryset.filter(student_email__in=students)
+        grouped = queryset.values('student_email').annotate(**_ledger_totals()).order_by()
+        for row in grouped.iterator():
+            rows[(row['student_email'], category)] = {field: row[field] for field in LEDGER_FIELDS}
+    return rows
+
+
+def rebuild_ledger(students=None, dry_run=False, batch_size=1000):
+    """
+    Reconcile the ledger against the source tables in bulk.
+    Returns (created, updated, unchanged) counts.
+    """
+    expected = compute_ledger_rows(students)
+    existing_qs = CreditLedger.objects.all()
+    if students is not None:
+        existing_qs = existing_qs.filter(student__in=students)
+    existing = {
+        (entry['student'], entry['category']): entry
+        for entry in existing_qs.values('student', 'category', *LEDGER_FIELDS).iterator()
+    }
+
+    zero = {field: 0 for field in LEDGER_FIELDS}
+    # Ledger rows whose source items were deleted are reset to zero
+    for key in existing:
+        expected.setdefault(key, zero)
+
+    created = updated = unchanged = 0
+    to_write = []
+    for (student_id, category), totals in expected.items():
+        current = existing.get((student_id, category))
+        if current is None:
+            created += 1
+        elif all(current[field] == totals[field] for field in LEDGER_FIELDS):
+            unchanged += 1
+            continue
+        else:
+            updated += 1
+        to_write.append(CreditLedger(student_id=student_id, category=category, **totals))
+
+    if to_write and not dry_run:
+        with transaction.atomic():
+            CreditLedger.objects.bulk_create(
+                to_write,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['student', 'category'],
+                update_fields=LEDGER_FIELDS + ['updated_at'],
+            )
+    return created, updated, unchanged
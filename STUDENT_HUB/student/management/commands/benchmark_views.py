@@ -0,0 +1,57 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import setup_test_environment
+
+from student.benchmark import compare_reports, default_accounts, run_benchmark
+from student.models import Faculty, Student
+
+
+class Command(BaseCommand):
+    help = (
+        "Request every URL in student/urls.py through the test client and report query count, "
+        "wall time, peak memory and response size per view as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--student', help="Email of the student to log in as (default: first with a faculty).")
+        parser.add_argument('--faculty', help="Email of the faculty member to log in as.")
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--warmup', type=int, default=1)
+        parser.add_argument('--view', action='append', dest='views', help="Only benchmark this URL name.")
+        parser.add_argument('--output', help="Write the JSON report to this file (default: stdout).")
+        parser.add_argument('--compare', help="Previous JSON report to diff against.")
+
+    def handle(self, *args, **options):
+        student, faculty = default_accounts()
+        try:
+            if options['student']:
+                student = Student.objects.get(email=options['student'])
+            if options['faculty']:
+                faculty = Faculty.objects.get(email=options['faculty'])
+        except (Student.DoesNotExist, Faculty.DoesNotExist) as e:
+            raise CommandError(str(e))
+        if student is None or faculty is None:
+            raise CommandError("No student/faculty pair found; run `manage.py seed_college` first.")
+
+        # Lets the test client's 'testserver' host through ALLOWED_HOSTS
+        setup_test_environment()
+        report = run_benchmark(
+            student, faculty, repeat=options['repeat'], warmup=options['warmup'], names=options['views'],
+        )
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}"))
+        else:
+            self.stdout.write(json.dumps(report, indent=2))
+
+        if options['compare']:
+            with open(options['compare']) as f:
+                previous = json.load(f)
+            self.stdout.write(f"{'view':<32} {'queries':>15} {'median ms':>21} {'response bytes':>21}")
+            for name, old_q, new_q, old_ms, new_ms, old_b, new_b in compare_reports(previous, report):
+                self.stdout.write(
+                    f"{name:<32} {old_q:>6} -> {new_q:<6} {old_ms:>9.1f} -> {new_ms:<9.1f} {old_b:>9} -> {new_b:<9}"
+                )
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template.defaultfilters import filesizeformat
+
+from student.static_assets import brotli, precompress
+
+
+class Command(BaseCommand):
+    help = "Write gzip (and brotli) variants of the collected static files in STATIC_ROOT. Run after collectstatic."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-bytes', type=int, help="Skip files smaller than this (default: STATIC_PRECOMPRESS_MIN_BYTES).",
+        )
+
+    def handle(self, *args, **options):
+        if not getattr(settings, 'STATIC_ROOT', None):
+            raise CommandError("STATIC_ROOT is not set.")
+        if brotli is None:
+            self.stdout.write(self.style.WARNING("brotli is not installed; writing gzip variants only."))
+
+        results = precompress(settings.STATIC_ROOT, min_bytes=options['min_bytes'])
+        raw_total = sum(raw for _, raw, _, _ in results)
+        gzip_total = sum(gz or raw for _, raw, gz, _ in results)
+        brotli_total = sum(br or gz or raw for _, raw, gz, br in results)
+        self.stdout.write(
+            f"{len(results)} files: {filesizeformat(raw_total)} raw, {filesizeformat(gzip_total)} gzip"
+            + (f", {filesizeformat(brotli_total)} brotli" if brotli is not None else "")
+        )
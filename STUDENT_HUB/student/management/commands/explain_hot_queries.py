@@ -0,0 +1,108 @@
+import re
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import F
+
+from student.models import Activities, Attendance, Certificate, Projects, Results, Student, Submission
+from student.seeding import clear_seed, seed_college
+
+SEQ_SCAN = re.compile(r'Seq Scan|\bSCAN \w+\s*$', re.MULTILINE)
+INDEX_SCAN = re.compile(r'Index Scan|Index Only Scan|Bitmap Index Scan|USING (COVERING )?INDEX')
+
+
+def hot_queries(student, branch):
+    """(label, queryset) for the filters the views run on every request."""
+    queries = []
+    for label, Model in (('certificates', Certificate), ('projects', Projects), ('activities', Activities)):
+        queries += [
+            (f"{label}: one student's approved items",
+             Model.objects.filter(student_email=student, status='approved')),
+            (f"{label}: pending items of a branch",
+             Model.objects.filter(student_email__branch=branch, status='pending')),
+        ]
+    queries += [
+        ("results: latest semester of a student",
+         Results.objects.filter(student_email=student).order_by('-semester')[:1]),
+        ("students: one branch",
+         Student.objects.filter(branch=branch)),
+        ("attendance: a student's present count",
+         Attendance.objects.filter(student=student, status='Present')),
+        ("submissions: approvals page",
+         Submission.objects.filter(branch=branch, status='pending').order_by('-submission_date', '-pk')[:11]),
+        ("submissions: a student's feed",
+         Submission.objects.filter(student=student).order_by(F('date').desc(nulls_last=True), '-pk')[:20]),
+    ]
+    return queries
+
+
+def plan_kind(plan):
+    if SEQ_SCAN.search(plan):
+        return 'SEQ SCAN'
+    if INDEX_SCAN.search(plan):
+        return 'index'
+    return '?'
+
+
+class Command(BaseCommand):
+    help = (
+        "Print the query plan of the hot filter queries. Compare the output with "
+        "migration 0023 rolled back (`migrate student 0022`) and applied to see the "
+        "plans move from sequential scans to index scans. "
+        "--seed 85000 creates roughly one million certificate/project/activity rows; "
+        "rerunning it replaces the accounts seeded earlier under the same --prefix."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, metavar='STUDENTS',
+                            help="Seed this many synthetic students first (see student/seeding.py).")
+        parser.add_argument('--prefix', default='seed',
+                            help="Email prefix of the seeded accounts; earlier ones with it are deleted first.")
+        parser.add_argument('--items-per-student', type=int, default=4,
+                            help="Certificates, projects and activities each per seeded student.")
+        parser.add_argument('--branches', type=int, default=8)
+        parser.add_argument('--attendance-days', type=int, default=30)
+        parser.add_argument('--analyze', action='store_true',
+                            help="Use EXPLAIN ANALYZE (PostgreSQL) to include actual timings.")
+        parser.add_argument('--verbose-plans', action='store_true', help="Print the full plan of every query.")
+
+    def handle(self, *args, **options):
+        if options['seed']:
+            # seed_college numbers its emails from 1, so a rerun would collide with the last one
+            deleted = clear_seed(options['prefix'])
+            if deleted:
+                self.stdout.write(f"Deleted {deleted} previously seeded rows.")
+            counts = seed_college(
+                branches=options['branches'],
+                students_per_branch=max(1, options['seed'] // options['branches']),
+                items_per_student=options['items_per_student'],
+                attendance_days=options['attendance_days'],
+                prefix=options['prefix'],
+                log=self.stdout.write,
+            )
+            self.stdout.write(self.style.SUCCESS(
+                "Seeded " + ", ".join(f"{table}={count}" for table, count in counts.items())
+            ))
+
+        if connection.vendor == 'postgresql':
+            # Fresh statistics so the planner sees the seeded volume
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+        sample = Student.objects.order_by('email').values('email', 'branch').first()
+        if sample is None:
+            self.stderr.write("No students in the database; use --seed.")
+            return
+
+        explain_options = {'analyze': True} if options['analyze'] and connection.vendor == 'postgresql' else {}
+        seq_scans = 0
+        for label, queryset in hot_queries(sample['email'], sample['branch']):
+            plan = queryset.explain(**explain_options)
+            kind = plan_kind(plan)
+            seq_scans += kind == 'SEQ SCAN'
+            self.stdout.write(f"{kind:<9} {label}")
+            if options['verbose_plans']:
+                self.stdout.write("\n".join(f"          {line}" for line in plan.splitlines()))
+
+        style = self.style.WARNING if seq_scans else self.style.SUCCESS
+        self.stdout.write(style(f"{seq_scans} hot queries use a sequential scan."))
@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.template.defaultfilters import filesizeformat
+
+from student import blobs
+
+
+class Command(BaseCommand):
+    help = "Delete unreferenced document blobs; optionally import legacy uploads and recount references first."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--import-legacy', action='store_true',
+            help="Move documents still stored under certificates/ and results/ into the blob store.",
+        )
+        parser.add_argument(
+            '--keep-originals', action='store_true',
+            help="With --import-legacy, leave the old files in place.",
+        )
+        parser.add_argument(
+            '--recount', action='store_true',
+            help="Recompute reference counts from the document columns (after bulk writes).",
+        )
+        parser.add_argument(
+            '--scan-disk', action='store_true',
+            help="Also remove files under blobs/ that have no blob row (interrupted uploads).",
+        )
+        parser.add_argument(
+            '--grace-hours', type=float, default=blobs.DEFAULT_GRACE.total_seconds() / 3600,
+            help="Only collect blobs unreferenced for at least this long (default: %(default)s).",
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true', help="Report what would be done without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        grace = timedelta(hours=options['grace_hours'])
+
+        if options['import_legacy']:
+            moved, distinct, duplicate_bytes = blobs.import_legacy(
+                dry_run=dry_run, keep_originals=options['keep_originals'],
+            )
+            self.stdout.write(
+                f"Legacy documents: {moved} rows, {distinct} distinct files, "
+                f"{filesizeformat(duplicate_bytes)} in duplicate copies"
+            )
+        if options['recount'] and not dry_run:
+            self.stdout.write(f"Reference counts corrected: {blobs.recount()}")
+
+        removed, freed = blobs.collect_garbage(grace=grace, dry_run=dry_run)
+        verb = "Would remove" if dry_run else "Removed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {removed} unreferenced blobs ({filesizeformat(freed)})"))
+
+        if options['scan_disk']:
+            stray = 0
+            for path in blobs.stray_files(grace=grace):
+                stray += 1
+                if not dry_run:
+                    blobs.remove_path(path)
+            self.stdout.write(f"{verb} {stray} stray files")
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from student import summary_cache
+from student.attendance_rollups import rebuild_monthly
+
+
+class Command(BaseCommand):
+    help = "Recompute the AttendanceMonthly rollup table from raw Attendance rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--student', action='append', dest='students',
+            help="Only rebuild the given student email (can be repeated).",
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = rebuild_monthly(students=options['students'], batch_size=options['batch_size'])
+        summary_cache.invalidate_all()
+        self.stdout.write(self.style.SUCCESS(f"Attendance rollup rows written: {written}"))
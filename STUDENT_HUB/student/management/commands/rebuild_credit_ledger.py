@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from student import summary_cache
+from student.ledger import rebuild_ledger
+
+
+class Command(BaseCommand):
+    help = "Rebuild or reconcile the CreditLedger table from certificates, projects and activities."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--student', action='append', dest='students',
+            help="Only reconcile the given student email (can be repeated).",
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Report drift without writing anything.",
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        created, updated, unchanged = rebuild_ledger(
+            students=options['students'],
+            dry_run=options['dry_run'],
+            batch_size=options['batch_size'],
+        )
+        if not options['dry_run'] and (created or updated):
+            summary_cache.invalidate_all()
+        prefix = "[dry run] " if options['dry_run'] else ""
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}Ledger rows created: {created}, updated: {updated}, unchanged: {unchanged}"
+        ))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from student.submissions import rebuild_submissions
+
+
+class Command(BaseCommand):
+    help = "Recompute the Submission index from the Certificate, Projects and Activities tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--student', action='append', dest='students',
+            help="Only rebuild the given student email (can be repeated).",
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = rebuild_submissions(students=options['students'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Submission index rows written: {written}"))
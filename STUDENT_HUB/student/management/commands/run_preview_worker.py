@@ -0,0 +1,48 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from student.models import StoredBlob
+from student.previews import claim_next_blob, process_blob, requeue_stale
+
+
+class Command(BaseCommand):
+    help = "Render thumbnails and previews for newly uploaded documents."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--poll-interval', type=float, default=5.0, help="Seconds to sleep when the queue is empty.",
+        )
+        parser.add_argument(
+            '--stale-after', type=int, default=600,
+            help="Requeue blobs that have been 'running' for longer than this many seconds.",
+        )
+        parser.add_argument(
+            '--retry', action='store_true',
+            help="Requeue blobs whose previews failed or were unsupported (e.g. after installing Pillow/pypdfium2).",
+        )
+        parser.add_argument('--once', action='store_true', help="Drain the queue once and exit.")
+
+    def handle(self, *args, **options):
+        requeued = requeue_stale(timedelta(seconds=options['stale_after']))
+        if options['retry']:
+            requeued += StoredBlob.objects.filter(preview_status__in=['failed', 'unsupported']).update(
+                preview_status='pending', preview_error="",
+            )
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} blob(s).")
+
+        self.stdout.write(self.style.SUCCESS("Preview worker started."))
+        while True:
+            blob = claim_next_blob()
+            if blob is None:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+            status = process_blob(blob)
+            message = f"{blob.name}: {status}"
+            if blob.preview_error:
+                message += f" ({blob.preview_error})"
+            self.stdout.write(message)
@@ -0,0 +1,77 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+def _init_worker():
+    # Spawned workers start from a fresh interpreter (this module is imported
+    # before Django is set up, so models are only imported inside handle())
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = "Render queued PDF report jobs in a local process pool (no external broker needed)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency', type=int,
+            default=getattr(settings, 'REPORT_WORKER_CONCURRENCY', 2),
+            help="Maximum number of reports rendered at the same time.",
+        )
+        parser.add_argument('--poll-interval', type=float, default=2.0, help="Seconds to sleep when the queue is empty.")
+        parser.add_argument(
+            '--stale-after', type=int, default=900,
+            help="Requeue jobs that have been 'running' for longer than this many seconds.",
+        )
+        parser.add_argument(
+            '--purge-interval', type=int, default=3600,
+            help="Seconds between deletions of jobs older than REPORT_JOB_RETENTION_HOURS.",
+        )
+        parser.add_argument('--once', action='store_true', help="Drain the queue once and exit.")
+
+    def handle(self, *args, **options):
+        from student.jobs import claim_next_job, mark_job_failed, purge_finished_jobs, requeue_stale_jobs, run_job
+
+        concurrency = max(1, options['concurrency'])
+        requeued = requeue_stale_jobs(timedelta(seconds=options['stale_after']))
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} stale job(s).")
+        next_purge = 0.0
+
+        running = {}
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=concurrency, mp_context=context, initializer=_init_worker) as pool:
+            self.stdout.write(self.style.SUCCESS(f"Report worker started with {concurrency} process(es)."))
+            while True:
+                if time.monotonic() >= next_purge:
+                    purged = purge_finished_jobs()
+                    if purged:
+                        self.stdout.write(f"Deleted {purged} expired job(s).")
+                    next_purge = time.monotonic() + options['purge_interval']
+
+                for future in [f for f in running if f.done()]:
+                    job_id = running.pop(future)
+                    try:
+                        status = future.result()
+                    except Exception as e:
+                        status = f"crashed ({e})"
+                        mark_job_failed(job_id, status)
+                    self.stdout.write(f"Job {job_id}: {status}")
+
+                claimed = False
+                while len(running) < concurrency:
+                    job = claim_next_job()
+                    if job is None:
+                        break
+                    claimed = True
+                    running[pool.submit(run_job, job.pk)] = job.pk
+
+                if options['once'] and not claimed and not running:
+                    break
+                if not claimed:
+                    time.sleep(options['poll_interval'] if not running else 0.2)
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from student.seeding import clear_seed, seed_college
+
+
+class Command(BaseCommand):
+    help = "Seed a synthetic college (branches, faculty, subjects, students, submissions, results, attendance)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--branches', type=int, default=4)
+        parser.add_argument('--students', type=int, default=250, help="Students per branch.")
+        parser.add_argument('--faculty', type=int, default=5, help="Faculty per branch.")
+        parser.add_argument('--subjects', type=int, default=2, help="Subjects per faculty member.")
+        parser.add_argument('--items', type=int, default=3,
+                            help="Certificates, projects and activities each per student.")
+        parser.add_argument('--semesters', type=int, default=4)
+        parser.add_argument('--attendance-days', type=int, default=90,
+                            help="Calendar days of attendance (weekdays only) ending today.")
+        parser.add_argument('--prefix', default='seed', help="Email prefix of the seeded accounts.")
+        parser.add_argument('--random-seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--clear', action='store_true', help="Delete previously seeded accounts first.")
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            deleted = clear_seed(options['prefix'])
+            self.stdout.write(f"Deleted {deleted} seeded accounts.")
+        counts = seed_college(
+            branches=options['branches'],
+            students_per_branch=options['students'],
+            faculty_per_branch=options['faculty'],
+            subjects_per_faculty=options['subjects'],
+            items_per_student=options['items'],
+            semesters=options['semesters'],
+            attendance_days=options['attendance_days'],
+            prefix=options['prefix'],
+            random_seed=options['random_seed'],
+            batch_size=options['batch_size'],
+            log=self.stdout.write,
+        )
+        for table, count in counts.items():
+            self.stdout.write(f"  {table}: {count}")
+        self.stdout.write(self.style.SUCCESS("Seeding complete."))
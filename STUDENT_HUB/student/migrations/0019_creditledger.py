@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+
+def populate_ledger(apps, schema_editor):
+    CreditLedger = apps.get_model('student', 'CreditLedger')
+    sources = {
+        'certificate': apps.get_model('student', 'Certificate'),
+        'project': apps.get_model('student', 'Projects'),
+        'activity': apps.get_model('student', 'Activities'),
+    }
+    entries = []
+    for category, Model in sources.items():
+        grouped = Model.objects.values('student_email').annotate(
+            approved_count=Count('pk', filter=Q(status='approved')),
+            pending_count=Count('pk', filter=Q(status='pending')),
+            credit_total=Coalesce(Sum('credit', filter=Q(status='approved')), 0),
+        ).order_by()
+        for row in grouped:
+            entries.append(CreditLedger(
+                student_id=row['student_email'],
+                category=category,
+                approved_count=row['approved_count'],
+                pending_count=row['pending_count'],
+                credit_total=row['credit_total'],
+            ))
+    CreditLedger.objects.bulk_create(entries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('student', '0018_alter_results_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CreditLedger',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(choices=[('certificate', 'Certificate'), ('project', 'Project'), ('activity', 'Activity')], max_length=20)),
+                ('approved_count', models.IntegerField(default=0)),
+                ('pending_count', models.IntegerField(default=0)),
+                ('credit_total', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='credit_ledger', to='student.student')),
+            ],
+            options={
+                'unique_together': {('student', 'category')},
+            },
+        ),
+        migrations.RunPython(populate_ledger, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.db.models.functions import TruncMonth
+
+
+def populate_rollups(apps, schema_editor):
+    Attendance = apps.get_model('student', 'Attendance')
+    AttendanceMonthly = apps.get_model('student', 'AttendanceMonthly')
+    grouped = Attendance.objects.annotate(month=TruncMonth('date')).values('student', 'subject', 'month').annotate(
+        total=Count('id'),
+        attended=Count('id', filter=Q(status='Present')),
+    ).order_by()
+    AttendanceMonthly.objects.bulk_create(
+        [
+            AttendanceMonthly(
+                student_id=row['student'], subject_id=row['subject'], month=row['month'],
+                total=row['total'], attended=row['attended'],
+            )
+            for row in grouped
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('student', '0020_reportjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceMonthly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('total', models.IntegerField(default=0)),
+                ('attended', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_monthly', to='student.student')),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='student.subject')),
+            ],
+            options={
+                'unique_together': {('student', 'subject', 'month')},
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
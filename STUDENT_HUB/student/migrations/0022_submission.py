@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+def populate_submissions(apps, schema_editor):
+    Submission = apps.get_model('student', 'Submission')
+    sources = {
+        'certificate': (apps.get_model('student', 'Certificate'), 'certificate_name', 'organization', 'issue_date'),
+        'project': (apps.get_model('student', 'Projects'), 'project_name', 'subject', 'date'),
+        'activity': (apps.get_model('student', 'Activities'), 'activity_name', 'subject', 'date'),
+    }
+    # Written batch by batch, so only BATCH_SIZE source rows are held in memory at a time
+    rows = []
+    for category, (Model, title_field, organization_field, date_field) in sources.items():
+        for item in Model.objects.select_related('student_email').iterator(chunk_size=BATCH_SIZE):
+            if category == 'certificate':
+                url = item.document.url if item.document else ''
+            else:
+                url = item.project_url or ''
+            rows.append(Submission(
+                category=category,
+                object_id=item.pk,
+                student_id=item.student_email_id,
+                branch=item.student_email.branch,
+                title=getattr(item, title_field),
+                organization=getattr(item, organization_field) or '',
+                activity_type=getattr(item, 'activity_type', '') or '',
+                url=url,
+                date=getattr(item, date_field),
+                submission_date=item.submission_date,
+                status=item.status,
+                credit=item.credit,
+                remark=item.remark or '',
+            ))
+            if len(rows) >= BATCH_SIZE:
+                Submission.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+                rows = []
+    if rows:
+        Submission.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('student', '0021_attendancemonthly'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Submission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(choices=[('certificate', 'Certificate'), ('project', 'Project'), ('activity', 'Activity')], max_length=20)),
+                ('object_id', models.IntegerField()),
+                ('branch', models.CharField(max_length=50)),
+                ('title', models.CharField(max_length=150)),
+                ('organization', models.CharField(blank=True, default='', max_length=200)),
+                ('activity_type', models.CharField(blank=True, default='', max_length=100)),
+                ('url', models.CharField(blank=True, default='', max_length=500)),
+                ('date', models.DateField(null=True)),
+                ('submission_date', models.DateField()),
+                ('status', models.CharField(default='pending', max_length=20)),
+                ('credit', models.IntegerField(default=0)),
+                ('remark', models.TextField(blank=True, default='')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submissions', to='student.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['branch', 'status', 'submission_date'], name='student_sub_branch_2c7ec8_idx'), models.Index(fields=['student', 'date'], name='student_sub_student_d842ab_idx')],
+                'unique_together': {('category', 'object_id')},
+            },
+        ),
+        migrations.RunPython(populate_submissions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('student', '0022_submission'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activities',
+            index=models.Index(fields=['student_email', 'status'], name='act_student_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activities',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['student_email'], name='act_pending_student_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['student', 'status'], name='attendance_student_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certificate',
+            index=models.Index(fields=['student_email', 'status'], name='cert_student_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certificate',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['student_email'], name='cert_pending_student_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projects',
+            index=models.Index(fields=['student_email', 'status'], name='proj_student_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projects',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['student_email'], name='proj_pending_student_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='results',
+            index=models.Index(fields=['student_email', '-semester'], name='results_student_sem_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['branch'], name='student_branch_idx'),
+        ),
+    ]
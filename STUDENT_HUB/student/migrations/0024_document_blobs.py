@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:55
+
+import django.utils.timezone
+import student.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('student', '0023_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='certificate',
+            name='document',
+            field=models.FileField(blank=True, null=True, storage=student.storage.document_storage, upload_to='certificates/'),
+        ),
+        migrations.AlterField(
+            model_name='results',
+            name='document',
+            field=models.FileField(blank=True, null=True, storage=student.storage.document_storage, upload_to='results/'),
+        ),
+        migrations.CreateModel(
+            name='StoredBlob',
+            fields=[
+                ('sha256', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('size', models.BigIntegerField()),
+                ('ref_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['ref_count', 'last_used'], name='student_sto_ref_cou_ddd94d_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('student', '0024_document_blobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storedblob',
+            name='preview_error',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='storedblob',
+            name='preview_format',
+            field=models.CharField(blank=True, default='', max_length=4),
+        ),
+        migrations.AddField(
+            model_name='storedblob',
+            name='preview_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='storedblob',
+            name='preview_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('unsupported', 'Unsupported'), ('failed', 'Failed')], default='pending', max_length=12),
+        ),
+        migrations.AddIndex(
+            model_name='storedblob',
+            index=models.Index(fields=['preview_status', 'created_at'], name='student_sto_preview_cd723a_idx'),
+        ),
+    ]
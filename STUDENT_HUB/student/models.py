@@ -1,6 +1,8 @@
 from django.db import models
 from django.utils import timezone
 
+from .storage import document_storage
+
 # Create your models here.
 class Student(models.Model):
     first_name = models.CharField(max_length=50)
@@ -20,6 +22,10 @@ class Student(models.Model):
     state = models.CharField(max_length=50,null=True)
     linkedin_url = models.URLField(max_length=200,null=True,blank=True)
     github_url = models.URLField(max_length=200,null=True,blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['branch'], name='student_branch_idx')]
+
     def __str__(self):
         return self.email
     
@@ -44,11 +50,19 @@ class Certificate(models.Model):
     student_email = models.ForeignKey(Student, verbose_name=("email"), on_delete=models.CASCADE, related_name='certificates')
     organization = models.CharField(max_length=150)
     issue_date = models.DateField()
-    document = models.FileField(upload_to="certificates/",null=True,blank=True)
+    document = models.FileField(upload_to="certificates/",storage=document_storage,null=True,blank=True)
     status = models.CharField(default="pending")
     credit = models.IntegerField(default=0)
     submission_date = models.DateField(auto_now_add=True)
     remark = models.TextField(max_length=500)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['student_email', 'status'], name='cert_student_status_idx'),
+            # Moderation queues only ever look at pending rows
+            models.Index(fields=['student_email'], condition=models.Q(status='pending'), name='cert_pending_student_idx'),
+        ]
+
     def __str__(self):
         return self.certificate_name
     
@@ -63,6 +77,14 @@ class Projects(models.Model):
     credit = models.IntegerField(default=0)
     submission_date = models.DateField(auto_now_add=True)
     remark = models.TextField(max_length=500)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['student_email', 'status'], name='proj_student_status_idx'),
+            # Moderation queues only ever look at pending rows
+            models.Index(fields=['student_email'], condition=models.Q(status='pending'), name='proj_pending_student_idx'),
+        ]
+
     def __str__(self):
         return self.project_name
     
@@ -78,6 +100,14 @@ class Activities(models.Model):
     credit = models.IntegerField(default=0)
     submission_date = models.DateField(auto_now_add=True)
     remark = models.TextField(max_length=500)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['student_email', 'status'], name='act_student_status_idx'),
+            # Moderation queues only ever look at pending rows
+            models.Index(fields=['student_email'], condition=models.Q(status='pending'), name='act_pending_student_idx'),
+        ]
+
     def __str__(self):
         return self.activity_name
     
@@ -87,7 +117,11 @@ class Results(models.Model):
     semester = models.IntegerField()
     sgpa = models.FloatField()
     cgpa = models.FloatField()
-    document = models.FileField(upload_to="results/",null=True,blank=True)
+    document = models.FileField(upload_to="results/",storage=document_storage,null=True,blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['student_email', '-semester'], name='results_student_sem_idx')]
+
     def __str__(self):
         return self.student_email.email + " Sem:" + str(self.semester)
     
@@ -109,6 +143,129 @@ class Attendance(models.Model):
     class Meta:
         # Ensures a student's attendance is only recorded once per subject per day
         unique_together = ('student', 'subject', 'date') 
+        indexes = [models.Index(fields=['student', 'status'], name='attendance_student_status_idx')]
     
     def _str_(self):
-        return f"{self.student.email} - {self.subject.subject_name} ({self.status}) on {self.date}"
\ No newline at end of file
+        return f"{self.student.email} - {self.subject.subject_name} ({self.status}) on {self.date}"
+
+
+class CreditLedger(models.Model):
+    # Denormalized credit totals per student and category, kept in sync by student/ledger.py
+    CATEGORY_CHOICES = [('certificate', 'Certificate'), ('project', 'Project'), ('activity', 'Activity')]
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='credit_ledger')
+    category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
+    approved_count = models.IntegerField(default=0)
+    pending_count = models.IntegerField(default=0)
+    credit_total = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('student', 'category')
+
+    def __str__(self):
+        return f"{self.student_id} - {self.category}: {self.credit_total}"
+
+
+class ReportJob(models.Model):
+    # PDF reports rendered by the run_report_worker command (see student/jobs.py)
+    KIND_CHOICES = [('cv', 'CV'), ('profile', 'Student profile'), ('naac', 'NAAC report')]
+    STATUS_CHOICES = [('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')]
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, null=True, blank=True, related_name='report_jobs')
+    params = models.JSONField(default=dict, blank=True)
+    dedup_key = models.CharField(max_length=64, db_index=True)
+    requested_by = models.EmailField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    file = models.FileField(upload_to="reports/", null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'created_at'])]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
+
+
+class AttendanceMonthly(models.Model):
+    # Attendance rolled up per student, subject and calendar month (see student/attendance_rollups.py)
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='attendance_monthly')
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE)
+    month = models.DateField()  # first day of the month
+    total = models.IntegerField(default=0)
+    attended = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('student', 'subject', 'month')
+
+    def __str__(self):
+        return f"{self.student_id} - {self.subject_id} {self.month:%b %Y}: {self.attended}/{self.total}"
+
+
+class Submission(models.Model):
+    # One row per certificate, project or activity so combined feeds are a single
+    # indexed query; kept in sync on write by student/submissions.py
+    CATEGORY_CHOICES = CreditLedger.CATEGORY_CHOICES
+    category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
+    object_id = models.IntegerField()  # pk in the Certificate / Projects / Activities table
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='submissions')
+    branch = models.CharField(max_length=50)  # copy of student.branch for the faculty feeds
+    title = models.CharField(max_length=150)
+    organization = models.CharField(max_length=200, blank=True, default="")  # issuer / subject
+    activity_type = models.CharField(max_length=100, blank=True, default="")
+    url = models.CharField(max_length=500, blank=True, default="")
+    date = models.DateField(null=True)
+    submission_date = models.DateField()
+    status = models.CharField(max_length=20, default="pending")
+    credit = models.IntegerField(default=0)
+    remark = models.TextField(blank=True, default="")
+
+    class Meta:
+        unique_together = ('category', 'object_id')
+        indexes = [
+            models.Index(fields=['branch', 'status', 'submission_date']),
+            models.Index(fields=['student', 'date']),
+        ]
+
+    def __str__(self):
+        return f"{self.category} #{self.object_id}: {self.title}"
+
+    @property
+    def description(self):
+        if self.category == 'certificate':
+            return f"Certificate issued by {self.organization}"
+        if self.category == 'project':
+            return f"Project related to {self.organization}"
+        return f"Activity type: {self.activity_type}"
+
+
+class StoredBlob(models.Model):
+    # One uploaded document body, stored once by student/storage.py and shared by
+    # every Certificate/Results row that uploaded the same bytes (see student/blobs.py)
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    name = models.CharField(max_length=255, unique=True)  # path under MEDIA_ROOT
+    size = models.BigIntegerField()
+    ref_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used = models.DateTimeField(default=timezone.now)  # last upload or reference change
+    # Downscaled previews rendered by `manage.py run_preview_worker` (see student/previews.py)
+    PREVIEW_STATUS_CHOICES = [
+        ('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'),
+        ('unsupported', 'Unsupported'), ('failed', 'Failed'),
+    ]
+    preview_status = models.CharField(max_length=12, choices=PREVIEW_STATUS_CHOICES, default='pending')
+    preview_format = models.CharField(max_length=4, blank=True, default="")  # 'webp' or 'jpg'
+    preview_started_at = models.DateTimeField(null=True, blank=True)
+    preview_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['ref_count', 'last_used']),
+            models.Index(fields=['preview_status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} refs)"
@@ -0,0 +1,150 @@
+# student/moderation.py
+"""
+Bulk approve/reject for faculty.
+
+Items are grouped by category, loaded with one query per category (restricted
+to the faculty's department), changed in memory and written back with
+bulk_update() inside one transaction. "Approve all pending" is a single
+UPDATE ... WHERE. Both paths bypass the per-row signals, so the credit
+ledger, the Submission index and the PDF/summary caches are refreshed set-wise
+here.
+"""
+from django.db import transaction
+
+from . import pdf_cache, summary_cache
+from .ledger import LEDGER_MODELS, rebuild_ledger
+from .submissions import sync_submissions
+
+ACTIONS = {'approve': 'approved', 'reject': 'rejected'}
+UPDATE_FIELDS = ['status', 'credit', 'remark']
+
+
+class ModerationError(ValueError):
+    """A bulk moderation request that cannot be applied; the message is shown to the user."""
+
+
+def _parse_credit(value):
+    """Credit points from a form/JSON value (empty means 0). Raises ModerationError."""
+    if isinstance(value, (bool, float)):
+        raise ModerationError("Credit must be a whole number.")
+    try:
+        credit = int(value or 0)
+    except (TypeError, ValueError):
+        raise ModerationError("Credit must be a whole number.")
+    if credit < 0:
+        raise ModerationError("Credit cannot be negative.")
+    return credit
+
+
+def _clean(item):
+    """Validate one requested change. Returns (change, error)."""
+    model_type = item.get('model_type')
+    action = item.get('action')
+    if not isinstance(model_type, str) or model_type not in LEDGER_MODELS:
+        return None, "Unknown model_type."
+    if not isinstance(action, str) or action not in ACTIONS:
+        return None, "Action must be 'approve' or 'reject'."
+    try:
+        pk = int(item.get('pk'))
+    except (TypeError, ValueError):
+        return None, "Invalid pk value."
+    try:
+        credit = _parse_credit(item.get('credit')) if action == 'approve' else 0
+    except ModerationError as e:
+        return None, str(e)
+    remark = item.get('remark') or ''
+    if not isinstance(remark, str):
+        return None, "Remark must be text."
+    remark = remark.strip()
+    if action == 'reject' and not remark:
+        return None, "A reason is required to reject an activity."
+    return {'model_type': model_type, 'pk': pk, 'status': ACTIONS[action], 'credit': credit, 'remark': remark}, None
+
+
+def _after_bulk_write(touched, students):
+    """Bring the derived tables in line after rows were written without signals."""
+    for category, pks in touched.items():
+        sync_submissions(category, pks)
+    if students:
+        rebuild_ledger(students=list(students))
+        transaction.on_commit(lambda: _drop_pdfs(students))
+
+
+def _drop_pdfs(students):
+    for email in students:
+        pdf_cache.invalidate_student(email)
+        summary_cache.invalidate_student(email)
+
+
+def moderate_items(faculty, items):
+    """
+    Apply a list of {'model_type', 'pk', 'action', 'credit', 'remark'} changes.
+    Items outside the faculty's department are reported as not found.
+    Returns one result dict per input item, in order.
+    """
+    results = []
+    changes = {}
+    for index, item in enumerate(items):
+        change, error = _clean(item)
+        results.append({
+            'model_type': item.get('model_type'),
+            'pk': item.get('pk'),
+            'ok': False,
+            'error': error,
+        })
+        if change:
+            # Repeated entries for the same item: the last one wins and all share its outcome
+            indices, _ = changes.setdefault(change['model_type'], {}).get(change['pk'], ([], None))
+            changes[change['model_type']][change['pk']] = (indices + [index], change)
+
+    touched = {}
+    students = set()
+    with transaction.atomic():
+        for model_type, by_pk in changes.items():
+            Model = LEDGER_MODELS[model_type]
+            objects = Model.objects.select_for_update(of=('self',)).filter(
+                pk__in=list(by_pk), student_email__branch=faculty.department,
+            ).only('pk', 'student_email', *UPDATE_FIELDS)
+            found = {obj.pk: obj for obj in objects}
+            to_update = []
+            for pk, (indices, change) in by_pk.items():
+                obj = found.get(pk)
+                if obj is None:
+                    outcome = {'error': "Not found in your department."}
+                else:
+                    obj.status, obj.credit, obj.remark = change['status'], change['credit'], change['remark']
+                    to_update.append(obj)
+                    students.add(obj.student_email_id)
+                    outcome = {'ok': True, 'status': change['status']}
+                for index in indices:
+                    results[index].update(outcome)
+            if to_update:
+                Model.objects.bulk_update(to_update, UPDATE_FIELDS, batch_size=500)
+                touched[model_type] = [obj.pk for obj in to_update]
+        _after_bulk_write(touched, students)
+
+    return results
+
+
+def approve_all_pending(faculty, model_type, credit, remark=''):
+    """
+    Approve every pending item of one type in the faculty's department.
+    Returns the number approved; raises ModerationError for an unknown type or invalid credit.
+    """
+    if not isinstance(model_type, str) or model_type not in LEDGER_MODELS:
+        raise ModerationError("Unknown model_type.")
+    credit = _parse_credit(credit)
+    if not isinstance(remark, str):
+        raise ModerationError("Remark must be text.")
+    Model = LEDGER_MODELS[model_type]
+    with transaction.atomic():
+        pending = Model.objects.select_for_update(of=('self',)).filter(
+            status='pending', student_email__branch=faculty.department,
+        )
+        rows = list(pending.values_list('pk', 'student_email'))
+        if not rows:
+            return 0
+        pks = [pk for pk, _ in rows]
+        Model.objects.filter(pk__in=pks).update(status='approved', credit=credit, remark=remark)
+        _after_bulk_write({model_type: pks}, {student for _, student in rows})
+    return len(rows)
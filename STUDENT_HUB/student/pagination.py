@@ -0,0 +1,102 @@
+# student/pagination.py
+"""
+Keyset (cursor) pagination.
+
+OFFSET pagination makes the database walk and discard every row before the
+requested page, and needs a COUNT(*) over the whole set. Here a page is
+selected with a WHERE clause on the (field, pk) of the last row already shown,
+so every page costs the same indexed range scan. Rows are ordered by `field`
+descending (NULLs last) and then pk descending.
+"""
+from django.db.models import F, Q
+from django.utils.dateparse import parse_date
+
+CURSOR_SEPARATOR = '~'
+NULL_VALUE = 'null'
+
+
+class KeysetPage:
+    """One page of rows plus the cursors for the neighbouring pages (None at either end)."""
+
+    def __init__(self, items, next_cursor=None, previous_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+
+def encode_cursor(value, pk):
+    value = NULL_VALUE if value is None else value.isoformat()
+    return f"{value}{CURSOR_SEPARATOR}{pk}"
+
+
+def decode_cursor(cursor):
+    """(date_or_None, pk) from a cursor string, or None when it is missing or malformed."""
+    if not cursor:
+        return None
+    value, _, pk = cursor.partition(CURSOR_SEPARATOR)
+    try:
+        pk = int(pk)
+        day = None if value == NULL_VALUE else parse_date(value)
+    except ValueError:
+        return None
+    if day is None and value != NULL_VALUE:
+        return None
+    return day, pk
+
+
+def _after(field, value, pk):
+    if value is None:
+        return Q(**{f"{field}__isnull": True, 'pk__lt': pk})
+    return Q(**{f"{field}__lt": value}) | Q(**{field: value, 'pk__lt': pk}) | Q(**{f"{field}__isnull": True})
+
+
+def _before(field, value, pk):
+    if value is None:
+        return Q(**{f"{field}__isnull": False}) | Q(**{f"{field}__isnull": True, 'pk__gt': pk})
+    return Q(**{f"{field}__gt": value}) | Q(**{field: value, 'pk__gt': pk})
+
+
+def keyset_page(queryset, field, after=None, before=None, per_page=10):
+    """
+    Return the KeysetPage of `queryset` that follows the `after` cursor (or
+    precedes the `before` cursor; the first page when neither is given).
+    Only per_page + 1 rows are fetched.
+    """
+    after, before = decode_cursor(after), decode_cursor(before)
+    if before is not None:
+        rows = list(queryset.filter(_before(field, *before)).order_by(
+            F(field).asc(nulls_first=True), 'pk'
+        )[:per_page + 1])
+        has_more = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        has_newer, has_older = has_more, True
+    else:
+        if after is not None:
+            queryset = queryset.filter(_after(field, *after))
+        rows = list(queryset.order_by(F(field).desc(nulls_last=True), '-pk')[:per_page + 1])
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+        has_newer, has_older = after is not None, has_more
+
+    if not rows:
+        return KeysetPage([])
+    first, last = rows[0], rows[-1]
+    return KeysetPage(
+        rows,
+        next_cursor=encode_cursor(getattr(last, field), last.pk) if has_older else None,
+        previous_cursor=encode_cursor(getattr(first, field), first.pk) if has_newer else None,
+    )
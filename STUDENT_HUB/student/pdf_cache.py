@@ -0,0 +1,206 @@
+# student/pdf_cache.py
+"""
+On-disk cache for generated CV and student profile PDFs.
+
+Files are content addressed: the name contains a hash of everything the PDF
+is drawn from (the printed student columns, approved items, latest result,
+attendance counts, the printed generation date and a per-report template
+version), so a changed input can never be served a stale file. Signal
+handlers in student/signals.py also drop a student's directory as soon as one
+of their rows changes, and the directory is kept under PDF_CACHE_MAX_BYTES by
+evicting the least recently used files. The directory is only walked when
+the running byte total says the limit may be exceeded (and every
+SCAN_INTERVAL_SECONDS), not on every miss.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .attendance_rollups import attendance_totals
+from .models import Activities, Results, Student
+from .portfolio import portfolio_stats
+
+# Bump when the drawing code in student/reports.py changes
+TEMPLATE_VERSIONS = {
+    'cv': 2,
+    'profile': 2,
+}
+
+# Student columns drawn by student/reports.py; only these go into the fingerprint
+PRINTED_STUDENT_FIELDS = ('email', 'first_name', 'last_name', 'branch', 'contact', 'linkedin_url', 'github_url')
+
+STATS_KEYS = {'hits': 'pdf_cache:hits', 'misses': 'pdf_cache:misses'}
+# Running total of cached bytes, so a miss only walks the directory when the
+# cache may be over its limit (or the total is unknown, or it is time for the
+# periodic check that corrects drift from other processes and invalidations)
+BYTES_KEY = 'pdf_cache:bytes'
+NEXT_SCAN_KEY = 'pdf_cache:next_scan'
+SCAN_INTERVAL_SECONDS = 600
+# Eviction frees space down to this share of the limit, so a full cache is not rescanned on every miss
+EVICT_TO = 0.9
+
+
+def cache_dir():
+    path = getattr(settings, 'PDF_CACHE_DIR', os.path.join(settings.BASE_DIR, 'cache', 'pdf'))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def max_cache_bytes():
+    return getattr(settings, 'PDF_CACHE_MAX_BYTES', 200 * 1024 * 1024)
+
+
+def student_key(student):
+    email = getattr(student, 'pk', student)
+    return hashlib.sha1(email.encode()).hexdigest()[:16]
+
+
+def cv_inputs(student, stats):
+    """Fingerprint inputs of the CV, taken from an already loaded PortfolioStats."""
+    return {
+        'kind': 'cv',
+        'version': TEMPLATE_VERSIONS['cv'],
+        'student': {field: getattr(student, field) for field in PRINTED_STUDENT_FIELDS},
+        'result': stats.latest_result,
+        'certificates': [
+            (cert.pk, cert.certificate_name, cert.organization, cert.issue_date) for cert in stats.certificates
+        ],
+        'projects': [(proj.pk, proj.project_name, proj.subject) for proj in stats.projects],
+        'activities': [(act.pk, act.activity_name, act.activity_type) for act in stats.activities],
+    }
+
+
+def _report_inputs(kind, student):
+    if kind == 'cv':
+        return cv_inputs(student, portfolio_stats(student))
+    student_row = Student.objects.filter(pk=student.pk).values(*PRINTED_STUDENT_FIELDS).first()
+    latest_result = Results.objects.filter(student_email=student).order_by('-semester').values(
+        'semester', 'sgpa', 'cgpa'
+    ).first()
+    inputs = {'kind': kind, 'version': TEMPLATE_VERSIONS[kind], 'student': student_row, 'result': latest_result}
+    if kind == 'profile':
+        # The profile prints its generation date, so a cached file is only reused on the same day
+        inputs['generated_on'] = timezone.localdate()
+        inputs['attendance'] = attendance_totals(student)
+        inputs['activities'] = list(Activities.objects.filter(student_email=student).order_by('-date').values(
+            'pk', 'activity_name', 'activity_type', 'date')[:4])
+    return inputs
+
+
+def fingerprint(kind, student, inputs=None):
+    if inputs is None:
+        inputs = _report_inputs(kind, student)
+    payload = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _bump(counter):
+    key = STATS_KEYS[counter]
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key evicted between add() and incr()
+        cache.set(key, 1, timeout=None)
+
+
+def get_or_render(kind, student, render, inputs=None):
+    """
+    Return an open file with the PDF for (kind, student), calling
+    `render(fileobj, student)` only on a cache miss. Callers that already
+    hold the report inputs (see cv_inputs) pass them to skip reloading them.
+    """
+    # One directory per student so invalidation never has to scan the whole cache
+    directory = os.path.join(cache_dir(), student_key(student))
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{kind}-{fingerprint(kind, student, inputs)}.pdf")
+    try:
+        pdf = open(path, 'rb')
+    except FileNotFoundError:
+        pass
+    else:
+        os.utime(path)  # mark as recently used for LRU eviction
+        _bump('hits')
+        return pdf
+
+    _bump('misses')
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            render(tmp, student)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    # Opened before eviction runs, which may remove this very file when the limit is tiny
+    pdf = open(path, 'rb')
+    _track_write(os.fstat(pdf.fileno()).st_size)
+    return pdf
+
+
+def _track_write(size):
+    try:
+        total = cache.incr(BYTES_KEY, size)
+    except ValueError:
+        total = None
+    if total is None or total > max_cache_bytes() or time.time() >= cache.get(NEXT_SCAN_KEY, 0):
+        evict(target_bytes=int(max_cache_bytes() * EVICT_TO))
+
+
+def _entries():
+    for student_dir in os.scandir(cache_dir()):
+        if not student_dir.is_dir():
+            continue
+        for entry in os.scandir(student_dir.path):
+            if entry.is_file() and entry.name.endswith('.pdf'):
+                yield entry
+
+
+def evict(max_bytes=None, target_bytes=None):
+    """
+    Scan the cache and, if it is larger than `max_bytes`, delete least recently
+    used files until it fits in `target_bytes` (default: `max_bytes`).
+    Also resets the tracked total. Returns the number of files removed.
+    """
+    max_bytes = max_cache_bytes() if max_bytes is None else max_bytes
+    target_bytes = max_bytes if target_bytes is None else min(target_bytes, max_bytes)
+    files = [(entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in _entries()]
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    if total > max_bytes:
+        for _, size, path in sorted(files):
+            if total <= target_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            removed += 1
+    cache.set(BYTES_KEY, total, timeout=None)
+    cache.set(NEXT_SCAN_KEY, time.time() + SCAN_INTERVAL_SECONDS, timeout=None)
+    return removed
+
+
+def invalidate_student(student):
+    """Remove every cached PDF for one student."""
+    shutil.rmtree(os.path.join(cache_dir(), student_key(student)), ignore_errors=True)
+
+
+def stats():
+    files = list(_entries())
+    return {
+        'hits': cache.get(STATS_KEYS['hits'], 0),
+        'misses': cache.get(STATS_KEYS['misses'], 0),
+        'entries': len(files),
+        'bytes': sum(entry.stat().st_size for entry in files),
+        'max_bytes': max_cache_bytes(),
+    }
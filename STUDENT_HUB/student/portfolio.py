@@ -0,0 +1,75 @@
+# student/portfolio.py
+"""
+Portfolio statistics.
+
+The portfolio page, its CV modal and the CV PDF all need a student's approved
+certificates, projects and activities plus the numbers derived from them.
+portfolio_stats() loads each approved list exactly once and returns an
+immutable PortfolioStats that every consumer reads from, instead of each one
+re-running counts, exists() checks and aggregates on the querysets.
+"""
+from dataclasses import dataclass
+
+from .models import Activities, Certificate, Projects
+from .summary_cache import get_summary
+
+# (minimum credits, grade), checked top to bottom
+GRADE_THRESHOLDS = ((150, "A+"), (120, "A"), (90, "B+"), (60, "B"), (1, "C"))
+
+
+def grade_for(credits):
+    for minimum, grade in GRADE_THRESHOLDS:
+        if credits >= minimum:
+            return grade
+    return "N/A"
+
+
+@dataclass(frozen=True)
+class PortfolioStats:
+    certificates: tuple
+    projects: tuple
+    activities: tuple
+    latest_result: dict = None
+
+    @property
+    def cert_count(self):
+        return len(self.certificates)
+
+    @property
+    def proj_count(self):
+        return len(self.projects)
+
+    @property
+    def activity_count(self):
+        return len(self.activities)
+
+    @property
+    def total_items(self):
+        return self.cert_count + self.proj_count + self.activity_count
+
+    @property
+    def total_credits(self):
+        return sum(item.credit for item in self.certificates + self.projects + self.activities)
+
+    @property
+    def category_count(self):
+        """Number of categories with at least one approved item."""
+        return sum(1 for items in (self.certificates, self.projects, self.activities) if items)
+
+    @property
+    def grade(self):
+        return grade_for(self.total_credits)
+
+    @property
+    def latest_cgpa(self):
+        return self.latest_result['cgpa'] if self.latest_result else 0.0
+
+
+def portfolio_stats(student):
+    """Load the student's approved items (one query per category) and latest result."""
+    return PortfolioStats(
+        certificates=tuple(Certificate.objects.filter(student_email=student, status="approved").order_by('pk')),
+        projects=tuple(Projects.objects.filter(student_email=student, status="approved").order_by('pk')),
+        activities=tuple(Activities.objects.filter(student_email=student, status="approved").order_by('pk')),
+        latest_result=get_summary(student, ['latest_result'])['latest_result'],
+    )
@@ -0,0 +1,183 @@
+# student/previews.py
+"""
+Downscaled previews of uploaded documents.
+
+For every blob in the document store (student/storage.py) the
+run_preview_worker command renders two derivatives: a small thumbnail for
+list rows and a screen-sized preview to open instead of the original upload.
+Images are decoded at reduced size where the format allows it, rotated
+according to their EXIF orientation and re-encoded as WebP (JPEG when the
+Pillow build lacks WebP); PDFs are rendered from their first page.
+
+Derivatives are stored next to the blobs under previews/<aa>/<bb>/ and named
+after the source hash, so identical uploads share them and they never go
+stale. Pillow is required for any preview and pypdfium2 for PDF previews;
+without them blobs are marked 'unsupported' and pages link to the original.
+"""
+import os
+import tempfile
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Certificate, StoredBlob
+from .storage import blob_digest
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pragma: no cover - optional dependency
+    pdfium = None
+
+PREVIEW_DIR = 'previews'
+# name -> (max width/height, encoder quality)
+PREVIEW_SIZES = {'thumbnail': ((240, 240), 70), 'preview': ((1200, 1200), 80)}
+PREVIEW_FORMATS = ('webp', 'jpg')
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp', '.tif', '.tiff'}
+PDF_EXTENSIONS = {'.pdf'}
+
+
+class UnsupportedDocument(Exception):
+    """No previews can be rendered for this kind of file (or the renderer is not installed)."""
+
+
+def _storage():
+    return Certificate._meta.get_field('document').storage
+
+
+def preview_name(digest, size, fmt):
+    return f"{PREVIEW_DIR}/{digest[:2]}/{digest[2:4]}/{digest}-{size}.{fmt}"
+
+
+def output_format():
+    return 'webp' if Image is not None and features.check('webp') else 'jpg'
+
+
+def _open_source(path, extension, longest_side):
+    """A PIL image of the document (first page for PDFs), roughly `longest_side` pixels at most."""
+    if Image is None:
+        raise UnsupportedDocument("Pillow is not installed")
+    if extension in IMAGE_EXTENSIONS:
+        image = Image.open(path)
+        # JPEG can decode at 1/2, 1/4 or 1/8 scale directly, which is far cheaper for phone photos
+        image.draft('RGB', (longest_side, longest_side))
+        return ImageOps.exif_transpose(image)
+    if extension in PDF_EXTENSIONS:
+        if pdfium is None:
+            raise UnsupportedDocument("pypdfium2 is not installed")
+        document = pdfium.PdfDocument(path)
+        try:
+            page = document[0]
+            scale = longest_side / max(page.get_size())
+            # convert() copies the pixels out of the bitmap before the document is closed
+            return page.render(scale=scale).to_pil().convert('RGB')
+        finally:
+            document.close()
+    raise UnsupportedDocument(f"No preview for {extension or 'files without an extension'}")
+
+
+def _write_image(image, path, fmt, quality):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            if fmt == 'webp':
+                image.save(tmp, 'WEBP', quality=quality, method=4)
+            else:
+                image.save(tmp, 'JPEG', quality=quality, optimize=True, progressive=True)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def render_previews(blob):
+    """Write the derivatives of one blob (skipping any already on disk) and return their format."""
+    storage = _storage()
+    fmt = output_format()
+    paths = {size: storage.path(preview_name(blob.sha256, size, fmt)) for size in PREVIEW_SIZES}
+    if all(os.path.exists(path) for path in paths.values()):
+        return fmt
+
+    extension = os.path.splitext(blob.name)[1].lower()
+    largest = max(bounds[0] for bounds, _ in PREVIEW_SIZES.values())
+    with _open_source(storage.path(blob.name), extension, largest) as source:
+        source = source.convert('RGB')
+        # Largest first, so each smaller size is resampled from an already reduced image
+        for size, ((width, height), quality) in sorted(PREVIEW_SIZES.items(), key=lambda item: -item[1][0][0]):
+            source.thumbnail((width, height), Image.LANCZOS)
+            _write_image(source, paths[size], fmt, quality)
+    return fmt
+
+
+def claim_next_blob():
+    """Mark the oldest blob waiting for previews as running and return it (None if there is none)."""
+    with transaction.atomic():
+        blob = StoredBlob.objects.select_for_update(skip_locked=True).filter(
+            preview_status='pending'
+        ).order_by('created_at', 'pk').first()
+        if blob is None:
+            return None
+        blob.preview_status = 'running'
+        blob.preview_started_at = timezone.now()
+        blob.save(update_fields=['preview_status', 'preview_started_at'])
+    return blob
+
+
+def requeue_stale(older_than):
+    """Put blobs left 'running' by a worker that died back in the queue."""
+    return StoredBlob.objects.filter(
+        preview_status='running', preview_started_at__lt=timezone.now() - older_than
+    ).update(preview_status='pending', preview_started_at=None)
+
+
+def process_blob(blob):
+    """Render one claimed blob and record the outcome. Returns the new preview_status."""
+    try:
+        blob.preview_format = render_previews(blob)
+        blob.preview_status, blob.preview_error = 'done', ""
+    except UnsupportedDocument as e:
+        blob.preview_status, blob.preview_error = 'unsupported', str(e)
+    except Exception as e:
+        blob.preview_status, blob.preview_error = 'failed', str(e)
+    blob.save(update_fields=['preview_format', 'preview_status', 'preview_error'])
+    return blob.preview_status
+
+
+def remove_previews(digest):
+    storage = _storage()
+    for size in PREVIEW_SIZES:
+        for fmt in PREVIEW_FORMATS:
+            try:
+                os.remove(storage.path(preview_name(digest, size, fmt)))
+            except FileNotFoundError:
+                pass
+
+
+def preview_urls(digests):
+    """{digest: {'thumbnail': url, 'preview': url}} for the given blobs that have previews."""
+    storage = _storage()
+    rows = StoredBlob.objects.filter(sha256__in=set(digests), preview_status='done').values_list(
+        'sha256', 'preview_format'
+    )
+    return {
+        digest: {size: storage.url(preview_name(digest, size, fmt)) for size in PREVIEW_SIZES}
+        for digest, fmt in rows
+    }
+
+
+def attach_previews(submissions):
+    """Set `thumbnail_url` and `preview_url` (None without previews) on Submission rows, in one query."""
+    digests = [(submission, blob_digest(submission.url)) for submission in submissions]
+    wanted = [digest for _, digest in digests if digest]
+    urls = preview_urls(wanted) if wanted else {}
+    for submission, digest in digests:
+        found = urls.get(digest, {})
+        submission.thumbnail_url = found.get('thumbnail')
+        submission.preview_url = found.get('preview')
+    return submissions
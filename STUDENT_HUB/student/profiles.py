@@ -0,0 +1,141 @@
+# student/profiles.py
+"""
+Student profile payloads for the faculty profile modal.
+
+build_profiles() returns the profile of many students at once, restricted to
+the sections the caller asks for. Every section is one grouped query across
+all requested students (values() only, no model instances), so a batch of N
+profiles costs the same number of queries as a single one.
+
+profile_etag() hashes the built payload itself, so the ETag changes exactly
+when the returned data does, whichever process answers and whatever the
+cache holds. A 304 still runs the section queries but skips sending the
+body, which is most of the cost of reopening a profile on a slow connection.
+"""
+import hashlib
+import json
+from collections import defaultdict
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import OuterRef, Subquery
+
+from .attendance_rollups import attendance_totals_for
+from .models import Activities, Certificate, Projects, Results, Student
+
+PROFILE_FIELDS = ('profile', 'cgpa', 'attendance', 'activities', 'certificates', 'projects')
+MAX_PROFILES = 50
+# Bump when the shape of a section changes
+PROFILE_VERSION = 1
+
+STUDENT_COLUMNS = (
+    'email', 'first_name', 'last_name', 'branch', 'contact', 'linkedin_url', 'github_url', 'College_name', 'session',
+)
+
+
+class ProfileRequestError(ValueError):
+    pass
+
+
+def parse_fields(value):
+    """Requested sections from a comma separated `fields=` value (all when empty)."""
+    if not value:
+        return PROFILE_FIELDS
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = sorted(set(fields) - set(PROFILE_FIELDS))
+    if unknown:
+        raise ProfileRequestError(f"Unknown fields: {', '.join(unknown)}")
+    # Canonical order, so equivalent requests share an ETag
+    return tuple(field for field in PROFILE_FIELDS if field in fields)
+
+
+def parse_emails(values):
+    """Unique emails, in request order, from repeated and/or comma separated values."""
+    emails = []
+    for value in values:
+        for email in value.split(','):
+            email = email.strip()
+            if email and email not in emails:
+                emails.append(email)
+    if not emails:
+        raise ProfileRequestError("No email provided")
+    if len(emails) > MAX_PROFILES:
+        raise ProfileRequestError(f"At most {MAX_PROFILES} profiles per request")
+    return emails
+
+
+def profile_etag(payload, scope=''):
+    """Weak ETag of a profile response body; `scope` covers anything else the response depends on."""
+    body = json.dumps(payload, cls=DjangoJSONEncoder, sort_keys=True)
+    key = f"{PROFILE_VERSION}|{scope}|{body}"
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+
+def _group(rows, key='student_email'):
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[row.pop(key)].append(row)
+    return grouped
+
+
+def build_profiles(emails, fields=PROFILE_FIELDS, branch=None):
+    """
+    {email: profile} for the students found among `emails` (in request order),
+    each holding only the requested sections. `branch` limits the lookup to
+    one department.
+    """
+    students = Student.objects.filter(email__in=emails)
+    columns = STUDENT_COLUMNS
+    if branch is not None:
+        students = students.filter(branch=branch)
+    if 'cgpa' in fields:
+        students = students.annotate(latest_cgpa=Subquery(
+            Results.objects.filter(student_email=OuterRef('pk')).order_by('-semester').values('cgpa')[:1]
+        ))
+        columns += ('latest_cgpa',)
+    rows = {row['email']: row for row in students.values(*columns)}
+    found = [email for email in emails if email in rows]
+    if not found:
+        return {}
+
+    attendance = attendance_totals_for(found) if 'attendance' in fields else {}
+    activities = _group(Activities.objects.filter(student_email__in=found).order_by('-date', '-pk').values(
+        'student_email', 'activity_name', 'activity_type', 'date')) if 'activities' in fields else {}
+    certificates = _group(Certificate.objects.filter(student_email__in=found, status='approved').order_by(
+        '-issue_date', '-pk').values('student_email', 'certificate_name', 'organization', 'issue_date')
+    ) if 'certificates' in fields else {}
+    projects = _group(Projects.objects.filter(student_email__in=found, status='approved').order_by(
+        '-date', '-pk').values('student_email', 'project_name', 'subject', 'date')) if 'projects' in fields else {}
+
+    profiles = {}
+    for email in found:
+        row = rows[email]
+        profile = {'email': email}
+        if 'profile' in fields:
+            last_name = row['last_name'] or ''
+            profile.update({
+                'name': f"{row['first_name']} {last_name}",
+                'initials': f"{row['first_name'][:1]}{last_name[:1]}",
+                'department': row['branch'],
+                'contact': row['contact'],
+                'linkedin': row['linkedin_url'] or "",
+                'github': row['github_url'] or "",
+                'college': row['College_name'],
+                'session': row['session'],
+            })
+        if 'cgpa' in fields:
+            profile['cgpa'] = row['latest_cgpa'] if row['latest_cgpa'] is not None else 0.0
+        if 'attendance' in fields:
+            totals = attendance.get(email, {'total': 0, 'attended': 0, 'percent': 0})
+            profile.update({
+                'attendance': totals['percent'],
+                'attended_classes': totals['attended'],
+                'total_classes': totals['total'],
+            })
+        if 'activities' in fields:
+            profile['activities'] = activities.get(email, [])
+        if 'certificates' in fields:
+            profile['certificates'] = certificates.get(email, [])
+        if 'projects' in fields:
+            profile['projects'] = projects.get(email, [])
+        profiles[email] = profile
+    return profiles
@@ -0,0 +1,66 @@
+# student/ranking.py
+"""
+Class standing for the scoreboard.
+
+Each student's approved credits come from a per-student subquery over the
+CreditLedger, so the certificate/project/activity joins can no longer fan out
+and double count. RANK(), COUNT() and AVG() run as window functions over the
+whole class and only the caller's row is returned by the database.
+"""
+from django.db.models import Avg, Case, Count, F, IntegerField, Max, OuterRef, Subquery, Sum, Value, When, Window
+from django.db.models.functions import Coalesce, Rank
+
+from .models import CreditLedger, Student
+
+
+def credits_subquery():
+    """Approved credits for the student in the outer query (0 if no ledger rows)."""
+    per_student = CreditLedger.objects.filter(student=OuterRef('pk')).values('student').annotate(
+        total=Sum('credit_total')
+    ).values('total')
+    return Coalesce(Subquery(per_student, output_field=IntegerField()), Value(0))
+
+
+def class_standing(student):
+    """
+    Return {'rank', 'total_students', 'class_avg_credits', 'rank_top_percent',
+    'total_credits'} for one student using a single query.
+    """
+    student_id = getattr(student, 'pk', student)
+
+    row = Student.objects.annotate(
+        total_credits=credits_subquery(),
+    ).annotate(
+        class_rank=Window(Rank(), order_by=F('total_credits').desc()),
+        # No partition: counted and averaged over every student
+        total_students=Window(Count('pk')),
+        class_avg_credits=Window(Avg('total_credits')),
+        # A window over a single-row partition; filtering on it is applied after
+        # the ranking (QUALIFY), whereas filtering on email directly would shrink
+        # the class to one row before RANK() runs.
+        is_caller=Window(
+            Max(Case(When(pk=student_id, then=Value(1)), default=Value(0), output_field=IntegerField())),
+            partition_by=F('pk'),
+        ),
+    ).filter(is_caller=1).values('total_credits', 'class_rank', 'total_students', 'class_avg_credits').first()
+
+    if row is None:
+        return {
+            'rank': 0,
+            'total_students': Student.objects.count(),
+            'class_avg_credits': 0.0,
+            'rank_top_percent': 0,
+            'total_credits': 0,
+        }
+
+    total_students = row['total_students']
+    rank = row['class_rank']
+    # Top % means: what percent of students have less or equal credits than this student
+    rank_top_percent = ((total_students - rank + 1) / total_students) * 100 if total_students > 0 else 0
+    return {
+        'rank': rank,
+        'total_students': total_students,
+        'class_avg_credits': float(row['class_avg_credits'] or 0.0),
+        'rank_top_percent': rank_top_percent,
+        'total_credits': row['total_credits'],
+    }
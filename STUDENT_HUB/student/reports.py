@@ -0,0 +1,360 @@
+# student/reports.py
+"""
+PDF report rendering.
+
+The functions here draw onto a ReportLab canvas bound to a file object, so the
+same code can write into a temporary file for a download response.
+"""
+import tempfile
+
+from django.db.models import Prefetch
+from django.utils import timezone
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfgen import canvas
+
+from .attendance_rollups import attendance_totals
+from .models import Activities, Certificate, Projects, Results, Student
+from .portfolio import portfolio_stats
+
+# Students fetched per round-trip (plus one prefetch query per category per chunk)
+NAAC_CHUNK_SIZE = 500
+
+
+def naac_students(branch=None, session=None, date_from=None, date_to=None):
+    """
+    Students for the NAAC report with their approved items prefetched into
+    `naac_certificates`, `naac_projects` and `naac_activities`.
+    The date range applies to the certificate issue date and project/activity date.
+    """
+    certs = Certificate.objects.filter(status="approved").order_by('issue_date', 'pk')
+    projects = Projects.objects.filter(status="approved").order_by('date', 'pk')
+    acts = Activities.objects.filter(status="approved").order_by('date', 'pk')
+    if date_from:
+        certs = certs.filter(issue_date__gte=date_from)
+        projects = projects.filter(date__gte=date_from)
+        acts = acts.filter(date__gte=date_from)
+    if date_to:
+        certs = certs.filter(issue_date__lte=date_to)
+        projects = projects.filter(date__lte=date_to)
+        acts = acts.filter(date__lte=date_to)
+
+    students = Student.objects.all()
+    if branch:
+        students = students.filter(branch=branch)
+    if session:
+        students = students.filter(session=session)
+    return students.order_by('branch', 'first_name', 'email').prefetch_related(
+        Prefetch('certificates', queryset=certs, to_attr='naac_certificates'),
+        Prefetch('projects', queryset=projects, to_attr='naac_projects'),
+        Prefetch('activities', queryset=acts, to_attr='naac_activities'),
+    )
+
+
+def render_naac_report(fileobj, students, chunk_size=NAAC_CHUNK_SIZE):
+    """Draw the NAAC report for `students` (see naac_students) into `fileobj`."""
+    p = canvas.Canvas(fileobj, pagesize=letter, pageCompression=1)
+    width, height = letter
+    y = height - inch
+
+    p.setFont("Helvetica-Bold", 22)
+    p.setFillColorRGB(0.1,0.2,0.4)
+    p.drawString(inch, y, "NAAC Report - Approved Items")
+    y -= 0.45 * inch
+    p.setStrokeColorRGB(0.15,0.15,0.5)
+    p.setLineWidth(2)
+    p.line(inch, y, width-inch, y)
+    y -= 0.35 * inch
+
+    # iterator() keeps only one chunk of students (and their prefetched items) in memory
+    for student in students.iterator(chunk_size=chunk_size):
+        p.setFont("Helvetica-Bold", 16)
+        p.setFillColorRGB(0,0,0)
+        p.drawString(inch, y, f"{student.first_name} {student.last_name} ({student.branch})")
+        y -= 0.22 * inch
+        p.setFont("Helvetica", 12)
+        p.drawString(inch, y, f"Email: {student.email} | Phone: {student.contact}")
+        y -= 0.22 * inch
+
+        # Certificates
+        if student.naac_certificates:
+            p.setFont("Helvetica-Bold", 13)
+            p.drawString(inch, y, "Certificates:")
+            y -= 0.18 * inch
+            p.setFont("Helvetica", 11)
+            for cert in student.naac_certificates:
+                p.drawString(inch+0.2*inch, y, f"{cert.certificate_name} from {cert.organization} ({cert.issue_date.year})")
+                y -= 0.16 * inch
+                if y < inch:
+                    p.showPage(); y = height - inch
+            y -= 0.12 * inch
+
+        # Projects
+        if student.naac_projects:
+            p.setFont("Helvetica-Bold", 13)
+            p.drawString(inch, y, "Projects:")
+            y -= 0.18 * inch
+            p.setFont("Helvetica", 11)
+            for proj in student.naac_projects:
+                p.drawString(inch+0.2*inch, y, f"{proj.project_name} - Subject: {proj.subject}")
+                y -= 0.16 * inch
+                if y < inch:
+                    p.showPage(); y = height - inch
+            y -= 0.12 * inch
+
+        # Activities
+        if student.naac_activities:
+            p.setFont("Helvetica-Bold", 13)
+            p.drawString(inch, y, "Activities:")
+            y -= 0.18 * inch
+            p.setFont("Helvetica", 11)
+            for act in student.naac_activities:
+                p.drawString(inch+0.2*inch, y, f"{act.activity_name} - Type: {act.activity_type}")
+                y -= 0.16 * inch
+                if y < inch:
+                    p.showPage(); y = height - inch
+            y -= 0.12 * inch
+
+        # Separator line between students
+        p.setStrokeColorRGB(0.7,0.7,0.7)
+        p.setLineWidth(1)
+        p.line(inch, y, width-inch, y)
+        y -= 0.22 * inch
+        if y < inch:
+            p.showPage(); y = height - inch
+
+    p.save()
+
+
+def render_student_profile_pdf(fileobj, student):
+    """Draw the one-page student report opened from the faculty profile modal."""
+    attendance = attendance_totals(student)
+    attended_classes = attendance['attended']
+    total_classes = attendance['total']
+    attendance_percent = attendance['percent']
+    activities = Activities.objects.filter(student_email=student).order_by('-date')[:4]
+    latest_result = Results.objects.filter(student_email=student).order_by('-semester').first()
+    cgpa = latest_result.cgpa if latest_result else 0.0
+    linkedin = student.linkedin_url or "N/A"
+    github = student.github_url or "N/A"
+
+    p = canvas.Canvas(fileobj, pagesize=letter)
+    width, height = letter
+    y = height - 50
+
+    # Title and date. Date only: the PDF cache (student/pdf_cache.py) keeps a rendered file for the day
+    p.setFont("Helvetica-Bold", 26)
+    p.setFillColorRGB(0.1,0.2,0.4)
+    p.drawString(50, y, "Student Report")
+    p.setFont("Helvetica", 12)
+    p.setFillColorRGB(0.2,0.2,0.2)
+    p.drawRightString(width-50, y, f"Generated: {timezone.localdate().strftime('%d-%m-%Y')}")
+    y -= 40
+
+    # Student Info Card
+    p.setFillColorRGB(0.23,0.51,0.96)
+    p.setFont("Helvetica-Bold", 20)
+    p.drawString(50, y, f"{student.first_name} {student.last_name}")
+    p.setFont("Helvetica", 14)
+    p.setFillColorRGB(0,0,0)
+    y -= 28
+    p.drawString(50, y, f"{student.branch} Engineering")
+    y -= 20
+    p.setFont("Helvetica", 12)
+    p.drawString(50, y, f"Email: {student.email}")
+    y -= 16
+    p.drawString(50, y, f"Phone: {student.contact}")
+    y -= 16
+    p.drawString(50, y, f"CGPA: {cgpa}")
+    y -= 16
+    p.drawString(50, y, f"LinkedIn: {linkedin}")
+    y -= 16
+    p.drawString(50, y, f"GitHub: {github}")
+
+    # Divider
+    y -= 18
+    p.setStrokeColorRGB(0.7,0.7,0.7)
+    p.setLineWidth(1)
+    p.line(50, y, width-50, y)
+    y -= 28
+
+    # Attendance Overview
+    p.setFont("Helvetica-Bold", 15)
+    p.setFillColorRGB(0.12,0.16,0.68)
+    p.drawString(50, y, "Attendance Overview")
+    p.setFont("Helvetica", 12)
+    p.setFillColorRGB(0,0,0)
+    y -= 20
+    p.drawString(60, y, f"Overall Attendance: {attendance_percent}%")
+    y -= 16
+    p.drawString(60, y, f"Classes Attended: {attended_classes} of {total_classes}")
+    y -= 16
+    p.drawString(60, y, f"Active Subjects: 4")
+
+    # Divider
+    y -= 18
+    p.setStrokeColorRGB(0.7,0.7,0.7)
+    p.setLineWidth(1)
+    p.line(50, y, width-50, y)
+    y -= 28
+
+    # Recent Activities
+    p.setFont("Helvetica-Bold", 15)
+    p.setFillColorRGB(0.12,0.16,0.68)
+    p.drawString(50, y, "Recent Activities")
+    p.setFont("Helvetica", 12)
+    p.setFillColorRGB(0,0,0)
+    y -= 20
+    for act in activities:
+        p.setFont("Helvetica-Bold", 12)
+        p.drawString(60, y, f"{act.activity_name}")
+        y -= 14
+        p.setFont("Helvetica", 12)
+        p.drawString(80, y, f"{act.activity_type} • {act.date}")
+        y -= 18
+        if y < 100:
+            p.showPage()
+            y = height - 50
+
+    p.showPage()
+    p.save()
+
+
+def profile_report_filename(student):
+    safe_name = f"{student.first_name}_{student.last_name}_report".replace(" ", "_")
+    return f"{safe_name}.pdf"
+
+
+def render_cv_pdf(fileobj, student, stats=None):
+    """Draw the student's CV (approved items only) from its PortfolioStats."""
+    stats = stats or portfolio_stats(student)
+    certs, projects, activities = stats.certificates, stats.projects, stats.activities
+
+    p = canvas.Canvas(fileobj, pagesize=letter)
+    width, height = letter
+    y = height - inch
+
+    # Professional Header
+    # Professional Header (no time/date)
+    p.setFont("Helvetica-Bold", 26)
+    p.setFillColorRGB(0.1,0.2,0.4)
+    p.drawString(inch, y, "Curriculum Vitae")
+    y -= 0.45 * inch
+    p.setStrokeColorRGB(0.15,0.15,0.5)
+    p.setLineWidth(2)
+    p.line(inch, y, width-inch, y)
+    y -= 0.35 * inch
+
+    # Name & Contact
+    p.setFont("Helvetica-Bold", 18)
+    p.setFillColorRGB(0,0,0)
+    p.drawString(inch, y, f"{student.first_name} {student.last_name}")
+    p.setFont("Helvetica", 13)
+    p.drawString(inch, y-0.22*inch, f"{student.branch}")
+    p.setFont("Helvetica", 12)
+    p.drawString(inch, y-0.38*inch, f"Email: {student.email} | Phone: {student.contact}")
+    y -= 0.7 * inch
+    p.setStrokeColorRGB(0.7,0.7,0.7)
+    p.setLineWidth(1)
+    p.line(inch, y, width-inch, y)
+    y -= 0.25 * inch
+
+    # Section: Education
+    p.setFont("Helvetica-Bold", 15)
+    p.setFillColorRGB(0.1,0.2,0.4)
+    p.drawString(inch, y, "Education")
+    p.setFillColorRGB(0,0,0)
+    y -= 0.22 * inch
+    p.setFont("Helvetica", 12)
+    p.drawString(inch+0.2*inch, y, f"Bachelor of Technology in {student.branch}")
+    y -= 0.17 * inch
+    p.drawString(inch+0.2*inch, y, f"{getattr(student, 'College_name', '')} | Session: {getattr(student, 'session', '')} | CGPA: {stats.latest_cgpa:.2f}")
+    y -= 0.25 * inch
+    p.setStrokeColorRGB(0.85,0.85,0.85)
+    p.setLineWidth(1)
+    p.line(inch, y, width-inch, y)
+    y -= 0.22 * inch
+
+    # Section: Certifications
+    if certs:
+        p.setFont("Helvetica-Bold", 15)
+        p.setFillColorRGB(0.1,0.2,0.4)
+        p.drawString(inch, y, "Certifications")
+        p.setFillColorRGB(0,0,0)
+        y -= 0.22 * inch
+        p.setFont("Helvetica", 12)
+        for cert in certs:
+            p.drawString(inch+0.2*inch, y, f"{cert.certificate_name} from {cert.organization} ({cert.issue_date.year})")
+            y -= 0.17 * inch
+            if y < inch:
+                p.showPage(); y = height - inch
+        y -= 0.22 * inch
+        p.setStrokeColorRGB(0.85,0.85,0.85)
+        p.setLineWidth(1)
+        p.line(inch, y, width-inch, y)
+        y -= 0.22 * inch
+
+    # Section: Projects
+    if projects:
+        p.setFont("Helvetica-Bold", 15)
+        p.setFillColorRGB(0.1,0.2,0.4)
+        p.drawString(inch, y, "Projects")
+        p.setFillColorRGB(0,0,0)
+        y -= 0.22 * inch
+        p.setFont("Helvetica", 12)
+        for proj in projects:
+            p.drawString(inch+0.2*inch, y, f"{proj.project_name} - Subject: {proj.subject}")
+            y -= 0.17 * inch
+            if y < inch:
+                p.showPage(); y = height - inch
+        y -= 0.22 * inch
+        p.setStrokeColorRGB(0.85,0.85,0.85)
+        p.setLineWidth(1)
+        p.line(inch, y, width-inch, y)
+        y -= 0.22 * inch
+
+    # Section: Activities
+    if activities:
+        p.setFont("Helvetica-Bold", 15)
+        p.setFillColorRGB(0.1,0.2,0.4)
+        p.drawString(inch, y, "Activities & Accomplishments")
+        p.setFillColorRGB(0,0,0)
+        y -= 0.22 * inch
+        p.setFont("Helvetica", 12)
+        for act in activities:
+            p.drawString(inch+0.2*inch, y, f"{act.activity_name} - Type: {act.activity_type}")
+            y -= 0.17 * inch
+            if y < inch:
+                p.showPage(); y = height - inch
+        y -= 0.22 * inch
+        p.setStrokeColorRGB(0.85,0.85,0.85)
+        p.setLineWidth(1)
+        p.line(inch, y, width-inch, y)
+        y -= 0.22 * inch
+
+    # Section: Technical Skills
+    p.setFont("Helvetica-Bold", 15)
+    p.setFillColorRGB(0.1,0.2,0.4)
+    p.drawString(inch, y, "Technical Skills")
+    p.setFillColorRGB(0,0,0)
+    y -= 0.22 * inch
+    p.setFont("Helvetica", 12)
+    p.drawString(inch+0.2*inch, y, "Programming Languages: Python, Java, HTML/CSS, etc.")
+    y -= 0.35 * inch
+
+    p.save()
+
+
+def render_to_tempfile(render, *args, **kwargs):
+    """
+    Run `render(fileobj, ...)` against an anonymous temporary file and return it
+    rewound. The file is removed once closed (FileResponse closes it when done).
+    """
+    tmp = tempfile.TemporaryFile(suffix=".pdf")
+    try:
+        render(tmp, *args, **kwargs)
+    except Exception:
+        tmp.close()
+        raise
+    tmp.seek(0)
+    return tmp
@@ -0,0 +1,162 @@
+# student/seeding.py
+"""
+Synthetic college data for benchmarks and query-plan checks.
+
+Everything is written with bulk_create in batches, so signals do not fire;
+the derived tables (credit ledger, Submission index, attendance rollups) are
+rebuilt at the end instead. Seeded accounts share an email prefix so they can
+be removed again with clear_seed().
+"""
+import random
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import summary_cache
+from .attendance_rollups import rebuild_monthly
+from .ledger import rebuild_ledger
+from .models import Activities, Attendance, Certificate, Faculty, Projects, Results, Student, Subject
+from .submissions import rebuild_submissions
+
+BRANCH_NAMES = ['CSE', 'ECE', 'ME', 'CE', 'EE', 'IT', 'CHE', 'BT']
+STATUS_WEIGHTS = (('approved', 55), ('pending', 30), ('rejected', 15))
+EMAIL_DOMAIN = 'example.edu'
+
+
+def branch_names(count):
+    return [BRANCH_NAMES[i] if i < len(BRANCH_NAMES) else f"BR{i + 1}" for i in range(count)]
+
+
+def _email(prefix, kind, n):
+    return f"{prefix}.{kind}{n}@{EMAIL_DOMAIN}"
+
+
+def _batched(rows, batch_size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert(Model, rows, batch_size):
+    written = 0
+    for batch in _batched(rows, batch_size):
+        Model.objects.bulk_create(batch, batch_size=batch_size)
+        written += len(batch)
+    return written
+
+
+def clear_seed(prefix='seed'):
+    """Delete every seeded student and faculty member (and, by cascade, their rows)."""
+    students, _ = Student.objects.filter(email__startswith=f"{prefix}.").delete()
+    faculty, _ = Faculty.objects.filter(email__startswith=f"{prefix}.").delete()
+    return students + faculty
+
+
+def seed_college(branches=4, students_per_branch=250, faculty_per_branch=5, subjects_per_faculty=2,
+                 items_per_student=3, semesters=4, attendance_days=90, prefix='seed', random_seed=42,
+                 batch_size=5000, rebuild_derived=True, log=None):
+    """
+    Seed a synthetic college and return {table name: rows written}.
+
+    Every student gets `items_per_student` certificates, projects and
+    activities each, one Results row per semester, and attendance for every
+    subject of their branch on each weekday of the last `attendance_days` days.
+    """
+    rng = random.Random(random_seed)
+    log = log or (lambda message: None)
+    today = timezone.now().date()
+    statuses = [status for status, _ in STATUS_WEIGHTS]
+    weights = [weight for _, weight in STATUS_WEIGHTS]
+    counts = {}
+
+    def pick_status():
+        return rng.choices(statuses, weights)[0]
+
+    def past_day(max_days=365):
+        return today - timedelta(days=rng.randrange(max_days))
+
+    with transaction.atomic():
+        names = branch_names(branches)
+        faculty = [
+            Faculty(
+                first_name=f"Faculty{n}", last_name=branch, email=_email(prefix, 'f', n), password='seed',
+                gender=rng.choice(['Male', 'Female']), contact='9000000000', department=branch,
+            )
+            for n, branch in enumerate(name for name in names for _ in range(faculty_per_branch))
+        ]
+        counts['faculty'] = _insert(Faculty, faculty, batch_size)
+
+        subjects = [
+            Subject(subject_code=f"{member.department}{n:03d}", subject_name=f"{member.department} Subject {n}",
+                    faculty=member)
+            for n, member in enumerate(member for member in faculty for _ in range(subjects_per_faculty))
+        ]
+        counts['subjects'] = _insert(Subject, subjects, batch_size)
+        subjects_by_branch = {}
+        for subject in Subject.objects.filter(faculty__email__startswith=f"{prefix}.").select_related('faculty'):
+            subjects_by_branch.setdefault(subject.faculty.department, []).append(subject.pk)
+
+        students = [
+            Student(
+                first_name=f"Student{n}", last_name=branch, email=_email(prefix, 's', n), password='seed',
+                gender=rng.choice(['Male', 'Female']), roll_no=f"{branch}{n:06d}", contact='9000000000',
+                branch=branch, session='2024-2028', degree='B.Tech',
+            )
+            for n, branch in enumerate(name for name in names for _ in range(students_per_branch))
+        ]
+        counts['students'] = _insert(Student, students, batch_size)
+        log(f"Seeded {counts['students']} students in {branches} branches")
+
+        counts['certificates'] = _insert(Certificate, (
+            Certificate(certificate_name=f"Certificate {i}", student_email_id=student.email,
+                        organization=rng.choice(['Coursera', 'NPTEL', 'Udemy', 'IEEE']), issue_date=past_day(),
+                        status=pick_status(), credit=rng.randrange(0, 10), remark='')
+            for student in students for i in range(items_per_student)
+        ), batch_size)
+        counts['projects'] = _insert(Projects, (
+            Projects(project_name=f"Project {i}", student_email_id=student.email, subject='Engineering',
+                     date=past_day(), project_url='https://example.edu/project', status=pick_status(),
+                     credit=rng.randrange(0, 10), remark='')
+            for student in students for i in range(items_per_student)
+        ), batch_size)
+        counts['activities'] = _insert(Activities, (
+            Activities(activity_name=f"Activity {i}", student_email_id=student.email, subject='Extra-curricular',
+                       activity_type=rng.choice(['Workshop', 'Hackathon', 'Sports', 'Volunteering']),
+                       date=past_day(), status=pick_status(), credit=rng.randrange(0, 10), remark='')
+            for student in students for i in range(items_per_student)
+        ), batch_size)
+        log("Seeded certificates, projects and activities")
+
+        counts['results'] = _insert(Results, (
+            Results(student_email_id=student.email, semester=semester,
+                    sgpa=round(rng.uniform(5, 10), 2), cgpa=round(rng.uniform(5, 10), 2))
+            for student in students for semester in range(1, semesters + 1)
+        ), batch_size)
+
+        class_days = [
+            today - timedelta(days=offset) for offset in range(attendance_days)
+            if (today - timedelta(days=offset)).weekday() < 5
+        ]
+        counts['attendance'] = _insert(Attendance, (
+            Attendance(student_id=student.email, subject_id=subject_id, date=day,
+                       status='Present' if rng.random() < 0.8 else 'Absent')
+            for student in students
+            for subject_id in subjects_by_branch.get(student.branch, [])
+            for day in class_days
+        ), batch_size)
+        log(f"Seeded {counts['attendance']} attendance rows")
+
+        if rebuild_derived:
+            seeded = Student.objects.filter(email__startswith=f"{prefix}.")
+            rebuild_ledger(students=seeded)
+            counts['submissions'] = rebuild_submissions(students=seeded)
+            counts['attendance_monthly'] = rebuild_monthly(students=seeded)
+            transaction.on_commit(summary_cache.invalidate_all)
+            log("Rebuilt credit ledger, submission index and attendance rollups")
+    return counts
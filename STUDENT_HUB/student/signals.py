@@ -0,0 +1,150 @@
+# student/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import attendance_rollups, blobs, ledger, pdf_cache, submissions, summary_cache
+from .models import Activities, Attendance, Certificate, Faculty, Projects, Results, Student
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+def drop_student_pdfs(sender, instance, **kwargs):
+    pdf_cache.invalidate_student(instance.pk)
+
+
+@receiver(post_save, sender=Certificate)
+@receiver(post_delete, sender=Certificate)
+@receiver(post_save, sender=Projects)
+@receiver(post_delete, sender=Projects)
+@receiver(post_save, sender=Activities)
+@receiver(post_delete, sender=Activities)
+@receiver(post_save, sender=Results)
+@receiver(post_delete, sender=Results)
+def drop_item_owner_pdfs(sender, instance, **kwargs):
+    pdf_cache.invalidate_student(instance.student_email_id)
+
+
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def drop_attendance_owner_pdfs(sender, instance, **kwargs):
+    pdf_cache.invalidate_student(instance.student_id)
+
+
+@receiver(pre_save, sender=Attendance)
+def remember_attendance_key(sender, instance, **kwargs):
+    # An edit can move a row to another student/subject/month; keep the old key to refresh it too
+    instance._previous_rollup_key = None
+    if instance.pk:
+        previous = Attendance.objects.filter(pk=instance.pk).values('student', 'subject', 'date').first()
+        if previous:
+            instance._previous_rollup_key = (
+                previous['student'], previous['subject'], attendance_rollups.month_start(previous['date'])
+            )
+
+
+@receiver(post_save, sender=Attendance)
+def refresh_attendance_rollup(sender, instance, **kwargs):
+    keys = {attendance_rollups.rollup_key(instance)}
+    if getattr(instance, '_previous_rollup_key', None):
+        keys.add(instance._previous_rollup_key)
+    attendance_rollups.refresh_monthly(keys)
+
+
+@receiver(post_delete, sender=Attendance)
+def refresh_attendance_rollup_on_delete(sender, instance, **kwargs):
+    attendance_rollups.refresh_monthly({attendance_rollups.rollup_key(instance)})
+
+
+@receiver(post_save, sender=Certificate)
+@receiver(post_save, sender=Projects)
+@receiver(post_save, sender=Activities)
+def mirror_submission(sender, instance, **kwargs):
+    submissions.sync_submission(submissions.category_for(sender), instance)
+
+
+@receiver(post_delete, sender=Certificate)
+@receiver(post_delete, sender=Projects)
+@receiver(post_delete, sender=Activities)
+def drop_submission(sender, instance, **kwargs):
+    submissions.remove_submission(submissions.category_for(sender), instance.pk)
+
+
+@receiver(post_save, sender=Certificate)
+@receiver(post_save, sender=Projects)
+@receiver(post_save, sender=Activities)
+def refresh_item_owner_ledger(sender, instance, **kwargs):
+    ledger.refresh_ledger(instance.student_email_id, submissions.category_for(sender))
+
+
+@receiver(post_delete, sender=Certificate)
+@receiver(post_delete, sender=Projects)
+@receiver(post_delete, sender=Activities)
+def refresh_item_owner_ledger_on_delete(sender, instance, **kwargs):
+    # No new row: the delete may be part of deleting the student
+    ledger.refresh_ledger(instance.student_email_id, submissions.category_for(sender), create=False)
+
+
+@receiver(post_save, sender=Student)
+def mirror_student_branch(sender, instance, created, **kwargs):
+    if not created:
+        submissions.update_student_branch(instance)
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+def expire_student_summary(sender, instance, **kwargs):
+    student_id = instance.pk
+    # After commit, so a concurrent request cannot cache pre-commit numbers under the new version
+    transaction.on_commit(lambda: summary_cache.invalidate_student(student_id))
+
+
+@receiver(post_save, sender=Certificate)
+@receiver(post_delete, sender=Certificate)
+@receiver(post_save, sender=Projects)
+@receiver(post_delete, sender=Projects)
+@receiver(post_save, sender=Activities)
+@receiver(post_delete, sender=Activities)
+@receiver(post_save, sender=Results)
+@receiver(post_delete, sender=Results)
+def expire_item_owner_summary(sender, instance, **kwargs):
+    student_id = instance.student_email_id
+    transaction.on_commit(lambda: summary_cache.invalidate_student(student_id))
+
+
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def expire_attendance_owner_summary(sender, instance, **kwargs):
+    student_id = instance.student_id
+    transaction.on_commit(lambda: summary_cache.invalidate_student(student_id))
+
+
+@receiver(post_save, sender=Faculty)
+def expire_faculty_fragments(sender, instance, **kwargs):
+    email = instance.pk
+    transaction.on_commit(lambda: summary_cache.invalidate_faculty(email))
+
+
+@receiver(pre_save, sender=Certificate)
+@receiver(pre_save, sender=Results)
+def remember_document(sender, instance, **kwargs):
+    # A save can swap the document; the old blob then loses a reference
+    instance._previous_document = None
+    if instance.pk:
+        instance._previous_document = sender.objects.filter(pk=instance.pk).values_list('document', flat=True).first()
+
+
+@receiver(post_save, sender=Certificate)
+@receiver(post_save, sender=Results)
+def count_document_reference(sender, instance, **kwargs):
+    previous = getattr(instance, '_previous_document', None) or ''
+    current = instance.document.name or ''
+    if previous != current:
+        blobs.adjust_references(current, 1)
+        blobs.adjust_references(previous, -1)
+
+
+@receiver(post_delete, sender=Certificate)
+@receiver(post_delete, sender=Results)
+def release_document_reference(sender, instance, **kwargs):
+    blobs.adjust_references(instance.document.name, -1)
@@ -0,0 +1,153 @@
+# student/static_assets.py
+"""
+Static asset delivery.
+
+Page CSS and JavaScript live in static/css/ and static/js/ instead of inline
+<style>/<script> blocks, so browsers download each bundle once. With DEBUG
+off, collectstatic writes them to STATIC_ROOT under content-hashed names
+(ManifestStaticFilesStorage) and `manage.py compress_static` adds .gz and
+.br siblings. serve_static() serves STATIC_ROOT when SERVE_STATIC_FILES is
+on: it picks the smallest precompressed variant the client accepts and marks
+hashed files as immutable for a year, since a changed file gets a new name.
+Brotli output needs the optional `brotli` package.
+"""
+import gzip
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.svg', '.html', '.txt', '.json', '.map', '.xml'}
+# Precompressed variants; the smallest existing one the client accepts is served
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+# ManifestStaticFilesStorage inserts a 12 character MD5 prefix before the extension
+HASHED_NAME = re.compile(r'\.[0-9a-f]{12}\.[^./]+$')
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+MUTABLE_MAX_AGE = 5 * 60
+
+
+def min_compress_bytes():
+    return getattr(settings, 'STATIC_PRECOMPRESS_MIN_BYTES', 256)
+
+
+def gzip_size(data):
+    return len(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def _write_variant(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def precompress(root, min_bytes=None):
+    """
+    Write .gz (and, with brotli installed, .br) next to every compressible file
+    under `root` that they make smaller. Returns [(path, raw, gzip, brotli)]
+    with None for variants that were not kept.
+    """
+    min_bytes = min_compress_bytes() if min_bytes is None else min_bytes
+    results = []
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            if os.path.splitext(filename)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            if len(data) < min_bytes:
+                continue
+            sizes = []
+            variants = [('.gz', lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                variants.append(('.br', lambda raw: brotli.compress(raw, quality=11)))
+            for suffix, compress in variants:
+                compressed = compress(data)
+                if len(compressed) < len(data):
+                    _write_variant(path + suffix, compressed)
+                    sizes.append(len(compressed))
+                else:
+                    if os.path.exists(path + suffix):
+                        os.remove(path + suffix)
+                    sizes.append(None)
+            if brotli is None:
+                sizes.append(None)
+            results.append((path, len(data), *sizes))
+    return results
+
+
+def _accepted_encodings(request):
+    """Content codings the client accepts, honouring q=0 ("not acceptable") and '*'."""
+    qualities = {}
+    for token in request.headers.get('Accept-Encoding', '').split(','):
+        coding, *params = [part.strip() for part in token.split(';')]
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    wildcard = qualities.pop('*', 0.0)
+    return {
+        encoding for encoding, _ in ENCODINGS
+        if qualities.get(encoding, wildcard) > 0
+    }
+
+
+def _cache_headers(response, path):
+    response['Vary'] = 'Accept-Encoding'
+    if HASHED_NAME.search(path):
+        response['Cache-Control'] = f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+    else:
+        response['Cache-Control'] = f"public, max-age={MUTABLE_MAX_AGE}"
+    return response
+
+
+def serve_static(request, path):
+    """Serve a file from STATIC_ROOT, precompressed and with long-lived caching for hashed names."""
+    try:
+        fullpath = safe_join(settings.STATIC_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404("Invalid path")
+    if not os.path.isfile(fullpath):
+        raise Http404(f"{path} not found")
+
+    stat = os.stat(fullpath)
+    if not was_modified_since(request.headers.get('If-Modified-Since'), stat.st_mtime):
+        return _cache_headers(HttpResponseNotModified(), path)
+
+    served, content_encoding, served_size = fullpath, None, stat.st_size
+    accepted = _accepted_encodings(request)
+    for encoding, suffix in ENCODINGS:
+        if encoding not in accepted:
+            continue
+        try:
+            size = os.stat(fullpath + suffix).st_size
+        except FileNotFoundError:
+            continue
+        if size < served_size:
+            served, content_encoding, served_size = fullpath + suffix, encoding, size
+
+    content_type, _ = mimetypes.guess_type(fullpath)
+    response = FileResponse(open(served, 'rb'), content_type=content_type or 'application/octet-stream')
+    if content_encoding:
+        response['Content-Encoding'] = content_encoding
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    return _cache_headers(response, path)
@@ -0,0 +1,84 @@
+# student/storage.py
+"""
+Content-addressed storage for uploaded documents.
+
+Certificate and result uploads are hashed (SHA-256) while they are streamed to
+a temporary file, then stored once under blobs/<aa>/<bb>/<sha256><ext>: two
+uploads of the same bytes share one file, and the two levels of sharding keep
+every directory small. Which rows use a blob is tracked by the reference
+counts in student/blobs.py; delete() never removes a blob itself, orphans are
+removed by `manage.py gc_document_blobs`.
+"""
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+
+BLOB_DIR = 'blobs'
+
+
+def blob_name(digest, extension=''):
+    return f"{BLOB_DIR}/{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
+
+def is_blob_name(name):
+    return bool(name) and name.startswith(f"{BLOB_DIR}/")
+
+
+def blob_digest(name_or_url):
+    """The SHA-256 in a blob name or URL, or None for anything outside the blob store."""
+    if not name_or_url or f"{BLOB_DIR}/" not in name_or_url:
+        return None
+    digest = name_or_url.rsplit('/', 1)[-1].split('.', 1)[0]
+    return digest if len(digest) == 64 else None
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    def get_available_name(self, name, max_length=None):
+        # The final name comes from the content in _save(), so it never collides
+        return name
+
+    def _save(self, name, content):
+        from .blobs import register_blob
+
+        extension = os.path.splitext(name)[1].lower()
+        directory = self.path(BLOB_DIR)
+        os.makedirs(directory, exist_ok=True)
+
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.upload')
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    tmp.write(chunk)
+                    size += len(chunk)
+            # Registering first marks the blob as used, so the collector leaves it alone.
+            # A blob keeps the extension of its first upload.
+            final_name = register_blob(digest.hexdigest(), blob_name(digest.hexdigest(), extension), size)
+            final_path = self.path(final_name)
+            if os.path.exists(final_path):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(tmp_path, final_path)
+                if self.file_permissions_mode is not None:
+                    os.chmod(final_path, self.file_permissions_mode)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return final_name
+
+    def delete(self, name):
+        # Blobs can be shared between rows; gc_document_blobs removes them once unreferenced
+        if is_blob_name(name):
+            return
+        super().delete(name)
+
+
+def document_storage():
+    """Storage of Certificate.document and Results.document."""
+    return ContentAddressedStorage()
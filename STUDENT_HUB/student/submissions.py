@@ -0,0 +1,131 @@
+# student/submissions.py
+"""
+Submission index.
+
+Certificates, projects and activities live in three tables, so every combined
+feed used to load all three, merge them in Python and sort/paginate in memory.
+The Submission table holds one row per item with the columns those feeds need,
+indexed on (branch, status, submission_date) and (student, date). Single writes
+are mirrored by the signal handlers in student/signals.py; set-wise writes call
+sync_submissions() with the pks they touched, and
+`manage.py rebuild_submissions` recomputes the table from scratch.
+"""
+from django.db import transaction
+
+from .ledger import LEDGER_MODELS
+from .models import Student, Submission
+
+SYNC_FIELDS = [
+    'student', 'branch', 'title', 'organization', 'activity_type', 'url',
+    'date', 'submission_date', 'status', 'credit', 'remark',
+]
+
+
+def category_for(model):
+    """'certificate' / 'project' / 'activity' for a source model class (None for others)."""
+    for category, Model in LEDGER_MODELS.items():
+        if Model is model:
+            return category
+    return None
+
+
+def submission_for(category, item, branch):
+    """Build the (unsaved) Submission row mirroring one source item."""
+    if category == 'certificate':
+        title, organization, activity_type = item.certificate_name, item.organization, ""
+        url = item.document.url if item.document else ""
+        day = item.issue_date
+    elif category == 'project':
+        title, organization, activity_type = item.project_name, item.subject, ""
+        url, day = item.project_url or "", item.date
+    else:
+        title, organization, activity_type = item.activity_name, item.subject, item.activity_type
+        url, day = item.project_url or "", item.date
+    return Submission(
+        category=category,
+        object_id=item.pk,
+        student_id=item.student_email_id,
+        branch=branch,
+        title=title,
+        organization=organization or "",
+        activity_type=activity_type or "",
+        url=url,
+        date=day,
+        submission_date=item.submission_date,
+        status=item.status,
+        credit=item.credit,
+        remark=item.remark or "",
+    )
+
+
+def _upsert(rows, batch_size=1000):
+    Submission.objects.bulk_create(
+        rows,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=['category', 'object_id'],
+        update_fields=SYNC_FIELDS,
+    )
+
+
+def sync_submissions(category, pks, batch_size=1000):
+    """
+    Re-mirror the given source pks of one category: existing items are upserted,
+    pks that no longer exist are dropped from the index. Returns the rows written.
+    """
+    pks = set(pks)
+    if not pks:
+        return 0
+    Model = LEDGER_MODELS[category]
+    items = list(Model.objects.filter(pk__in=pks).select_related('student_email'))
+    rows = [submission_for(category, item, item.student_email.branch) for item in items]
+    with transaction.atomic():
+        if rows:
+            _upsert(rows, batch_size)
+        missing = pks - {item.pk for item in items}
+        if missing:
+            Submission.objects.filter(category=category, object_id__in=missing).delete()
+    return len(rows)
+
+
+def sync_submission(category, item):
+    """Mirror one source item after it was saved."""
+    branch = Student.objects.filter(pk=item.student_email_id).values_list('branch', flat=True).first()
+    if branch is None:
+        return
+    _upsert([submission_for(category, item, branch)])
+
+
+def remove_submission(category, pk):
+    Submission.objects.filter(category=category, object_id=pk).delete()
+
+
+def update_student_branch(student):
+    """Keep the denormalized branch in step after a student record is saved."""
+    return Submission.objects.filter(student=student).exclude(branch=student.branch).update(branch=student.branch)
+
+
+def rebuild_submissions(students=None, batch_size=1000):
+    """Recompute the whole index (or one set of students). Returns the number of rows written."""
+    target = Submission.objects.all()
+    if students is not None:
+        target = target.filter(student__in=students)
+
+    written = 0
+    with transaction.atomic():
+        target.delete()
+        for category, Model in LEDGER_MODELS.items():
+            source = Model.objects.select_related('student_email')
+            if students is not None:
+                source = source.filter(student_email__in=students)
+            batch = []
+            for item in source.iterator(chunk_size=batch_size):
+                batch.append(submission_for(category, item, item.student_email.branch))
+                if len(batch) >= batch_size:
+                    Submission.objects.bulk_create(batch)
+                    written += len(batch)
+                    batch = []
+            if batch:
+                Submission.objects.bulk_create(batch)
+                written += len(batch)
+    return written
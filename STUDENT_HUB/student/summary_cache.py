@@ -0,0 +1,169 @@
+# student/summary_cache.py
+"""
+Per-student summary cache.
+
+The dashboard, portfolio, scoreboard and attendance pages all show the same
+per-student numbers (credits, latest result, attendance). get_summary() reads
+them through Django's cache framework: each section is stored under a key
+that embeds the student's current version, and any write to a related row
+bumps that version (signal handlers in student/signals.py, plus the bulk
+write paths), so stale entries are simply never read again and expire on
+their own. invalidate_all() bumps a global generation for full rebuilds.
+
+Version keys can be evicted while section entries survive (LRU backends,
+LocMemCache culling). A missing version is therefore seeded with the current
+time in nanoseconds, never with 0, so it cannot repeat a value that earlier
+entries were stored under.
+
+The cache alias is settings.SUMMARY_CACHE_ALIAS. The default local-memory
+backend is per process; use a shared backend (file, database, Redis) when
+the site runs in more than one process.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .attendance_rollups import attendance_by_month, attendance_by_subject, attendance_totals
+from .ledger import credit_summary
+from .models import Results
+
+# Bump when the shape of a section changes
+SCHEMA_VERSION = 1
+GENERATION_KEY = 'summary:generation'
+
+
+def latest_result(student):
+    """{'semester', 'sgpa', 'cgpa'} of the student's latest semester, or None."""
+    return Results.objects.filter(student_email=student).order_by('-semester').values(
+        'semester', 'sgpa', 'cgpa'
+    ).first()
+
+
+SECTIONS = {
+    'credits': credit_summary,
+    'latest_result': latest_result,
+    'attendance': attendance_totals,
+    'attendance_by_subject': attendance_by_subject,
+    'attendance_by_month': attendance_by_month,
+}
+
+
+def summary_cache():
+    return caches[getattr(settings, 'SUMMARY_CACHE_ALIAS', 'default')]
+
+
+def cache_timeout():
+    return getattr(settings, 'SUMMARY_CACHE_TIMEOUT', 600)
+
+
+def _student_id(student):
+    return getattr(student, 'pk', student)
+
+
+def _version_key(student_id):
+    # Emails can contain characters memcached does not accept in keys
+    return f"summary:version:{hashlib.sha1(student_id.encode()).hexdigest()}"
+
+
+def _fresh_version():
+    return time.time_ns()
+
+
+def _versions(cache, keys):
+    """{key: version}, seeding missing keys with a fresh value (another process may seed first)."""
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        seed = _fresh_version()
+        for key in missing:
+            cache.add(key, seed, timeout=None)
+        versions.update(cache.get_many(missing))
+        # Evicted again straight away: nothing can be cached under this seed either
+        for key in missing:
+            versions.setdefault(key, seed)
+    return versions
+
+
+def _bump(cache, key):
+    cache.add(key, _fresh_version(), timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key evicted between add() and incr()
+        cache.set(key, _fresh_version(), timeout=None)
+
+
+def get_summary(student, sections=None):
+    """
+    Return {section: value} for the requested sections (all by default),
+    computing and storing only the ones missing from the cache.
+    """
+    cache = summary_cache()
+    sections = list(sections or SECTIONS)
+    student_id = _student_id(student)
+    version_key = _version_key(student_id)
+    versions = _versions(cache, [GENERATION_KEY, version_key])
+    prefix = (
+        f"summary:{SCHEMA_VERSION}:{versions[GENERATION_KEY]}:"
+        f"{version_key.rsplit(':', 1)[1]}:{versions[version_key]}"
+    )
+    keys = {name: f"{prefix}:{name}" for name in sections}
+
+    found = cache.get_many(list(keys.values()))
+    summary = {}
+    missing = {}
+    for name, key in keys.items():
+        if key in found:
+            summary[name] = found[key]
+        else:
+            summary[name] = missing[key] = SECTIONS[name](student)
+    if missing:
+        cache.set_many(missing, timeout=cache_timeout())
+    return summary
+
+
+def version_token(students):
+    """
+    A string that changes whenever any of the students' summaries is
+    invalidated (or everything is, by invalidate_all). Costs one cache
+    round-trip and no queries, so it can back HTTP ETags.
+    """
+    cache = summary_cache()
+    keys = [GENERATION_KEY] + [_version_key(_student_id(student)) for student in students]
+    versions = _versions(cache, keys)
+    return ":".join(str(versions[key]) for key in keys)
+
+
+def invalidate_student(student):
+    """Make every cached section of one student stale."""
+    _bump(summary_cache(), _version_key(_student_id(student)))
+
+
+def invalidate_students(students):
+    for student in students:
+        invalidate_student(student)
+
+
+def _faculty_version_key(email):
+    return f"fragments:faculty:{hashlib.sha1(email.encode()).hexdigest()}"
+
+
+def faculty_version_token(faculty):
+    """
+    Version of a faculty member's cached page fragments. Faculty have no
+    summary; this counter lives under its own prefix and is only bumped when
+    the faculty row is saved.
+    """
+    key = _faculty_version_key(_student_id(faculty))
+    return str(_versions(summary_cache(), [key])[key])
+
+
+def invalidate_faculty(faculty):
+    _bump(summary_cache(), _faculty_version_key(_student_id(faculty)))
+
+
+def invalidate_all():
+    """Make every student's summary stale (after a rebuild of the derived tables)."""
+    _bump(summary_cache(), GENERATION_KEY)
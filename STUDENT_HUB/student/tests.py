@@ -1,3 +1,529 @@
-from django.test import TestCase
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, timedelta
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import blobs, jobs, summary_cache
+from .benchmark import run_benchmark, url_names
+from .ledger import LEDGER_MODELS, credit_summary, rebuild_ledger
+from .models import (
+    Activities, Attendance, Certificate, Faculty, Projects, ReportJob, Results, Student, StoredBlob, Subject, Submission,
+)
+from .seeding import seed_college
+
+
+class BenchmarkSmokeTest(TestCase):
+    """Seeds a tiny college and runs every view once through the benchmark."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.counts = seed_college(
+            branches=1, students_per_branch=3, faculty_per_branch=1, subjects_per_faculty=1,
+            items_per_student=2, semesters=2, attendance_days=7,
+        )
+
+    def test_seed_college_counts(self):
+        self.assertEqual(Student.objects.count(), 3)
+        self.assertEqual(Faculty.objects.count(), 1)
+        self.assertEqual(Submission.objects.count(), 3 * 2 * 3)
+        self.assertEqual(Attendance.objects.count(), self.counts['attendance'])
+
+    def test_every_view_responds(self):
+        faculty = Faculty.objects.get()
+        student = Student.objects.filter(branch=faculty.department).first()
+        report = run_benchmark(student, faculty, repeat=1, warmup=0)
+
+        json.dumps(report)
+        self.assertTrue(report['views'])
+        self.assertLessEqual(set(report['views']), set(url_names()))
+        for name, result in report['views'].items():
+            self.assertLess(result['status'], 500, name)
+            if 'skipped' not in result:
+                self.assertLessEqual({'queries', 'time_ms_median', 'peak_memory_kb', 'response_bytes'}, set(result), name)
+
+
+class StudentDashboardQueryBudgetTest(TestCase):
+    """The dashboard must not go back to per-item queries for its recent list."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = Student.objects.create(
+            first_name="Asha", last_name="Rao", email="asha@example.edu", password="pw", gender="Female",
+            roll_no="CSE001", contact="9000000000", branch="CSE", degree="B.Tech",
+        )
+        # Same title on purpose: the old sort matched rows by title
+        Certificate.objects.create(
+            certificate_name="Hackathon", student_email=cls.student, organization="IEEE",
+            issue_date=date(2025, 1, 10), status="approved", credit=4, remark="",
+        )
+        Activities.objects.create(
+            activity_name="Hackathon", student_email=cls.student, subject="Club", activity_type="Event",
+            date=date(2025, 3, 5), status="pending", remark="",
+        )
+        Projects.objects.create(
+            project_name="Compiler", student_email=cls.student, subject="CD", date=date(2025, 2, 1),
+            project_url="https://example.edu/p", status="approved", credit=6, remark="",
+        )
+        Projects.objects.create(
+            project_name="Old project", student_email=cls.student, subject="DS", date=date(2024, 6, 1),
+            project_url="https://example.edu/o", status="rejected", remark="",
+        )
+        rebuild_ledger()
+
+    def setUp(self):
+        cache.clear()
+        session = self.client.session
+        session["student_email"] = self.student.email
+        session.save()
+
+    def test_query_budget(self):
+        # session, student, credit ledger (summary cache miss), recent submissions
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("stu_dashboard"))
+        self.assertEqual(response.status_code, 200)
+        # Warm summary cache: the ledger query is skipped
+        with self.assertNumQueries(3):
+            self.client.get(reverse("stu_dashboard"))
+
+    def test_recent_feed_is_newest_first_with_dates(self):
+        response = self.client.get(reverse("stu_dashboard"))
+        recent = [(item.category, item.title, item.date) for item in response.context["recent_activities"]]
+        self.assertEqual(recent, [
+            ("activity", "Hackathon", date(2025, 3, 5)),
+            ("project", "Compiler", date(2025, 2, 1)),
+            ("certificate", "Hackathon", date(2025, 1, 10)),
+        ])
+        self.assertEqual(response.context["total_credits"], 10)
+        self.assertEqual(response.context["pending_activities"], 1)
+
+
+def make_student(email, branch="CSE", **fields):
+    return Student.objects.create(
+        first_name="Test", last_name="Student", email=email, password="pw", gender="Female",
+        roll_no=email.split("@")[0], contact="9000000000", branch=branch, degree="B.Tech", **fields,
+    )
+
+
+def make_faculty(email, department="CSE"):
+    return Faculty.objects.create(
+        first_name="Test", last_name="Faculty", email=email, password="pw", gender="Male",
+        contact="9000000001", department=department,
+    )
+
+
+def log_in(client, **session_values):
+    session = client.session
+    session.update(session_values)
+    session.save()
+
+
+class ReportJobDedupTest(TestCase):
+    """Identical report requests are only merged per requester, who can always see the job they got."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student("ravi@example.edu")
+        make_faculty("f1@example.edu")
+        make_faculty("f2@example.edu")
+
+    def enqueue_profile(self, client):
+        response = client.post(reverse("enqueue_report_job"), {"kind": "profile", "email": self.student.email})
+        return response.status_code, response.json()
+
+    def test_same_requester_reuses_job(self):
+        log_in(self.client, faculty_email="f1@example.edu")
+        first_status, first = self.enqueue_profile(self.client)
+        second_status, second = self.enqueue_profile(self.client)
+        self.assertEqual((first_status, second_status), (202, 200))
+        self.assertEqual(first["job_id"], second["job_id"])
+
+    def test_each_requester_can_poll_their_job(self):
+        f1, f2 = self.client_class(), self.client_class()
+        log_in(f1, faculty_email="f1@example.edu")
+        log_in(f2, faculty_email="f2@example.edu")
+        student = self.client_class()
+        log_in(student, student_email=self.student.email)
+
+        jobs = [self.enqueue_profile(client) for client in (f1, f2, student)]
+        self.assertEqual([status for status, _ in jobs], [202, 202, 202])
+        self.assertEqual(len({job["job_id"] for _, job in jobs}), 3)
+        for client, (_, job) in zip((f1, f2, student), jobs):
+            self.assertEqual(client.get(job["status_url"]).status_code, 200)
+        # Someone else's job stays hidden
+        self.assertEqual(f2.get(jobs[0][1]["status_url"]).status_code, 404)
+
+
+class ReportJobRetentionTest(TestCase):
+    """Finished jobs and their PDFs are deleted after the retention period."""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def make_job(self, status, finished_hours_ago):
+        job = ReportJob.objects.create(kind="naac", requested_by="f1@example.edu", dedup_key="k", status=status)
+        if status == "done":
+            job.file.save(f"naac_{job.pk}.pdf", ContentFile(b"%PDF-1.4"), save=False)
+        if finished_hours_ago is not None:
+            job.finished_at = timezone.now() - timedelta(hours=finished_hours_ago)
+        job.save()
+        return job
+
+    def test_purge_finished_jobs(self):
+        old_done = self.make_job("done", 48)
+        old_failed = self.make_job("failed", 30)
+        recent = self.make_job("done", 1)
+        queued = self.make_job("queued", None)
+        old_path = old_done.file.path
+
+        self.assertEqual(jobs.purge_finished_jobs(), 2)
+        self.assertEqual(set(ReportJob.objects.values_list("pk", flat=True)), {recent.pk, queued.pk})
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.exists(recent.file.path))
+        self.assertFalse(ReportJob.objects.filter(pk=old_failed.pk).exists())
+
+
+class StudentProfilesETagTest(TestCase):
+    """The batch profile ETag follows the data, not cache state."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student("meera@example.edu")
+        make_faculty("hod@example.edu")
+
+    def setUp(self):
+        log_in(self.client, faculty_email="hod@example.edu")
+
+    def get_profile(self, **headers):
+        return self.client.get(reverse("student_profiles"), {"email": self.student.email}, headers=headers)
+
+    def test_unchanged_profile_is_not_modified(self):
+        etag = self.get_profile()["ETag"]
+        cache.clear()
+        response = self.get_profile(if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_etag_changes_with_the_data(self):
+        etag = self.get_profile()["ETag"]
+        self.student.contact = "9111111111"
+        self.student.save()
+        # Even with every cached version counter gone
+        cache.clear()
+        response = self.get_profile(if_none_match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["profiles"][self.student.email]["contact"], "9111111111")
+
+
+class BulkMarkAttendanceValidationTest(TestCase):
+    """Malformed marking requests are rejected with a 400, never a server error."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student("kiran@example.edu")
+        cls.faculty = make_faculty("teacher@example.edu")
+        cls.subject = Subject.objects.create(subject_code="CS101", subject_name="Programming", faculty=cls.faculty)
+
+    def setUp(self):
+        log_in(self.client, faculty_email=self.faculty.email)
+
+    def post(self, payload):
+        return self.client.post(reverse("bulk_mark_attendance"), payload, content_type="application/json")
+
+    def payload(self, **overrides):
+        return {"subject": self.subject.pk, "date": "2025-01-15", "records": {self.student.email: "Present"}, **overrides}
+
+    def test_valid_session_is_written(self):
+        response = self.post(self.payload())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"written": 1})
+        self.assertEqual(Attendance.objects.get().status, "Present")
+
+    def test_malformed_fields_are_rejected(self):
+        for overrides in (
+            {"subject": "abc"}, {"subject": None}, {"subject": [1]}, {"subject": True}, {"subject": 999},
+            {"date": 5}, {"date": None}, {"date": "2025-13-45"}, {"date": "yesterday"},
+            {"records": ["kiran@example.edu"]}, {"records": {self.student.email: "Late"}},
+            {"records": {"someone@else.edu": "Present"}},
+        ):
+            with self.subTest(overrides=overrides):
+                response = self.post(self.payload(**overrides))
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.json())
+        self.assertEqual(self.post([1, 2]).status_code, 400)
+        self.assertFalse(Attendance.objects.exists())
+
+    def test_page_rejects_non_numeric_subject(self):
+        self.assertEqual(self.client.get(reverse("mark_attendance"), {"subject": "abc"}).status_code, 400)
+        response = self.client.post(reverse("mark_attendance"), {"subject": "abc", "date": "2025-01-15"})
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Attendance.objects.exists())
+
+
+class ApproveAllValidationTest(TestCase):
+    """'Approve all pending' answers bad input with a readable 400 and changes nothing."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student("dev@example.edu")
+        cls.faculty = make_faculty("mod@example.edu")
+        cls.activity = Activities.objects.create(
+            activity_name="Quiz", student_email=cls.student, subject="Club", activity_type="Event",
+            date=date(2025, 3, 5), status="pending", remark="",
+        )
+
+    def setUp(self):
+        log_in(self.client, faculty_email=self.faculty.email)
+
+    def approve_all(self, **payload):
+        return self.client.post(
+            reverse("faculty_bulk_moderation"), {"approve_all": "activity", **payload}, content_type="application/json",
+        )
+
+    def test_invalid_credit_is_rejected(self):
+        for credit in ("ten", [5], 2.5, -1):
+            with self.subTest(credit=credit):
+                response = self.approve_all(credit=credit)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(response.json()["error"], ("Credit must be a whole number.", "Credit cannot be negative."))
+        self.assertEqual(self.approve_all(approve_all=["activity"]).json(), {"error": "Unknown model_type."})
+        self.activity.refresh_from_db()
+        self.assertEqual(self.activity.status, "pending")
+
+    def test_null_credit_approves_with_zero(self):
+        response = self.approve_all(credit=None)
+        self.assertEqual(response.json(), {"approved": 1})
+        self.activity.refresh_from_db()
+        self.assertEqual((self.activity.status, self.activity.credit), ("approved", 0))
+
+
+class ItemChangeScenarios:
+    """
+    Changes an item through every write path; subclasses define
+    assertConsistent() for the derived data they check.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student("lina@example.edu")
+        cls.faculty = make_faculty("approver@example.edu")
+
+    def setUp(self):
+        cache.clear()
+
+    def make_items(self):
+        certificate = Certificate.objects.create(
+            certificate_name="Cloud", student_email=self.student, organization="AWS",
+            issue_date=date(2025, 1, 10), remark="",
+        )
+        project = Projects.objects.create(
+            project_name="Parser", student_email=self.student, subject="CD", date=date(2025, 2, 1),
+            project_url="https://example.edu/p", remark="",
+        )
+        activity = Activities.objects.create(
+            activity_name="Debate", student_email=self.student, subject="Club", activity_type="Event",
+            date=date(2025, 3, 5), remark="",
+        )
+        return certificate, project, activity
+
+    def test_orm_saves_and_deletes(self):
+        certificate, project, activity = self.make_items()
+        self.assertConsistent()
+        activity.status, activity.credit = "approved", 5
+        activity.save()
+        self.assertConsistent()
+        project.delete()
+        certificate.status = "rejected"
+        certificate.save()
+        self.assertConsistent()
+
+    def test_faculty_moderation_paths(self):
+        certificate, project, activity = self.make_items()
+        log_in(self.client, faculty_email=self.faculty.email)
+
+        self.client.post(reverse("faculty_approvals"), {
+            "activity_pk": certificate.pk, "model_type": "certificate", "action": "approve", "credit_points": "4",
+        })
+        self.assertConsistent()
+        self.client.post(reverse("faculty_bulk_moderation"), {"items": [
+            {"model_type": "project", "pk": project.pk, "action": "approve", "credit": 6},
+            {"model_type": "activity", "pk": activity.pk, "action": "reject", "remark": "Duplicate"},
+        ]}, content_type="application/json")
+        self.assertConsistent()
+        Activities.objects.create(
+            activity_name="Seminar", student_email=self.student, subject="Club", activity_type="Talk",
+            date=date(2025, 4, 1), remark="",
+        )
+        self.client.post(reverse("faculty_bulk_moderation"), {"approve_all": "activity", "credit": 2},
+                         content_type="application/json")
+        self.assertConsistent()
+
+    def test_deleting_the_student(self):
+        self.make_items()
+        self.student.delete()
+        self.assertConsistent()
+
+
+class LedgerConsistencyTest(ItemChangeScenarios, TestCase):
+    """Every way of changing an item keeps the credit ledger in step."""
+
+    def assertConsistent(self):
+        created, updated, _ = rebuild_ledger(dry_run=True)
+        self.assertEqual((created, updated), (0, 0), "credit ledger is stale")
+
+    def test_credit_summary_follows_status_changes(self):
+        certificate, project, activity = self.make_items()
+        self.assertEqual(credit_summary(self.student)['total']['pending'], 3)
+        activity.status, activity.credit = "approved", 5
+        activity.save()
+        self.assertEqual(credit_summary(self.student)['activity'], {'approved': 1, 'pending': 0, 'credits': 5})
+        project.delete()
+        certificate.status = "rejected"
+        certificate.save()
+        self.assertEqual(credit_summary(self.student)['total'], {'approved': 1, 'pending': 0, 'credits': 5})
+
+        # The dashboard reads the same numbers back through the summary cache
+        log_in(self.client, student_email=self.student.email)
+        self.assertEqual(self.client.get(reverse("stu_dashboard")).context["total_credits"], 5)
+
+
+class SubmissionIndexConsistencyTest(ItemChangeScenarios, TestCase):
+    """Every way of changing an item keeps its Submission row in step."""
+
+    def assertConsistent(self):
+        expected = {
+            (category, item.pk, item.status, item.credit)
+            for category, Model in LEDGER_MODELS.items() for item in Model.objects.all()
+        }
+        mirrored = set(Submission.objects.values_list('category', 'object_id', 'status', 'credit'))
+        self.assertEqual(mirrored, expected, "Submission index is stale")
+
+
+class SummaryCacheVersionTest(TestCase):
+    """Losing a version key must not bring back sections cached before the last write."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student("omar@example.edu")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_evicted_version_does_not_resurrect_stale_sections(self):
+        Results.objects.create(student_email=self.student, semester=1, sgpa=7.0, cgpa=7.0)
+        self.assertEqual(summary_cache.get_summary(self.student, ['latest_result'])['latest_result']['cgpa'], 7.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Results.objects.create(student_email=self.student, semester=2, sgpa=9.0, cgpa=8.0)
+        # Evicted while the section cached under the first version is still there
+        summary_cache.summary_cache().delete(summary_cache._version_key(self.student.pk))
+
+        self.assertEqual(summary_cache.get_summary(self.student, ['latest_result'])['latest_result']['cgpa'], 8.0)
+
+    def test_version_token_changes_after_eviction(self):
+        token = summary_cache.version_token([self.student])
+        self.assertEqual(summary_cache.version_token([self.student]), token)
+        summary_cache.summary_cache().delete(summary_cache._version_key(self.student.pk))
+        self.assertNotEqual(summary_cache.version_token([self.student]), token)
+
+
+class NavbarFragmentCacheTest(TestCase):
+    """Cached navbar/stat-card fragments never outlive the data they show."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student("priya@example.edu")
+        cls.faculty = make_faculty("head@example.edu")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_student_fragments_follow_saves_even_after_eviction(self):
+        log_in(self.client, student_email=self.student.email)
+        self.assertContains(self.client.get(reverse("stu_dashboard")), "<h4>Test</h4>")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student.first_name = "Priya"
+            self.student.save()
+        self.assertContains(self.client.get(reverse("stu_dashboard")), "<h4>Priya</h4>")
+
+        # Same after the version counter is evicted: no fallback to the first fragment
+        summary_cache.summary_cache().delete(summary_cache._version_key(self.student.pk))
+        response = self.client.get(reverse("stu_dashboard"))
+        self.assertContains(response, "<h4>Priya</h4>")
+        self.assertNotContains(response, "<h4>Test</h4>")
+
+    def test_faculty_fragments_have_their_own_versions(self):
+        log_in(self.client, faculty_email=self.faculty.email)
+        self.assertContains(self.client.get(reverse("faculty_dashboard")), "<h4>Test</h4>")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.faculty.first_name = "Anil"
+            self.faculty.save()
+        self.assertContains(self.client.get(reverse("faculty_dashboard")), "<h4>Anil</h4>")
+        self.assertIsNone(summary_cache.summary_cache().get(summary_cache._version_key(self.faculty.pk)))
+
+
+class BlobReferenceCountTest(TestCase):
+    """Shared document blobs are counted per referencing row and collected once unused."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_student("noor@example.edu")
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def certificate(self, content, name="scan.pdf"):
+        return Certificate.objects.create(
+            certificate_name="Award", student_email=self.student, organization="IEEE",
+            issue_date=date(2025, 1, 10), remark="", document=SimpleUploadedFile(name, content),
+        )
+
+    def ref_counts(self):
+        return dict(StoredBlob.objects.values_list('name', 'ref_count'))
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self.certificate(b"same bytes")
+        second = self.certificate(b"same bytes", name="copy.pdf")
+        self.assertEqual(first.document.name, second.document.name)
+        self.assertEqual(self.ref_counts(), {first.document.name: 2})
+
+    def test_replace_and_delete_release_references(self):
+        first = self.certificate(b"original")
+        second = self.certificate(b"original")
+        shared = first.document.name
+
+        first.document = SimpleUploadedFile("new.pdf", b"replacement")
+        first.save()
+        self.assertEqual(self.ref_counts(), {shared: 1, first.document.name: 1})
+
+        second.delete()
+        self.assertEqual(self.ref_counts(), {shared: 0, first.document.name: 1})
+        path = first.document.storage.path(shared)
+        self.assertTrue(os.path.exists(path))
+
+        # The file itself is removed once the row deletion commits
+        with self.captureOnCommitCallbacks(execute=True):
+            removed, _ = blobs.collect_garbage(grace=timedelta(0))
+        self.assertEqual(removed, 1)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.ref_counts(), {first.document.name: 1})
+        # Nothing drifted from the document columns
+        self.assertEqual(blobs.recount(), 0)
@@ -7,6 +7,7 @@ urlpatterns = [
     #path('register/', views.register_student, name="register_student"),
     path('login_student/', views.login_student, name="login_student"),
     path('myactivity/', views.stu_myactivity, name="stu_myactivity"),
+    path('myactivity/timeline/', views.activity_timeline, name="activity_timeline"),
     path('portfolio/', views.stu_portfolio, name="stu_portfolio"),
     path('scoreboard/', views.stu_scoreboard, name="stu_scoreboard"),
     path('logout_student/', views.logout_student, name="logout_student"),
@@ -14,6 +15,7 @@ urlpatterns = [
     path('login_faculty/', views.login_faculty, name="login_faculty"),
     path('faculty_dashboard/', views.faculty_dashboard, name="faculty_dashboard"),
     path('faculty_approvals/', views.faculty_approvals, name='faculty_approvals'),
+    path('faculty_approvals/bulk/', views.faculty_bulk_moderation, name='faculty_bulk_moderation'),
     path('faculty_students/', views.faculty_students, name='faculty_students'),
     path('fac_reports/', views.fac_reports, name='fac_reports'),
     path('results/', views.student_results, name='student_results'),
@@ -23,5 +25,13 @@ urlpatterns = [
     path('register_student/', views.register_student, name='register_student'),
     path('attendance/', views.attendance_dashboard, name='attendance_dashboard'),
     path('get_student_profile/', views.get_student_profile, name='get_student_profile'),
+    path('faculty_students/profiles/', views.student_profiles, name='student_profiles'),
     path('download_student_profile_pdf/', views.download_student_profile_pdf, name='download_student_profile_pdf'),
+    path('reports/jobs/', views.enqueue_report_job, name='enqueue_report_job'),
+    path('reports/jobs/<int:job_id>/', views.report_job_status, name='report_job_status'),
+    path('reports/jobs/<int:job_id>/download/', views.download_report_job, name='download_report_job'),
+    path('reports/cache/stats/', views.pdf_cache_stats, name='pdf_cache_stats'),
+    path('faculty_attendance/', views.mark_attendance, name='mark_attendance'),
+    path('faculty_attendance/bulk/', views.bulk_mark_attendance, name='bulk_mark_attendance'),
+    path('metrics/requests/', views.request_metrics, name='request_metrics'),
 ]
\ No newline at end of file
@@ -11,113 +11,42 @@ def download_student_profile_pdf(request):
         student = Student.objects.get(email=email)
     except Student.DoesNotExist:
         return HttpResponse("Student not found", status=404)
-    attended_classes = Attendance.objects.filter(student=student, status='Present').count()
-    total_classes = Attendance.objects.filter(student=student).count()
-    attendance_percent = round((attended_classes / total_classes) * 100, 1) if total_classes else 0
-    activities = Activities.objects.filter(student_email=student).order_by('-date')[:4]
-    latest_result = Results.objects.filter(student_email=student).order_by('-semester').first()
-    cgpa = latest_result.cgpa if latest_result else 0.0
-    linkedin = student.linkedin_url or "N/A"
-    github = student.github_url or "N/A"
-
-    import datetime
-    buffer = io.BytesIO()
-    p = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
-    y = height - 50
-
-    # Title and date/time
-    p.setFont("Helvetica-Bold", 26)
-    p.setFillColorRGB(0.1,0.2,0.4)
-    p.drawString(50, y, "Student Report")
-    p.setFont("Helvetica", 12)
-    p.setFillColorRGB(0.2,0.2,0.2)
-    now = datetime.datetime.now().strftime('%d-%m-%Y %H:%M')
-    p.drawRightString(width-50, y, f"Generated: {now}")
-    y -= 40
-
-    # Student Info Card
-    p.setFillColorRGB(0.23,0.51,0.96)
-    p.setFont("Helvetica-Bold", 20)
-    p.drawString(50, y, f"{student.first_name} {student.last_name}")
-    p.setFont("Helvetica", 14)
-    p.setFillColorRGB(0,0,0)
-    y -= 28
-    p.drawString(50, y, f"{student.branch} Engineering")
-    y -= 20
-    p.setFont("Helvetica", 12)
-    p.drawString(50, y, f"Email: {student.email}")
-    y -= 16
-    p.drawString(50, y, f"Phone: {student.contact}")
-    y -= 16
-    p.drawString(50, y, f"CGPA: {cgpa}")
-    y -= 16
-    p.drawString(50, y, f"LinkedIn: {linkedin}")
-    y -= 16
-    p.drawString(50, y, f"GitHub: {github}")
-
-    # Divider
-    y -= 18
-    p.setStrokeColorRGB(0.7,0.7,0.7)
-    p.setLineWidth(1)
-    p.line(50, y, width-50, y)
-    y -= 28
-
-    # Attendance Overview
-    p.setFont("Helvetica-Bold", 15)
-    p.setFillColorRGB(0.12,0.16,0.68)
-    p.drawString(50, y, "Attendance Overview")
-    p.setFont("Helvetica", 12)
-    p.setFillColorRGB(0,0,0)
-    y -= 20
-    p.drawString(60, y, f"Overall Attendance: {attendance_percent}%")
-    y -= 16
-    p.drawString(60, y, f"Classes Attended: {attended_classes} of {total_classes}")
-    y -= 16
-    p.drawString(60, y, f"Active Subjects: 4")
-
-    # Divider
-    y -= 18
-    p.setStrokeColorRGB(0.7,0.7,0.7)
-    p.setLineWidth(1)
-    p.line(50, y, width-50, y)
-    y -= 28
-
-    # Recent Activities
-    p.setFont("Helvetica-Bold", 15)
-    p.setFillColorRGB(0.12,0.16,0.68)
-    p.drawString(50, y, "Recent Activities")
-    p.setFont("Helvetica", 12)
-    p.setFillColorRGB(0,0,0)
-    y -= 20
-    for act in activities:
-        p.setFont("Helvetica-Bold", 12)
-        p.drawString(60, y, f"{act.activity_name}")
-        y -= 14
-        p.setFont("Helvetica", 12)
-        p.drawString(80, y, f"{act.activity_type} • {act.date}")
-        y -= 18
-        if y < 100:
-            p.showPage()
-            y = height - 50
-
-    p.showPage()
-    p.save()
-    buffer.seek(0)
-    safe_name = f"{student.first_name}_{student.last_name}_report".replace(" ", "_")
-    filename = f"{safe_name}.pdf"
-    return FileResponse(buffer, as_attachment=True, filename=filename)
-
-
-from django.db.models import Count, Q, Sum, Avg
-from django.db.models.functions import TruncMonth, Coalesce
+    report = pdf_cache.get_or_render('profile', student, render_student_profile_pdf)
+    return FileResponse(report, as_attachment=True, filename=profile_report_filename(student))
+
+
+from django.db.models import Count, Q, Sum, Avg, OuterRef, Subquery, FloatField, Value, F, Window
+from django.db.models.functions import TruncMonth, Coalesce, Cast, RowNumber
 from datetime import timedelta, date
 from django.utils import timezone
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
-from .models import Attendance, Subject, Student, Certificate, Projects, Activities, Faculty, Results
+from .models import Attendance, Subject, Student, Certificate, Projects, Activities, Faculty, Results, CreditLedger, Submission
 from .utils import get_student_name_by_email
+from django.db import transaction
+from .ledger import credit_summary
+from .ranking import class_standing, credits_subquery
+from .reports import (
+    naac_students, render_naac_report, render_cv_pdf, render_student_profile_pdf,
+    render_to_tempfile, profile_report_filename,
+)
+from django.utils.dateparse import parse_date
+from django.views.decorators.http import require_POST, require_GET
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+import json
+from . import pdf_cache
+from functools import partial
+from .pagination import keyset_page
+from .portfolio import portfolio_stats
+from .previews import attach_previews
+from .profiles import ProfileRequestError, build_profiles, parse_emails, parse_fields, profile_etag
+from .summary_cache import get_summary
+from .moderation import ModerationError, moderate_items, approve_all_pending
+from .attendance_rollups import (
+    attendance_by_month, attendance_by_subject, attendance_rate_subquery, attendance_totals, attendance_totals_for,
+)
 # ReportLab imports
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
@@ -134,10 +63,16 @@ def attendance_dashboard(request):
     student_email = request.session.get('student_email')
     student = Student.objects.get(email=student_email)
 
-    # Overall stats
-    total_classes = Attendance.objects.filter(student=student).count()
-    attended_classes = Attendance.objects.filter(student=student, status='Present').count()
+    # Subject-wise and monthly stats come from the monthly attendance rollup (through the summary cache)
+    summary = get_summary(student, ['attendance_by_subject', 'attendance_by_month'])
+    subject_stats = summary['attendance_by_subject']
+    monthly_data = summary['attendance_by_month']
+
+    # Overall stats and active courses are totals of the subject rows
+    total_classes = sum(row['total'] for row in subject_stats)
+    attended_classes = sum(row['attended'] for row in subject_stats)
     overall_percent = round((attended_classes / total_classes) * 100, 1) if total_classes else 0
+    active_courses = len(subject_stats)
 
     # RTU performance = overall class attendance for all subjects
     rtu_total = total_classes
@@ -145,41 +80,9 @@ def attendance_dashboard(request):
     rtu_absent = rtu_total - rtu_attended
     rtu_percent = overall_percent
 
-    # Active courses
-    active_courses = Attendance.objects.filter(student=student).values('subject').distinct().count()
-
-    # Subject-wise stats
-    subjects = Subject.objects.all()
-    subject_stats = []
-    for subject in subjects:
-        sub_total = Attendance.objects.filter(student=student, subject=subject).count()
-        sub_attended = Attendance.objects.filter(student=student, subject=subject, status='Present').count()
-        percent = round((sub_attended / sub_total) * 100, 1) if sub_total else 0
-        subject_stats.append({
-            'name': subject.subject_name,
-            'total': sub_total,
-            'attended': sub_attended,
-            'percent': percent,
-        })
-
-    # Monthly stats
-    monthly_stats = Attendance.objects.filter(student=student).annotate(month=TruncMonth('date')).values('month').annotate(
-        total=Count('id'),
-        attended=Count('id', filter=Q(status='Present'))
-    ).order_by('month')
-    monthly_data = []
-    for m in monthly_stats:
-        percent = round((m['attended'] / m['total']) * 100, 1) if m['total'] else 0
-        monthly_data.append({
-            'month': m['month'].strftime('%b %Y'),
-            'total': m['total'],
-            'attended': m['attended'],
-            'percent': percent,
-        })
-
     # Daily records (last 7 days)
     today = date.today()
-    records = Attendance.objects.filter(student=student, date__gte=today-timedelta(days=7)).order_by('-date')
+    records = Attendance.objects.filter(student=student, date__gte=today-timedelta(days=7)).select_related('subject').order_by('-date')
 
     context = {
         'student': student,
@@ -210,127 +113,11 @@ def download_cv_pdf(request):
     except Student.DoesNotExist:
         return redirect("login_student")
 
-    # Get approved items
-    certs = Certificate.objects.filter(student_email=student, status="approved")
-    projects = Projects.objects.filter(student_email=student, status="approved")
-    activities = Activities.objects.filter(student_email=student, status="approved")
-
-    response = HttpResponse(content_type='application/pdf')
-    response['Content-Disposition'] = 'attachment; filename="cv_portfolio.pdf"'
-    p = canvas.Canvas(response, pagesize=letter)
-    width, height = letter
-    y = height - inch
-
-    # Professional Header
-    # Professional Header (no time/date)
-    p.setFont("Helvetica-Bold", 26)
-    p.setFillColorRGB(0.1,0.2,0.4)
-    p.drawString(inch, y, "Curriculum Vitae")
-    y -= 0.45 * inch
-    p.setStrokeColorRGB(0.15,0.15,0.5)
-    p.setLineWidth(2)
-    p.line(inch, y, width-inch, y)
-    y -= 0.35 * inch
-
-    # Name & Contact
-    p.setFont("Helvetica-Bold", 18)
-    p.setFillColorRGB(0,0,0)
-    p.drawString(inch, y, f"{student.first_name} {student.last_name}")
-    p.setFont("Helvetica", 13)
-    p.drawString(inch, y-0.22*inch, f"{student.branch}")
-    p.setFont("Helvetica", 12)
-    p.drawString(inch, y-0.38*inch, f"Email: {student.email} | Phone: {student.contact}")
-    y -= 0.7 * inch
-    p.setStrokeColorRGB(0.7,0.7,0.7)
-    p.setLineWidth(1)
-    p.line(inch, y, width-inch, y)
-    y -= 0.25 * inch
-
-    # Section: Education
-    p.setFont("Helvetica-Bold", 15)
-    p.setFillColorRGB(0.1,0.2,0.4)
-    p.drawString(inch, y, "Education")
-    p.setFillColorRGB(0,0,0)
-    y -= 0.22 * inch
-    p.setFont("Helvetica", 12)
-    p.drawString(inch+0.2*inch, y, f"Bachelor of Technology in {student.branch}")
-    y -= 0.17 * inch
-    p.drawString(inch+0.2*inch, y, f"{getattr(student, 'College_name', '')} | Session: {getattr(student, 'session', '')} | CGPA: {getattr(student, 'cgpa', '')}")
-    y -= 0.25 * inch
-    p.setStrokeColorRGB(0.85,0.85,0.85)
-    p.setLineWidth(1)
-    p.line(inch, y, width-inch, y)
-    y -= 0.22 * inch
-
-    # Section: Certifications
-    if certs.exists():
-        p.setFont("Helvetica-Bold", 15)
-        p.setFillColorRGB(0.1,0.2,0.4)
-        p.drawString(inch, y, "Certifications")
-        p.setFillColorRGB(0,0,0)
-        y -= 0.22 * inch
-        p.setFont("Helvetica", 12)
-        for cert in certs:
-            p.drawString(inch+0.2*inch, y, f"{cert.certificate_name} from {cert.organization} ({cert.issue_date.year})")
-            y -= 0.17 * inch
-            if y < inch:
-                p.showPage(); y = height - inch
-        y -= 0.22 * inch
-        p.setStrokeColorRGB(0.85,0.85,0.85)
-        p.setLineWidth(1)
-        p.line(inch, y, width-inch, y)
-        y -= 0.22 * inch
-
-    # Section: Projects
-    if projects.exists():
-        p.setFont("Helvetica-Bold", 15)
-        p.setFillColorRGB(0.1,0.2,0.4)
-        p.drawString(inch, y, "Projects")
-        p.setFillColorRGB(0,0,0)
-        y -= 0.22 * inch
-        p.setFont("Helvetica", 12)
-        for proj in projects:
-            p.drawString(inch+0.2*inch, y, f"{proj.project_name} - Subject: {proj.subject}")
-            y -= 0.17 * inch
-            if y < inch:
-                p.showPage(); y = height - inch
-        y -= 0.22 * inch
-        p.setStrokeColorRGB(0.85,0.85,0.85)
-        p.setLineWidth(1)
-        p.line(inch, y, width-inch, y)
-        y -= 0.22 * inch
-
-    # Section: Activities
-    if activities.exists():
-        p.setFont("Helvetica-Bold", 15)
-        p.setFillColorRGB(0.1,0.2,0.4)
-        p.drawString(inch, y, "Activities & Accomplishments")
-        p.setFillColorRGB(0,0,0)
-        y -= 0.22 * inch
-        p.setFont("Helvetica", 12)
-        for act in activities:
-            p.drawString(inch+0.2*inch, y, f"{act.activity_name} - Type: {act.activity_type}")
-            y -= 0.17 * inch
-            if y < inch:
-                p.showPage(); y = height - inch
-        y -= 0.22 * inch
-        p.setStrokeColorRGB(0.85,0.85,0.85)
-        p.setLineWidth(1)
-        p.line(inch, y, width-inch, y)
-        y -= 0.22 * inch
-
-    # Section: Technical Skills
-    p.setFont("Helvetica-Bold", 15)
-    p.setFillColorRGB(0.1,0.2,0.4)
-    p.drawString(inch, y, "Technical Skills")
-    p.setFillColorRGB(0,0,0)
-    y -= 0.22 * inch
-    p.setFont("Helvetica", 12)
-    p.drawString(inch+0.2*inch, y, "Programming Languages: Python, Java, HTML/CSS, etc.")
-    y -= 0.35 * inch
-
-    p.save()
-    return response
+    stats = portfolio_stats(student)
+    report = pdf_cache.get_or_render(
+        'cv', student, partial(render_cv_pdf, stats=stats), inputs=pdf_cache.cv_inputs(student, stats)
+    )
+    return FileResponse(report, as_attachment=True, filename="cv_portfolio.pdf")
 
 from django.http import HttpResponse
 from reportlab.lib.pagesizes import letter
@@ -344,85 +131,23 @@ def download_naac_report(request):
     if not faculty_email:
         return HttpResponse("Unauthorized", status=403)
 
-
-    # Example: Generate NAAC report for all students and their approved items
-    response = HttpResponse(content_type='application/pdf')
-    response['Content-Disposition'] = 'attachment; filename="naac_report.pdf"'
-    p = canvas.Canvas(response, pagesize=letter)
-    width, height = letter
-    y = height - inch
-
-    p.setFont("Helvetica-Bold", 22)
-    p.setFillColorRGB(0.1,0.2,0.4)
-    p.drawString(inch, y, "NAAC Report - Approved Items")
-    y -= 0.45 * inch
-    p.setStrokeColorRGB(0.15,0.15,0.5)
-    p.setLineWidth(2)
-    p.line(inch, y, width-inch, y)
-    y -= 0.35 * inch
-
-    students = Student.objects.all()
-    for student in students:
-        p.setFont("Helvetica-Bold", 16)
-        p.setFillColorRGB(0,0,0)
-        p.drawString(inch, y, f"{student.first_name} {student.last_name} ({student.branch})")
-        y -= 0.22 * inch
-        p.setFont("Helvetica", 12)
-        p.drawString(inch, y, f"Email: {student.email} | Phone: {student.contact}")
-        y -= 0.22 * inch
-
-        # Certificates
-        certs = Certificate.objects.filter(student_email=student, status="approved")
-        if certs.exists():
-            p.setFont("Helvetica-Bold", 13)
-            p.drawString(inch, y, "Certificates:")
-            y -= 0.18 * inch
-            p.setFont("Helvetica", 11)
-            for cert in certs:
-                p.drawString(inch+0.2*inch, y, f"{cert.certificate_name} from {cert.organization} ({cert.issue_date.year})")
-                y -= 0.16 * inch
-                if y < inch:
-                    p.showPage(); y = height - inch
-            y -= 0.12 * inch
-
-        # Projects
-        projects = Projects.objects.filter(student_email=student, status="approved")
-        if projects.exists():
-            p.setFont("Helvetica-Bold", 13)
-            p.drawString(inch, y, "Projects:")
-            y -= 0.18 * inch
-            p.setFont("Helvetica", 11)
-            for proj in projects:
-                p.drawString(inch+0.2*inch, y, f"{proj.project_name} - Subject: {proj.subject}")
-                y -= 0.16 * inch
-                if y < inch:
-                    p.showPage(); y = height - inch
-            y -= 0.12 * inch
-
-        # Activities
-        acts = Activities.objects.filter(student_email=student, status="approved")
-        if acts.exists():
-            p.setFont("Helvetica-Bold", 13)
-            p.drawString(inch, y, "Activities:")
-            y -= 0.18 * inch
-            p.setFont("Helvetica", 11)
-            for act in acts:
-                p.drawString(inch+0.2*inch, y, f"{act.activity_name} - Type: {act.activity_type}")
-                y -= 0.16 * inch
-                if y < inch:
-                    p.showPage(); y = height - inch
-            y -= 0.12 * inch
-
-        # Separator line between students
-        p.setStrokeColorRGB(0.7,0.7,0.7)
-        p.setLineWidth(1)
-        p.line(inch, y, width-inch, y)
-        y -= 0.22 * inch
-        if y < inch:
-            p.showPage(); y = height - inch
-
-    p.save()
-    return response
+    # Optional filters: ?branch=&session=&from=YYYY-MM-DD&to=YYYY-MM-DD
+    try:
+        date_from = parse_date(request.GET.get("from") or "")
+        date_to = parse_date(request.GET.get("to") or "")
+    except ValueError:
+        return HttpResponse("Invalid date filter", status=400)
+
+    students = naac_students(
+        branch=request.GET.get("branch") or None,
+        session=request.GET.get("session") or None,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    # Students are read in chunks with their approved items prefetched, and the PDF
+    # is written to a temporary file that FileResponse streams back and then deletes.
+    report = render_to_tempfile(render_naac_report, students)
+    return FileResponse(report, as_attachment=True, filename="naac_report.pdf", content_type="application/pdf")
 
 def login_student(request):
     if request.method == "POST":
@@ -442,8 +167,9 @@ def login_student(request):
 def stu_myactivity(request):
     """
     Handles both displaying and adding student activities.
-    - On GET: Fetches all activities, projects, and certificates,
-      combines them into a single list, sorts by date, and displays them.
+    - On GET: Renders the newest page of the student's Submission index rows
+      (keyset pagination, optional category/status filters); later pages are
+      fetched from activity_timeline.
     - On POST: Handles the submission from the unified "Add New Activity" form,
       creates the correct type of activity, and redirects back to the page.
     """
@@ -466,36 +192,37 @@ def stu_myactivity(request):
         activity_date = request.POST.get("date")
 
         try:
-            # Create a Certificate if that was the chosen category
-            if category == "certificate":
-                Certificate.objects.create(
-                    student_email=student,
-                    certificate_name=title,
-                    organization=request.POST.get("organization"),
-                    issue_date=activity_date,
-                    document=request.FILES.get("document") # Use request.FILES for file uploads
-                )
-            
-            # Create a Project
-            elif category == "project":
-                Projects.objects.create(
-                    student_email=student,
-                    project_name=title,
-                    subject=request.POST.get("subject"),
-                    date=activity_date,
-                    project_url=request.POST.get("project_url")
-                )
-
-            # Create an "Other Activity"
-            elif category == "activity":
-                Activities.objects.create(
-                    student_email=student,
-                    activity_name=title,
-                    subject=request.POST.get("activity_subject"),
-                    activity_type=request.POST.get("activity_type_name"),
-                    date=activity_date,
-                    project_url=request.POST.get("activity_url")
-                )
+            with transaction.atomic():
+                # Create a Certificate if that was the chosen category
+                if category == "certificate":
+                    Certificate.objects.create(
+                        student_email=student,
+                        certificate_name=title,
+                        organization=request.POST.get("organization"),
+                        issue_date=activity_date,
+                        document=request.FILES.get("document") # Use request.FILES for file uploads
+                    )
+
+                # Create a Project
+                elif category == "project":
+                    Projects.objects.create(
+                        student_email=student,
+                        project_name=title,
+                        subject=request.POST.get("subject"),
+                        date=activity_date,
+                        project_url=request.POST.get("project_url")
+                    )
+
+                # Create an "Other Activity"
+                elif category == "activity":
+                    Activities.objects.create(
+                        student_email=student,
+                        activity_name=title,
+                        subject=request.POST.get("activity_subject"),
+                        activity_type=request.POST.get("activity_type_name"),
+                        date=activity_date,
+                        project_url=request.POST.get("activity_url")
+                    )
 
             messages.success(request, f"Successfully added '{title}' to your activities!")
         except Exception as e:
@@ -506,44 +233,83 @@ def stu_myactivity(request):
         return redirect("stu_myactivity")
 
     # --- Display Activities (GET Request) ---
-    activities_list = []
-
-    # 1. Fetch Certificates
-    for c in Certificate.objects.filter(student_email=student):
-        activities_list.append({
-            "title": c.certificate_name, "organization": c.organization, "date": c.issue_date,
-            "description": f"Certificate issued by {c.organization}", "category": "Certificate",
-            "url": c.document.url if c.document else None, "status": c.status,
-        })
+    # Only the newest page is rendered; the rest is loaded from activity_timeline
+    category, status = _timeline_filters(request)
+    page = keyset_page(_timeline_queryset(student, category, status), 'date', per_page=TIMELINE_PAGE_SIZE)
 
-    # 2. Fetch Projects
-    for p in Projects.objects.filter(student_email=student):
-        activities_list.append({
-            "title": p.project_name, "organization": p.subject, "date": p.date,
-            "description": f"Project related to {p.subject}", "category": "Project",
-            "url": p.project_url, "status": p.status,
-        })
-
-    # 3. Fetch Other Activities
-    for a in Activities.objects.filter(student_email=student):
-        activities_list.append({
-            "title": a.activity_name, "organization": a.subject, "date": a.date,
-            "description": f"Activity type: {a.activity_type}", "category": "Activity",
-            "url": a.project_url, "status": a.status,
-        })
-
-    # Sort the combined list by date, with the newest items first
-    # Use 'date.min' as a fallback for any items that might not have a date
-    activities_list.sort(key=lambda x: x["date"] or date.min, reverse=True)
-
-    # Pass the final list to the template for rendering
+    # Pass the first page to the template for rendering
     context = {
         "student": student,
-        "activities": activities_list
+        "activities": page,
+        "next_cursor": page.next_cursor or "",
+        "category_filter": category or "",
+        "status_filter": status or "",
+        "category_choices": Submission.CATEGORY_CHOICES,
+        "status_choices": TIMELINE_STATUSES,
     }
     return render(request, "stu-myactivity.html", context)
 
 
+# --- Activity timeline ---
+TIMELINE_PAGE_SIZE = 20
+TIMELINE_STATUSES = ("pending", "approved", "rejected")
+
+
+def _timeline_filters(request):
+    """(category, status) from the query string; unknown values are ignored."""
+    category = request.GET.get("category") or None
+    status = request.GET.get("status") or None
+    if category not in dict(Submission.CATEGORY_CHOICES):
+        category = None
+    if status not in TIMELINE_STATUSES:
+        status = None
+    return category, status
+
+
+def _timeline_queryset(student, category=None, status=None):
+    # Certificates, projects and activities come from the submission index
+    submissions = Submission.objects.filter(student=student)
+    if category:
+        submissions = submissions.filter(category=category)
+    if status:
+        submissions = submissions.filter(status=status)
+    return submissions
+
+
+def _timeline_entry(submission):
+    return {
+        "category": submission.category,
+        "category_display": submission.get_category_display(),
+        "title": submission.title,
+        "organization": submission.organization,
+        "description": submission.description,
+        "date": submission.date.isoformat() if submission.date else None,
+        "url": submission.url,
+        "status": submission.status,
+    }
+
+
+@require_GET
+def activity_timeline(request):
+    """
+    JSON pages of the logged-in student's timeline, newest first:
+    ?after=<cursor> (or before=<cursor>) &category=...&status=...
+    """
+    student_email = request.session.get("student_email")
+    if not student_email:
+        return JsonResponse({"error": "Unauthorized"}, status=403)
+    category, status = _timeline_filters(request)
+    page = keyset_page(
+        _timeline_queryset(student_email, category, status), 'date',
+        after=request.GET.get("after"), before=request.GET.get("before"), per_page=TIMELINE_PAGE_SIZE,
+    )
+    return JsonResponse({
+        "items": [_timeline_entry(submission) for submission in page],
+        "next_cursor": page.next_cursor,
+        "previous_cursor": page.previous_cursor,
+    })
+
+
 def stu_portfolio(request):
     """
     Handles displaying the student's portfolio page, including all data
@@ -561,66 +327,27 @@ def stu_portfolio(request):
         messages.error(request, "Student not found. Please log in again.")
         return redirect("login_student")
 
-    # 2. FETCH DATA: Get all approved activities for the student
-    approved_certs = Certificate.objects.filter(student_email=student, status="approved")
-    approved_projects = Projects.objects.filter(student_email=student, status="approved")
-    approved_activities = Activities.objects.filter(student_email=student, status="approved")
-
-    # 3. CALCULATE STATS: Compute the numbers for the top cards
-    total_activities_count = (
-        approved_certs.count() +
-        approved_projects.count() +
-        approved_activities.count()
-    )
+    # 2. FETCH DATA: Approved items and the stats derived from them, loaded once
+    stats = portfolio_stats(student)
 
-    total_credits = (
-        approved_certs.aggregate(total=Coalesce(Sum('credit'), 0))['total'] +
-        approved_projects.aggregate(total=Coalesce(Sum('credit'), 0))['total'] +
-        approved_activities.aggregate(total=Coalesce(Sum('credit'), 0))['total']
-    )
-
-    # Calculate the number of categories the student is active in
-    category_count = 0
-    if approved_certs.exists():
-        category_count += 1
-    if approved_projects.exists():
-        category_count += 1
-    if approved_activities.exists():
-        category_count += 1
-
-    # Determine a grade based on a simple credit threshold
-    overall_grade = "N/A"
-    if total_credits >= 150:
-        overall_grade = "A+"
-    elif total_credits >= 120:
-        overall_grade = "A"
-    elif total_credits >= 90:
-        overall_grade = "B+"
-    elif total_credits >= 60:
-        overall_grade = "B"
-    elif total_credits > 0:
-        overall_grade = "C"
-    latest_result = Results.objects.filter(student_email=student).order_by('-semester').first()
-    latest_cgpa = latest_result.cgpa if latest_result else 0.0 
-
-    # 4. PREPARE CONTEXT: Package all data to send to the template
+    # 3. PREPARE CONTEXT: Package all data to send to the template
     context = {
         'student': student,
-        'total_activities': total_activities_count,
-        'total_credits': total_credits,
-        'category_count': category_count,
-        'overall_grade': overall_grade,
+        'total_activities': stats.total_items,
+        'total_credits': stats.total_credits,
+        'category_count': stats.category_count,
+        'overall_grade': stats.grade,
         
         # Counts for the portfolio preview list
-        'cert_count': approved_certs.count(),
-        'proj_count': approved_projects.count(),
-        'other_activities_count': approved_activities.count(),
+        'cert_count': stats.cert_count,
+        'proj_count': stats.proj_count,
+        'other_activities_count': stats.activity_count,
         
         # Detailed lists of approved items for the dynamic CV modal
-        'approved_certificates': approved_certs,
-        'approved_projects': approved_projects,
-        'approved_activities': approved_activities,
-        'latest_cgpa': latest_cgpa,
+        'approved_certificates': stats.certificates,
+        'approved_projects': stats.projects,
+        'approved_activities': stats.activities,
+        'latest_cgpa': stats.latest_cgpa,
     }
     
     return render(request, 'stu-portfolio.html', context)
@@ -637,86 +364,59 @@ def stu_scoreboard(request):
     except Student.DoesNotExist:
         return redirect("login_student")
 
-    # --- 1. Get Approved Items ---
-    approved_certs = Certificate.objects.filter(student_email=student, status="approved")
-    approved_projects = Projects.objects.filter(student_email=student, status="approved")
-    approved_activities = Activities.objects.filter(student_email=student, status="approved")
-    
+    # --- 1. Four most recent approved items per category, from the Submission index in one query ---
+    recent_approved = {category: [] for category, _ in Submission.CATEGORY_CHOICES}
+    for item in Submission.objects.filter(student=student, status="approved").annotate(
+        row=Window(RowNumber(), partition_by=[F('category')],
+                   order_by=[F('date').desc(nulls_last=True), F('pk').desc()])
+    ).filter(row__lte=4).order_by('category', 'row').values('category', 'title', 'credit'):
+        recent_approved[item['category']].append(item)
+
     # --- 2. Calculate Overall Stats & Class Rank ---
-    total_credits = (
-        approved_certs.aggregate(sum=Coalesce(Sum('credit'), 0))['sum'] +
-        approved_projects.aggregate(sum=Coalesce(Sum('credit'), 0))['sum'] +
-        approved_activities.aggregate(sum=Coalesce(Sum('credit'), 0))['sum']
-    )
-    total_activities_count = approved_certs.count() + approved_projects.count() + approved_activities.count()
-
-    # IMPORTANT: Ensure the related_names in your models match the names used here.
-    # For example, in your Certificate model, the ForeignKey to Student should have related_name='certificate'.
-    students_with_credits = Student.objects.annotate(
-        total_credits=Coalesce(Sum('certificates__credit', filter=Q(certificates__status='approved')), 0) +
-                      Coalesce(Sum('projects__credit', filter=Q(projects__status='approved')), 0) +
-                      Coalesce(Sum('activities__credit', filter=Q(activities__status='approved')), 0)
-    ).order_by('-total_credits')
-
-    class_rank = 0
-    # Find the student's rank in the ordered list
-    for i, s in enumerate(students_with_credits):
-        if s.email == student.email:
-            class_rank = i + 1
-            break
-            
-    total_students = Student.objects.count()
-    class_avg_credits = students_with_credits.aggregate(avg=Avg('total_credits'))['avg']
-    if class_avg_credits is None:
-        class_avg_credits = 0.0
-    
-    # --- CORRECTED FORMULA for "Top %" ---
-    # Top % means: what percent of students have less or equal credits than this student
+    summary = get_summary(student, ['credits', 'latest_result', 'attendance'])
+    credits = summary['credits']
+    total_credits = credits['total']['credits']
+    total_activities_count = credits['total']['approved']
+
+    # Rank, class size and class average come back from one window-function query
     # Example: If class_rank=1, student is top 1 out of N, so top 100%. If class_rank=N, student is last, so top 1%.
-    rank_top_percent = ((total_students - class_rank + 1) / total_students) * 100 if total_students > 0 else 0
+    standing = class_standing(student)
+    class_rank = standing['rank']
+    total_students = standing['total_students']
+    class_avg_credits = standing['class_avg_credits']
+    rank_top_percent = standing['rank_top_percent']
 
     # --- 3. Data for the Four Detailed Cards ---
     detail_card_data = {}
-    # (The rest of this section is unchanged)
     detail_card_data['certificates'] = {
-        'count': approved_certs.count(),
-        'credits': approved_certs.aggregate(sum=Coalesce(Sum('credit'), 0))['sum'],
-        'recent_items': approved_certs.order_by('-issue_date')[:4]
+        'count': credits['certificate']['approved'],
+        'credits': credits['certificate']['credits'],
+        'recent_items': recent_approved['certificate']
     }
     detail_card_data['projects'] = {
-        'count': approved_projects.count(),
-        'credits': approved_projects.aggregate(sum=Coalesce(Sum('credit'), 0))['sum'],
-        'recent_items': approved_projects.order_by('-date')[:4]
+        'count': credits['project']['approved'],
+        'credits': credits['project']['credits'],
+        'recent_items': recent_approved['project']
     }
     detail_card_data['activities'] = {
-        'count': approved_activities.count(),
-        'credits': approved_activities.aggregate(sum=Coalesce(Sum('credit'), 0))['sum'],
-        'recent_items': approved_activities.order_by('-date')[:4]
+        'count': credits['activity']['approved'],
+        'credits': credits['activity']['credits'],
+        'recent_items': recent_approved['activity']
     }
     student_results = Results.objects.filter(student_email=student).order_by('-semester')
-    latest_result = student_results.first()
+    latest_result = summary['latest_result']
     detail_card_data['results'] = {
-        'cgpa': latest_result.cgpa if latest_result else 0.0,
-        'sgpa': latest_result.sgpa if latest_result else 0.0,
+        'cgpa': latest_result['cgpa'] if latest_result else 0.0,
+        'sgpa': latest_result['sgpa'] if latest_result else 0.0,
         'recent_items': student_results[:4]
     }
 
-    # --- 4. Calculate Attendance ---
-    all_attendance_records = Attendance.objects.filter(student=student)
-    attended_classes = all_attendance_records.filter(status='Present').count()
-    total_classes = all_attendance_records.count()
-    
-    if total_classes > 0:
-        percentage = round((attended_classes / total_classes) * 100, 1)
-        absent_classes = total_classes - attended_classes
-    else:
-        percentage = 0
-        absent_classes = 0
-
+    # --- 4. Calculate Attendance (monthly rollup) ---
+    attendance = summary['attendance']
     attendance_data = {
-        'percentage': percentage,
-        'attended': attended_classes,
-        'absent': absent_classes
+        'percentage': attendance['percent'],
+        'attended': attendance['attended'],
+        'absent': attendance['absent']
     }
 
     # --- 5. Build Final Context ---
@@ -782,70 +482,36 @@ def faculty_dashboard(request):
 
     faculty_department = faculty.department
 
-    # --- 1. Calculate Stats for the Cards (Now Filtered) ---
-    pending_count = (
-        Certificate.objects.filter(status="pending", student_email__branch=faculty_department).count() + # <-- FILTER ADDED
-        Projects.objects.filter(status="pending", student_email__branch=faculty_department).count() +    # <-- FILTER ADDED
-        Activities.objects.filter(status="pending", student_email__branch=faculty_department).count()  # <-- FILTER ADDED
-    )
-    student_count = Student.objects.filter(branch=faculty_department).count() # <-- FILTER ADDED
-
-    verified_count = (
-        Certificate.objects.filter(status="approved", student_email__branch=faculty_department).count() + # <-- FILTER ADDED
-        Projects.objects.filter(status="approved", student_email__branch=faculty_department).count() +    # <-- FILTER ADDED
-        Activities.objects.filter(status="approved", student_email__branch=faculty_department).count()  # <-- FILTER ADDED
-    )
-
-    # --- 2. Calculate System Alerts (Now Filtered) ---
+    # --- 1. Calculate Stats for the Cards and System Alerts ---
+    # One conditional aggregate over the submission index instead of nine COUNT queries
     two_days_ago = timezone.now().date() - timedelta(days=2)
-    high_priority_alert_count = (
-        Certificate.objects.filter(status="pending", issue_date__lt=two_days_ago, student_email__branch=faculty_department).count() + # <-- FILTER ADDED
-        Projects.objects.filter(status="pending", date__lt=two_days_ago, student_email__branch=faculty_department).count() +    # <-- FILTER ADDED
-        Activities.objects.filter(status="pending", date__lt=two_days_ago, student_email__branch=faculty_department).count()  # <-- FILTER ADDED
+    counts = Submission.objects.filter(branch=faculty_department).aggregate(
+        pending=Count('pk', filter=Q(status="pending")),
+        approved=Count('pk', filter=Q(status="approved")),
+        overdue=Count('pk', filter=Q(status="pending", date__lt=two_days_ago)),
     )
+    pending_count = counts['pending']
+    verified_count = counts['approved']
+    high_priority_alert_count = counts['overdue']
+    student_count = Student.objects.filter(branch=faculty_department).count()
+
+    # --- 2. Fetch Recent Submissions ---
+    latest = Submission.objects.filter(branch=faculty_department).select_related('student').order_by(
+        F('date').desc(nulls_last=True), '-pk'
+    )[:5]
+    recent_submissions = [
+        {
+            'student_name': f"{item.student.first_name} {item.student.last_name or ''}",
+            'student_initials': f"{item.student.first_name[:1]}{(item.student.last_name or '')[:1]}",
+            'title': item.title,
+            'date': item.date,
+            'status': item.status,
+            'type': item.get_category_display(),
+        }
+        for item in latest
+    ]
 
-    # --- 3. Fetch Recent Submissions (Now Filtered) ---
-    all_submissions = []
-    
-    # Get and standardize data only from students in the faculty's department
-    certs = Certificate.objects.filter(student_email__branch=faculty_department).order_by('-issue_date') # <-- FILTER ADDED
-    for cert in certs:
-        all_submissions.append({
-            'student_name': f"{cert.student_email.first_name} {cert.student_email.last_name or ''}",
-            'student_initials': f"{cert.student_email.first_name[0]}{(cert.student_email.last_name[0] if cert.student_email.last_name else '')}",
-            'title': cert.certificate_name,
-            'date': cert.issue_date,
-            'status': cert.status,
-            'type': 'Certificate'
-        })
-    
-    # Do the same for Projects and Activities
-    projects = Projects.objects.filter(student_email__branch=faculty_department).order_by('-date') # <-- FILTER ADDED
-    for proj in projects:
-        all_submissions.append({
-            'student_name': f"{proj.student_email.first_name} {proj.student_email.last_name or ''}",
-            'student_initials': f"{proj.student_email.first_name[0]}{(proj.student_email.last_name[0] if proj.student_email.last_name else '')}",
-            'title': proj.project_name,
-            'date': proj.date,
-            'status': proj.status,
-            'type': 'Project'
-        })
-
-    activities = Activities.objects.filter(student_email__branch=faculty_department).order_by('-date') # <-- FILTER ADDED
-    for act in activities:
-         all_submissions.append({
-            'student_name': f"{act.student_email.first_name} {act.student_email.last_name or ''}",
-            'student_initials': f"{act.student_email.first_name[0]}{(act.student_email.last_name[0] if act.student_email.last_name else '')}",
-            'title': act.activity_name,
-            'date': act.date,
-            'status': act.status,
-            'type': 'Activity'
-        })
-
-    all_submissions.sort(key=lambda x: x['date'], reverse=True)
-    recent_submissions = all_submissions[:5]
-
-    # --- 4. Prepare Context for the Template ---
+    # --- 3. Prepare Context for the Template ---
     context = {
         'faculty': faculty,
         'pending_count': pending_count,
@@ -859,6 +525,9 @@ def faculty_dashboard(request):
 
 
 
+APPROVALS_PER_PAGE = 10
+
+
 def faculty_approvals(request):
     # --- Authentication ---
     faculty_email = request.session.get("faculty_email")
@@ -915,7 +584,9 @@ def faculty_approvals(request):
                 activity.remark = remark
                 messages.success(request, f"Activity '{activity}' has been rejected.")
 
-            activity.save() # Save the changes to the database
+            # Atomic with the credit ledger/index refresh done by the post_save handlers
+            with transaction.atomic():
+                activity.save() # Save the changes to the database
 
         except Model.DoesNotExist:
             messages.error(request, "The activity you tried to update was not found.")
@@ -931,54 +602,34 @@ def faculty_approvals(request):
     faculty_department = faculty.department
     status_filter = request.GET.get('status', 'all')
 
-    # Base querysets filtered by department
-    certs_qs = Certificate.objects.filter(student_email__branch=faculty_department)
-    proj_qs = Projects.objects.filter(student_email__branch=faculty_department)
-    act_qs = Activities.objects.filter(student_email__branch=faculty_department)
+    submissions_qs = Submission.objects.filter(branch=faculty_department)
+
+    # Counts for every filter button in one conditional aggregate
+    status_counts = submissions_qs.aggregate(
+        all=Count('pk'),
+        pending=Count('pk', filter=Q(status='pending')),
+        approved=Count('pk', filter=Q(status='approved')),
+        rejected=Count('pk', filter=Q(status='rejected')),
+    )
 
     # Apply the status filter if one is selected
     if status_filter in ['pending', 'approved', 'rejected']:
-        certs_qs = certs_qs.filter(status=status_filter)
-        proj_qs = proj_qs.filter(status=status_filter)
-        act_qs = act_qs.filter(status=status_filter)
-
-    # Combine the filtered results into a single list
-    combined_list = []
-    
-    for item in certs_qs:
-        combined_list.append({
-            'pk': item.pk, 'model_type': 'certificate', 'title': item.certificate_name, 
-            'student': item.student_email, 'date': item.issue_date, 'credit': item.credit, 
-            'url': item.document.url if item.document else None, 'submission_date': item.submission_date, 
-            'status': item.status, 'remark': item.remark
-        })
-    for item in proj_qs:
-        combined_list.append({
-            'pk': item.pk, 'model_type': 'project', 'title': item.project_name, 
-            'student': item.student_email, 'date': item.date, 'credit': item.credit, 
-            'url': item.project_url, 'submission_date': item.submission_date, 
-            'status': item.status, 'remark': item.remark
-        })
-    for item in act_qs:
-        combined_list.append({
-            'pk': item.pk, 'model_type': 'activity', 'title': item.activity_name,
-            'student': item.student_email, 'date': item.date, 'credit': item.credit,
-            'url': item.project_url, 'submission_date': item.submission_date, 
-            'status': item.status, 'remark': item.remark
-        })
-    
-    # Sort the final list
-    if combined_list:
-        combined_list.sort(key=lambda x: x.get('submission_date') or date.min, reverse=True)
+        submissions_qs = submissions_qs.filter(status=status_filter)
+    else:
+        status_filter = 'all'
 
-    from django.core.paginator import Paginator
-    paginator = Paginator(combined_list, 10)  # Show 10 activities per page
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Keyset pagination on (submission_date, pk): only the requested page is read
+    page_obj = keyset_page(
+        submissions_qs.select_related('student'), 'submission_date',
+        after=request.GET.get('after'), before=request.GET.get('before'), per_page=APPROVALS_PER_PAGE,
+    )
+    # Thumbnail/preview URLs so reviewers do not have to open full-size uploads
+    attach_previews(page_obj)
 
     context = {
         'faculty': faculty,
-        'activity_list': combined_list,
+        'activity_count': status_counts[status_filter],
+        'status_counts': status_counts,
         'active_filter': status_filter,
         'page_obj': page_obj,
     }
@@ -988,6 +639,76 @@ def faculty_approvals(request):
 
 
 
+@require_POST
+def faculty_bulk_moderation(request):
+    """
+    Approve/reject many submissions at once.
+    - JSON body {"items": [{"model_type", "pk", "action", "credit", "remark"}, ...]}
+      or {"approve_all": "<model_type>", "credit": N, "remark": "..."}: returns a JSON summary.
+    - Form post from the approvals page (`selected` = "model_type:pk" values, or
+      `approve_all_type`): redirects back with messages.
+    """
+    faculty = _logged_in_faculty(request)
+    is_json = request.content_type == "application/json"
+    if faculty is None:
+        if is_json:
+            return JsonResponse({"error": "Unauthorized"}, status=403)
+        messages.error(request, "Please log in as a faculty member to view this page.")
+        return redirect("login_student")
+
+    if is_json:
+        try:
+            payload = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({"error": "Invalid JSON body"}, status=400)
+        if not isinstance(payload, dict):
+            return JsonResponse({"error": "Invalid JSON body"}, status=400)
+        if payload.get("approve_all"):
+            try:
+                approved = approve_all_pending(faculty, payload["approve_all"], payload.get("credit", 0),
+                                               payload.get("remark", ""))
+            except ModerationError as e:
+                return JsonResponse({"error": str(e)}, status=400)
+            return JsonResponse({"approved": approved})
+        items = payload.get("items")
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            return JsonResponse({"error": "items must be a list of objects"}, status=400)
+        results = moderate_items(faculty, items)
+        return JsonResponse({
+            "updated": sum(1 for result in results if result["ok"]),
+            "failed": sum(1 for result in results if not result["ok"]),
+            "results": results,
+        })
+
+    current_filter = request.POST.get("status", "all")
+    if request.POST.get("approve_all_type"):
+        try:
+            approved = approve_all_pending(faculty, request.POST["approve_all_type"],
+                                           request.POST.get("credit_points") or 0, request.POST.get("remark", ""))
+            messages.success(request, f"Approved {approved} pending submissions.")
+        except ModerationError as e:
+            messages.error(request, str(e))
+    else:
+        items = []
+        for value in request.POST.getlist("selected"):
+            model_type, _, pk = value.partition(":")
+            items.append({
+                "model_type": model_type, "pk": pk, "action": request.POST.get("bulk_action"),
+                "credit": request.POST.get("credit_points"), "remark": request.POST.get("remark"),
+            })
+        if not items:
+            messages.error(request, "Select at least one submission.")
+        else:
+            results = moderate_items(faculty, items)
+            updated = [result for result in results if result["ok"]]
+            if updated:
+                messages.success(request, f"Updated {len(updated)} submissions.")
+            errors = {result["error"] for result in results if not result["ok"]}
+            for error in errors:
+                messages.error(request, error)
+    return redirect(f"{reverse('faculty_approvals')}?status={current_filter}")
+
+
 def fac_reports(request):
     faculty_email = request.session.get("faculty_email")
     faculty = None
@@ -1004,6 +725,20 @@ def fac_reports(request):
 
 # Faculty: List students by branch (for facu_students.html)
 from django.http import JsonResponse
+from django.core.paginator import Paginator
+
+STUDENTS_PER_PAGE = 25
+
+# ?sort= value -> ORDER BY; a leading "-" flips the direction
+STUDENT_SORTS = {
+    "name": ("first_name", "last_name", "email"),
+    "-name": ("-first_name", "-last_name", "email"),
+    "credits": ("credits", "first_name", "email"),
+    "-credits": ("-credits", "first_name", "email"),
+    "attendance": ("attendance_rate", "first_name", "email"),
+    "-attendance": ("-attendance_rate", "first_name", "email"),
+}
+
 
 def faculty_students(request):
     faculty_email = request.session.get("faculty_email")
@@ -1017,30 +752,50 @@ def faculty_students(request):
         debug_msg = f"Faculty not found for email: {faculty_email}"
         return render(request, "facu_students.html", {"students": [], "debug_msg": debug_msg})
     branch = faculty.department
-    students = Student.objects.filter(branch=branch)
-    student_data = []
-    for student in students:
-        activities_count = Activities.objects.filter(student_email=student, status='approved').count()
-        credits = (
-            Certificate.objects.filter(student_email=student, status='approved').aggregate(sum=Coalesce(Sum('credit'), 0))["sum"] +
-            Projects.objects.filter(student_email=student, status='approved').aggregate(sum=Coalesce(Sum('credit'), 0))["sum"] +
-            Activities.objects.filter(student_email=student, status='approved').aggregate(sum=Coalesce(Sum('credit'), 0))["sum"]
+    search = request.GET.get("q", "").strip()
+    sort = request.GET.get("sort", "name")
+    if sort not in STUDENT_SORTS:
+        sort = "name"
+
+    # Credits and approved activity counts come from ledger subqueries so the
+    # database can sort on them; nothing is evaluated per student.
+    students = Student.objects.filter(branch=branch).annotate(
+        credits=credits_subquery(),
+        activities_count=Coalesce(Subquery(
+            CreditLedger.objects.filter(student=OuterRef('pk'), category='activity').values('approved_count')[:1]
+        ), 0),
+    )
+    if search:
+        students = students.filter(
+            Q(first_name__icontains=search) | Q(last_name__icontains=search) | Q(email__icontains=search)
         )
-        attended_classes = Attendance.objects.filter(student=student, status='Present').count()
-        total_classes = Attendance.objects.filter(student=student).count()
-        attendance_percent = round((attended_classes / total_classes) * 100, 1) if total_classes else 0
+    if sort.lstrip("-") == "attendance":
+        students = students.annotate(attendance_rate=attendance_rate_subquery())
+    students = students.order_by(*STUDENT_SORTS[sort])
+
+    paginator = Paginator(students, STUDENTS_PER_PAGE)
+    page_obj = paginator.get_page(request.GET.get("page"))
+    page_students = list(page_obj)
+
+    # One GROUP BY student aggregate over the attendance rollup for the students on this page
+    attendance = attendance_totals_for([st.email for st in page_students])
+    student_data = []
+    for student in page_students:
         student_data.append({
             "student": student,
-            "activities_count": activities_count,
-            "credits": credits,
-            "attendance_percent": attendance_percent,
+            "activities_count": student.activities_count,
+            "credits": student.credits,
+            "attendance_percent": attendance.get(student.email, {}).get('percent', 0),
         })
-    if not students.exists():
-        debug_msg = f"No students found for branch: {branch}"
+    if paginator.count == 0:
+        debug_msg = f"No students found for branch: {branch}" + (f" matching '{search}'" if search else "")
     context = {
         "students": student_data,
         "faculty": faculty,
         "debug_msg": debug_msg,
+        "page_obj": page_obj,
+        "sort": sort,
+        "search": search,
     }
     return render(request, "facu_students.html", context)
 
@@ -1049,42 +804,43 @@ def get_student_profile(request):
     email = request.GET.get("email")
     if not email:
         return JsonResponse({"error": "No email provided"}, status=400)
-    try:
-        student = Student.objects.get(email=email)
-    except Student.DoesNotExist:
+    profile = build_profiles([email]).get(email)
+    if profile is None:
         return JsonResponse({"error": "Student not found"}, status=404)
-    # Example: Attendance, activities, certificates, projects, results
-    attended_classes = Attendance.objects.filter(student=student, status='Present').count()
-    total_classes = Attendance.objects.filter(student=student).count()
-    attendance_percent = round((attended_classes / total_classes) * 100, 1) if total_classes else 0
-    activities = list(Activities.objects.filter(student_email=student).values('activity_name', 'activity_type', 'date'))
-    certificates = list(Certificate.objects.filter(student_email=student, status='approved').values('certificate_name', 'organization', 'issue_date'))
-    projects = list(Projects.objects.filter(student_email=student, status='approved').values('project_name', 'subject', 'date'))
-    latest_result = Results.objects.filter(student_email=student).order_by('-semester').first()
-    cgpa = latest_result.cgpa if latest_result else 0.0
-    # Social links
-    linkedin = student.linkedin_url or ""
-    github = student.github_url or ""
-    # Compose response
-    data = {
-        "name": f"{student.first_name} {student.last_name or ''}",
-        "initials": f"{student.first_name[0]}{(student.last_name[0] if student.last_name else '')}",
-        "department": student.branch,
-        "email": student.email,
-        "contact": student.contact,
-        "cgpa": cgpa,
-        "attendance": attendance_percent,
-        "attended_classes": attended_classes,
-        "total_classes": total_classes,
-        "activities": activities,
-        "certificates": certificates,
-        "projects": projects,
-        "linkedin": linkedin,
-        "github": github,
-        "college": student.College_name,
-        "session": student.session,
+    return JsonResponse(profile)
+
+
+@require_GET
+def student_profiles(request):
+    """
+    Batch profile API for the faculty student list:
+    ?email=a@x&email=b@x (or emails=a@x,b@x) &fields=profile,cgpa,...
+    Only students of the faculty's department are returned. Responses carry
+    an ETag of their content, so reopening an unchanged profile is answered
+    with 304.
+    """
+    faculty = _logged_in_faculty(request)
+    if faculty is None:
+        return JsonResponse({"error": "Unauthorized"}, status=403)
+    try:
+        emails = parse_emails(request.GET.getlist("email") + request.GET.getlist("emails"))
+        fields = parse_fields(request.GET.get("fields", ""))
+    except ProfileRequestError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    profiles = build_profiles(emails, fields, branch=faculty.department)
+    payload = {
+        "fields": list(fields),
+        "profiles": profiles,
+        "missing": [email for email in emails if email not in profiles],
     }
-    return JsonResponse(data)
+    etag = profile_etag(payload, scope=faculty.department)
+    response = get_conditional_response(request, etag=etag) or JsonResponse(payload)
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 def student_results(request):
     student_email = request.session.get("student_email")
     if not student_email:
@@ -1270,67 +1026,18 @@ def stu_dashboard(request):
         # Log out or handle the case where the student profile is not found
         return redirect("login_student")
 
-    # --- 2. Query all items for the student ---
-    # --- 2. Query all items for the student (all statuses) ---
-    certificates = Certificate.objects.filter(student_email=student)
-    projects = Projects.objects.filter(student_email=student)
-    activities = Activities.objects.filter(student_email=student)
-
-    # --- 3. Calculate Overall Stats ---
-    total_credits = (
-        certificates.filter(status="approved").aggregate(sum=Coalesce(Sum('credit'), 0))["sum"] +
-        projects.filter(status="approved").aggregate(sum=Coalesce(Sum('credit'), 0))["sum"] +
-        activities.filter(status="approved").aggregate(sum=Coalesce(Sum('credit'), 0))["sum"]
-    )
-    completed_activities = certificates.filter(status="approved").count() + projects.filter(status="approved").count() + activities.filter(status="approved").count()
-    pending_activities = (
-        certificates.filter(status="pending").count() +
-        projects.filter(status="pending").count() +
-        activities.filter(status="pending").count()
-    )
-    certificates_earned = certificates.filter(status="approved").count()
-
-    # --- 4. Get Recent Activities (all statuses) ---
-    recent_items = []
-    for cert in certificates.order_by('-issue_date')[:5]:
-        recent_items.append({
-            'title': cert.certificate_name,
-            'status': cert.status,
-            'credit': cert.credit
-        })
-    for proj in projects.order_by('-date')[:5]:
-        recent_items.append({
-            'title': proj.project_name,
-            'status': proj.status,
-            'credit': proj.credit
-        })
-    for act in activities.order_by('-date')[:5]:
-        recent_items.append({
-            'title': act.activity_name,
-            'status': act.status,
-            'credit': act.credit
-        })
-    # Sort by date/issue_date
-    def get_activity_date(x):
-        obj = None
-        # Find the object in certificates, projects, or activities
-        cert_obj = certificates.filter(certificate_name=x['title']).first()
-        if cert_obj:
-            obj = cert_obj
-            return getattr(obj, 'issue_date', None)
-        proj_obj = projects.filter(project_name=x['title']).first()
-        if proj_obj:
-            obj = proj_obj
-            return getattr(obj, 'date', None)
-        act_obj = activities.filter(activity_name=x['title']).first()
-        if act_obj:
-            obj = act_obj
-            return getattr(obj, 'date', None)
-        return None
-    recent_items.sort(key=get_activity_date, reverse=True)
-    recent_items = recent_items[:3]
+    # --- 2. Calculate Overall Stats (read from the credit ledger through the summary cache) ---
+    credits = get_summary(student, ['credits'])['credits']
+    total_credits = credits['total']['credits']
+    completed_activities = credits['total']['approved']
+    pending_activities = credits['total']['pending']
+    certificates_earned = credits['certificate']['approved']
+
+    # --- 3. Get Recent Activities (all statuses) ---
+    # One query on the submission index, newest first by the item's own date
+    recent_items = Submission.objects.filter(student=student).order_by(F('date').desc(nulls_last=True), '-pk')[:3]
 
-    # --- 5. Build the context dictionary ---
+    # --- 4. Build the context dictionary ---
     context = {
         'student': student,
         'total_credits': total_credits,
@@ -1396,3 +1103,259 @@ def stu_dashboard(request):
 #         'recent_activities': recent_activities, # Pass the sorted model objects directly
 #     }
 #     return render(request, 'stu-dashboard.html', context)
+
+
+# --- Background report jobs (rendered by `manage.py run_report_worker`) ---
+from .jobs import enqueue_report, ReportJobLimitExceeded
+from .models import ReportJob
+
+
+def _report_job_payload(job):
+    data = {
+        "job_id": job.pk,
+        "kind": job.kind,
+        "status": job.status,
+        "status_url": reverse("report_job_status", args=[job.pk]),
+    }
+    if job.status == "done":
+        data["download_url"] = reverse("download_report_job", args=[job.pk])
+    elif job.status == "failed":
+        data["error"] = job.error
+    return data
+
+
+@require_POST
+def enqueue_report_job(request):
+    student_email = request.session.get("student_email")
+    faculty_email = request.session.get("faculty_email")
+    requester = faculty_email or student_email
+    if not requester:
+        return JsonResponse({"error": "Please log in first."}, status=403)
+
+    kind = request.POST.get("kind")
+    student = None
+    params = {}
+    if kind == "cv":
+        if not student_email:
+            return JsonResponse({"error": "Only students can download their CV."}, status=403)
+        student = student_email
+    elif kind == "profile":
+        # Faculty can download any student's profile, students only their own
+        student = request.POST.get("email") if faculty_email else student_email
+        if not student:
+            return JsonResponse({"error": "No email provided"}, status=400)
+    elif kind == "naac":
+        if not faculty_email:
+            return JsonResponse({"error": "Unauthorized"}, status=403)
+        try:
+            date_from = parse_date(request.POST.get("from") or "")
+            date_to = parse_date(request.POST.get("to") or "")
+        except ValueError:
+            return JsonResponse({"error": "Invalid date filter"}, status=400)
+        params = {
+            "branch": request.POST.get("branch") or None,
+            "session": request.POST.get("session") or None,
+            "date_from": date_from.isoformat() if date_from else None,
+            "date_to": date_to.isoformat() if date_to else None,
+        }
+    else:
+        return JsonResponse({"error": "Unknown report type"}, status=400)
+
+    if student and not Student.objects.filter(email=student).exists():
+        return JsonResponse({"error": "Student not found"}, status=404)
+
+    try:
+        job, created = enqueue_report(kind, requester, student=student, params=params)
+    except ReportJobLimitExceeded as e:
+        return JsonResponse({"error": str(e)}, status=429)
+    return JsonResponse(_report_job_payload(job), status=202 if created else 200)
+
+
+def _get_own_report_job(request, job_id):
+    requester = request.session.get("faculty_email") or request.session.get("student_email")
+    if not requester:
+        return None
+    return ReportJob.objects.filter(pk=job_id, requested_by=requester).first()
+
+
+@require_GET
+def report_job_status(request, job_id):
+    job = _get_own_report_job(request, job_id)
+    if job is None:
+        return JsonResponse({"error": "Report not found"}, status=404)
+    return JsonResponse(_report_job_payload(job))
+
+
+@require_GET
+def download_report_job(request, job_id):
+    job = _get_own_report_job(request, job_id)
+    if job is None or job.status != "done" or not job.file:
+        return HttpResponse("Report not available", status=404)
+    if job.kind == "profile":
+        filename = profile_report_filename(job.student)
+    elif job.kind == "cv":
+        filename = "cv_portfolio.pdf"
+    else:
+        filename = "naac_report.pdf"
+    return FileResponse(job.file.open("rb"), as_attachment=True, filename=filename)
+
+
+def pdf_cache_stats(request):
+    """Hit/miss counters and disk usage of the generated-PDF cache (faculty only)."""
+    if not request.session.get("faculty_email"):
+        return JsonResponse({"error": "Unauthorized"}, status=403)
+    return JsonResponse(pdf_cache.stats())
+
+
+# --- Bulk attendance marking (faculty) ---
+from .attendance_marking import mark_session, import_csv, AttendanceImportError
+
+# Row-level errors shown back to the faculty after a failed import
+MAX_REPORTED_ERRORS = 20
+
+
+def _logged_in_faculty(request):
+    faculty_email = request.session.get("faculty_email")
+    if not faculty_email:
+        return None
+    return Faculty.objects.filter(email=faculty_email).first()
+
+
+def _parse_session(subjects, subject_id, day):
+    """
+    Resolve the subject pk and YYYY-MM-DD date of a marking request against
+    the faculty's `subjects`. Returns (subject, date, error message).
+    """
+    if isinstance(subject_id, bool) or not isinstance(subject_id, (int, str)) or not str(subject_id).strip().isdigit():
+        return None, None, "subject must be the numeric id of one of your subjects."
+    if not isinstance(day, str):
+        return None, None, "date must be a YYYY-MM-DD string."
+    try:
+        parsed = parse_date(day)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        return None, None, "date must be a valid YYYY-MM-DD date."
+    subject = subjects.filter(pk=int(subject_id)).first()
+    if subject is None:
+        return None, None, "subject is not one of your subjects."
+    return subject, parsed, None
+
+
+def mark_attendance(request):
+    """
+    Faculty page for marking a whole class session at once, plus a CSV upload
+    for back-filling a semester.
+    """
+    faculty = _logged_in_faculty(request)
+    if faculty is None:
+        messages.error(request, "Please log in as a faculty member.")
+        return redirect("login_faculty")
+
+    subjects = Subject.objects.filter(faculty=faculty).order_by('subject_name')
+
+    if request.method == "POST":
+        try:
+            if request.FILES.get("csv_file"):
+                upload = request.FILES["csv_file"]
+                written = import_csv(faculty, io.TextIOWrapper(upload.file, encoding="utf-8-sig"))
+                messages.success(request, f"Imported {written} attendance records.")
+            else:
+                subject, day, error = _parse_session(subjects, request.POST.get("subject"), request.POST.get("date"))
+                if error:
+                    messages.error(request, "Please choose one of your subjects and a valid date.")
+                    return redirect("mark_attendance")
+                present = set(request.POST.getlist("present"))
+                statuses = {
+                    email: "Present" if email in present else "Absent"
+                    for email in request.POST.getlist("students")
+                }
+                written = mark_session(faculty, subject, day, statuses)
+                messages.success(request, f"Attendance saved for {written} students.")
+                return redirect(f"{reverse('mark_attendance')}?subject={subject.pk}&date={day.isoformat()}")
+        except AttendanceImportError as e:
+            for error in e.errors[:MAX_REPORTED_ERRORS]:
+                messages.error(request, error)
+            if len(e.errors) > MAX_REPORTED_ERRORS:
+                messages.error(request, f"... and {len(e.errors) - MAX_REPORTED_ERRORS} more problems. Nothing was saved.")
+        except (ValueError, UnicodeDecodeError) as e:
+            messages.error(request, f"Could not read the file: {e}")
+        return redirect("mark_attendance")
+
+    subject_id = request.GET.get("subject")
+    if subject_id and not subject_id.isdigit():
+        return HttpResponse("Invalid subject", status=400)
+    selected_subject = subjects.filter(pk=subject_id).first() if subject_id else subjects.first()
+    try:
+        selected_date = parse_date(request.GET.get("date") or "") or date.today()
+    except ValueError:
+        selected_date = date.today()
+
+    roster = list(Student.objects.filter(branch=faculty.department).order_by('roll_no', 'first_name').only(
+        'email', 'first_name', 'last_name', 'roll_no'
+    ))
+    # Existing marks for this session in one query (absent from the dict = not marked yet)
+    marked = {}
+    if selected_subject:
+        marked = dict(Attendance.objects.filter(subject=selected_subject, date=selected_date).values_list('student', 'status'))
+    for student in roster:
+        student.current_status = marked.get(student.email)
+
+    context = {
+        "faculty": faculty,
+        "subjects": subjects,
+        "selected_subject": selected_subject,
+        "selected_date": selected_date,
+        "roster": roster,
+        "marked_count": len(marked),
+    }
+    return render(request, "mark_attendance.html", context)
+
+
+@require_POST
+def bulk_mark_attendance(request):
+    """
+    JSON API: {"subject": <id>, "date": "YYYY-MM-DD", "records": {"<email>": "Present"|"Absent", ...}}
+    """
+    faculty = _logged_in_faculty(request)
+    if faculty is None:
+        return JsonResponse({"error": "Unauthorized"}, status=403)
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({"error": "Invalid JSON body"}, status=400)
+    if not isinstance(payload, dict):
+        return JsonResponse({"error": "Invalid JSON body"}, status=400)
+    subject, day, error = _parse_session(
+        Subject.objects.filter(faculty=faculty), payload.get("subject"), payload.get("date")
+    )
+    if error:
+        return JsonResponse({"error": error}, status=400)
+    records = payload.get("records")
+    if not isinstance(records, dict):
+        return JsonResponse({"error": "records must be an object of email: status"}, status=400)
+    try:
+        written = mark_session(faculty, subject, day, records)
+    except AttendanceImportError as e:
+        return JsonResponse({"error": str(e), "details": e.errors[:MAX_REPORTED_ERRORS]}, status=400)
+    return JsonResponse({"written": written})
+
+
+# --- Request metrics (student/instrumentation.py) ---
+from .instrumentation import registry as request_metrics_registry
+
+
+def request_metrics(request):
+    """
+    Per-view query counts, DB/template time and latency histograms for this
+    process, plus inclusive render time per template. Faculty or staff only;
+    POST clears the counters.
+    """
+    if not (request.session.get("faculty_email") or request.user.is_staff):
+        return JsonResponse({"error": "Unauthorized"}, status=403)
+    if request.method == "POST":
+        request_metrics_registry.reset()
+    return JsonResponse({
+        "views": request_metrics_registry.snapshot(),
+        "templates": request_metrics_registry.template_snapshot(),
+    })